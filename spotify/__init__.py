@@ -127,10 +127,12 @@ ffi, lib = _build_ffi()
 from spotify.album import *  # noqa
 from spotify.artist import *  # noqa
 from spotify.audio import *  # noqa
+from spotify.browse_cache import *  # noqa
 from spotify.config import *  # noqa
 from spotify.connection import *  # noqa
 from spotify.error import *  # noqa
 from spotify.eventloop import *  # noqa
+from spotify.export import *  # noqa
 from spotify.image import *  # noqa
 from spotify.inbox import *  # noqa
 from spotify.link import *  # noqa
@@ -138,9 +140,12 @@ from spotify.offline import *  # noqa
 from spotify.player import *  # noqa
 from spotify.playlist import *  # noqa
 from spotify.playlist_container import *  # noqa
+from spotify.playlist_mirror import *  # noqa
+from spotify.playlist_ram_manager import *  # noqa
 from spotify.playlist_track import *  # noqa
 from spotify.playlist_unseen_tracks import *  # noqa
 from spotify.search import *  # noqa
+from spotify.search_cache import *  # noqa
 from spotify.session import *  # noqa
 from spotify.sink import *  # noqa
 from spotify.social import *  # noqa
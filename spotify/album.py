@@ -30,6 +30,28 @@ class Album(object):
         u'Forward / Return'
     """
 
+    __slots__ = ('_session', '_sp_album', '_memo', '__weakref__')
+
+    @classmethod
+    @serialized
+    def _cached(cls, session, sp_album, add_ref=True):
+        """
+        Get :class:`Album` instance for the given ``sp_album``. If it already
+        exists, it is retrieved from cache.
+
+        Internal method.
+        """
+        album = session._cache.get(sp_album)
+        if isinstance(album, Album):
+            if not add_ref:
+                # We were given a reference we don't need, as the cached
+                # instance already holds one.
+                lib.sp_album_release(sp_album)
+            return album
+        album = Album(session, sp_album=sp_album, add_ref=add_ref)
+        session._cache[sp_album] = album
+        return album
+
     def __init__(self, session, uri=None, sp_album=None, add_ref=True):
         assert uri or sp_album, 'uri or sp_album is required'
 
@@ -41,11 +63,13 @@ class Album(object):
                 raise ValueError(
                     'Failed to get album from Spotify URI: %r' % uri)
             sp_album = album._sp_album
+            session._cache[sp_album] = self
             add_ref = True
 
         if add_ref:
             lib.sp_album_add_ref(sp_album)
         self._sp_album = ffi.gc(sp_album, lib.sp_album_release)
+        self._memo = None
 
     def __repr__(self):
         return 'Album(%r)' % self.link.uri
@@ -88,6 +112,7 @@ class Album(object):
         return bool(lib.sp_album_is_available(self._sp_album))
 
     @property
+    @utils.memoize_loaded
     @serialized
     def artist(self):
         """The artist of the album.
@@ -97,7 +122,8 @@ class Album(object):
         sp_artist = lib.sp_album_artist(self._sp_album)
         if sp_artist == ffi.NULL:
             return None
-        return spotify.Artist(self._session, sp_artist=sp_artist, add_ref=True)
+        return spotify.Artist._cached(
+            self._session, sp_artist=sp_artist, add_ref=True)
 
     @serialized
     def cover(self, image_size=None, callback=None):
@@ -136,19 +162,23 @@ class Album(object):
             image_size = spotify.ImageSize.NORMAL
         sp_link = lib.sp_link_create_from_album_cover(
             self._sp_album, int(image_size))
-        return spotify.Link(self._session, sp_link=sp_link, add_ref=False)
+        return spotify.Link._cached(
+            self._session, sp_link=sp_link, add_ref=False)
 
     @property
+    @utils.memoize_loaded
     @serialized
     def name(self):
         """The album's name.
 
         Will always return :class:`None` if the album isn't loaded.
         """
-        name = utils.to_unicode(lib.sp_album_name(self._sp_album))
+        name = utils.to_unicode_interned(
+            self._session, lib.sp_album_name(self._sp_album))
         return name if name else None
 
     @property
+    @utils.memoize_loaded
     def year(self):
         """The album's release year.
 
@@ -159,6 +189,7 @@ class Album(object):
         return lib.sp_album_year(self._sp_album)
 
     @property
+    @utils.memoize_loaded
     def type(self):
         """The album's :class:`AlbumType`.
 
@@ -172,7 +203,8 @@ class Album(object):
     def link(self):
         """A :class:`Link` to the album."""
         sp_link = lib.sp_link_create_from_album(self._sp_album)
-        return spotify.Link(self._session, sp_link=sp_link, add_ref=False)
+        return spotify.Link._cached(
+            self._session, sp_link=sp_link, add_ref=False)
 
     def browse(self, callback=None):
         """Get an :class:`AlbumBrowser` for the album.
@@ -182,7 +214,13 @@ class Album(object):
         the browser is done loading.
 
         Can be created without the album being loaded.
+
+        If :attr:`Session.browse_cache` is set, the browser is looked up in
+        the cache first.
         """
+        if self._session.browse_cache is not None:
+            return self._session.browse_cache.browse_album(
+                self, callback=callback)
         return spotify.AlbumBrowser(
             self._session, album=self, callback=callback)
 
@@ -203,6 +241,9 @@ class AlbumBrowser(object):
         7
     """
 
+    __slots__ = (
+        '_session', '_sp_albumbrowse', '_loaded_event', '__weakref__')
+
     def __init__(
             self, session, album=None, callback=None,
             sp_albumbrowse=None, add_ref=True):
@@ -210,7 +251,7 @@ class AlbumBrowser(object):
         assert album or sp_albumbrowse, 'album or sp_albumbrowse is required'
 
         self._session = session
-        self.loaded_event = threading.Event()
+        self._loaded_event = threading.Event()
 
         if sp_albumbrowse is None:
             handle = ffi.new_handle((self._session, self, callback))
@@ -244,9 +285,11 @@ class AlbumBrowser(object):
     def __hash__(self):
         return hash(self._sp_albumbrowse)
 
-    loaded_event = None
-    """:class:`threading.Event` that is set when the album browser is loaded.
-    """
+    @property
+    def loaded_event(self):
+        """:class:`threading.Event` that is set when the album browser is
+        loaded."""
+        return self._loaded_event
 
     @property
     def is_loaded(self):
@@ -295,7 +338,7 @@ class AlbumBrowser(object):
         sp_album = lib.sp_albumbrowse_album(self._sp_albumbrowse)
         if sp_album == ffi.NULL:
             return None
-        return Album(self._session, sp_album=sp_album, add_ref=True)
+        return Album._cached(self._session, sp_album=sp_album, add_ref=True)
 
     @property
     @serialized
@@ -307,7 +350,8 @@ class AlbumBrowser(object):
         sp_artist = lib.sp_albumbrowse_artist(self._sp_albumbrowse)
         if sp_artist == ffi.NULL:
             return None
-        return spotify.Artist(self._session, sp_artist=sp_artist, add_ref=True)
+        return spotify.Artist._cached(
+            self._session, sp_artist=sp_artist, add_ref=True)
 
     @property
     @serialized
@@ -343,7 +387,7 @@ class AlbumBrowser(object):
 
         @serialized
         def get_track(sp_albumbrowse, key):
-            return spotify.Track(
+            return spotify.Track._cached(
                 self._session,
                 sp_track=lib.sp_albumbrowse_track(sp_albumbrowse, key),
                 add_ref=True)
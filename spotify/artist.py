@@ -31,6 +31,28 @@ class Artist(object):
         u'Rob Dougan'
     """
 
+    __slots__ = ('_session', '_sp_artist', '__weakref__')
+
+    @classmethod
+    @serialized
+    def _cached(cls, session, sp_artist, add_ref=True):
+        """
+        Get :class:`Artist` instance for the given ``sp_artist``. If it already
+        exists, it is retrieved from cache.
+
+        Internal method.
+        """
+        artist = session._cache.get(sp_artist)
+        if isinstance(artist, Artist):
+            if not add_ref:
+                # We were given a reference we don't need, as the cached
+                # instance already holds one.
+                lib.sp_artist_release(sp_artist)
+            return artist
+        artist = Artist(session, sp_artist=sp_artist, add_ref=add_ref)
+        session._cache[sp_artist] = artist
+        return artist
+
     def __init__(self, session, uri=None, sp_artist=None, add_ref=True):
         assert uri or sp_artist, 'uri or sp_artist is required'
 
@@ -42,6 +64,7 @@ class Artist(object):
                 raise ValueError(
                     'Failed to get artist from Spotify URI: %r' % uri)
             sp_artist = artist._sp_artist
+            session._cache[sp_artist] = self
 
         if add_ref:
             lib.sp_artist_add_ref(sp_artist)
@@ -69,7 +92,8 @@ class Artist(object):
 
         Will always return :class:`None` if the artist isn't loaded.
         """
-        name = utils.to_unicode(lib.sp_artist_name(self._sp_artist))
+        name = utils.to_unicode_interned(
+            self._session, lib.sp_artist_name(self._sp_artist))
         return name if name else None
 
     @property
@@ -125,13 +149,15 @@ class Artist(object):
             image_size = spotify.ImageSize.NORMAL
         sp_link = lib.sp_link_create_from_artist_portrait(
             self._sp_artist, int(image_size))
-        return spotify.Link(self._session, sp_link=sp_link, add_ref=False)
+        return spotify.Link._cached(
+            self._session, sp_link=sp_link, add_ref=False)
 
     @property
     def link(self):
         """A :class:`Link` to the artist."""
         sp_link = lib.sp_link_create_from_artist(self._sp_artist)
-        return spotify.Link(self._session, sp_link=sp_link, add_ref=False)
+        return spotify.Link._cached(
+            self._session, sp_link=sp_link, add_ref=False)
 
     def browse(self, type=None, callback=None):
         """Get an :class:`ArtistBrowser` for the artist.
@@ -144,7 +170,13 @@ class Artist(object):
         when the browser is done loading.
 
         Can be created without the artist being loaded.
+
+        If :attr:`Session.browse_cache` is set, the browser is looked up in
+        the cache first.
         """
+        if self._session.browse_cache is not None:
+            return self._session.browse_cache.browse_artist(
+                self, type=type, callback=callback)
         return spotify.ArtistBrowser(
             self._session, artist=self, type=type, callback=callback)
 
@@ -166,6 +198,9 @@ class ArtistBrowser(object):
         7
     """
 
+    __slots__ = (
+        '_session', '_sp_artistbrowse', '_loaded_event', '__weakref__')
+
     def __init__(
             self, session, artist=None, type=None, callback=None,
             sp_artistbrowse=None, add_ref=True):
@@ -174,7 +209,7 @@ class ArtistBrowser(object):
             'artist or sp_artistbrowse is required')
 
         self._session = session
-        self.loaded_event = threading.Event()
+        self._loaded_event = threading.Event()
 
         if sp_artistbrowse is None:
             if type is None:
@@ -193,9 +228,11 @@ class ArtistBrowser(object):
         self._sp_artistbrowse = ffi.gc(
             sp_artistbrowse, lib.sp_artistbrowse_release)
 
-    loaded_event = None
-    """:class:`threading.Event` that is set when the artist browser is loaded.
-    """
+    @property
+    def loaded_event(self):
+        """:class:`threading.Event` that is set when the artist browser is
+        loaded."""
+        return self._loaded_event
 
     def __repr__(self):
         if self.is_loaded:
@@ -262,7 +299,7 @@ class ArtistBrowser(object):
         sp_artist = lib.sp_artistbrowse_artist(self._sp_artistbrowse)
         if sp_artist == ffi.NULL:
             return None
-        return Artist(self._session, sp_artist=sp_artist, add_ref=True)
+        return Artist._cached(self._session, sp_artist=sp_artist, add_ref=True)
 
     @serialized
     def portraits(self, callback=None):
@@ -312,7 +349,7 @@ class ArtistBrowser(object):
 
         @serialized
         def get_track(sp_artistbrowse, key):
-            return spotify.Track(
+            return spotify.Track._cached(
                 self._session,
                 sp_track=lib.sp_artistbrowse_track(sp_artistbrowse, key),
                 add_ref=True)
@@ -336,7 +373,7 @@ class ArtistBrowser(object):
 
         @serialized
         def get_track(sp_artistbrowse, key):
-            return spotify.Track(
+            return spotify.Track._cached(
                 self._session,
                 sp_track=lib.sp_artistbrowse_tophit_track(
                     sp_artistbrowse, key),
@@ -364,7 +401,7 @@ class ArtistBrowser(object):
 
         @serialized
         def get_album(sp_artistbrowse, key):
-            return spotify.Album(
+            return spotify.Album._cached(
                 self._session,
                 sp_album=lib.sp_artistbrowse_album(sp_artistbrowse, key),
                 add_ref=True)
@@ -388,7 +425,7 @@ class ArtistBrowser(object):
 
         @serialized
         def get_artist(sp_artistbrowse, key):
-            return spotify.Artist(
+            return spotify.Artist._cached(
                 self._session,
                 sp_artist=lib.sp_artistbrowse_similar_artist(
                     sp_artistbrowse, key),
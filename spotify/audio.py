@@ -39,6 +39,8 @@ class AudioFormat(object):
     :attr:`~spotify.SessionCallbacks.music_delivery` callback.
     """
 
+    __slots__ = ('_sp_audioformat',)
+
     def __init__(self, sp_audioformat):
         self._sp_audioformat = sp_audioformat
 
@@ -0,0 +1,97 @@
+from __future__ import unicode_literals
+
+import functools
+
+import spotify
+from spotify import serialized, utils
+
+
+__all__ = [
+    'BrowseCache',
+]
+
+
+class BrowseCache(utils.RequestCache):
+
+    """Keeps recently used album and artist browsers, so that browsing the
+    same album or artist again doesn't make a new request to Spotify.
+
+    To cache all browsers made with :meth:`Album.browse` and
+    :meth:`Artist.browse`, set :attr:`Session.browse_cache` to a cache::
+
+        >>> session.browse_cache = spotify.BrowseCache(
+        ...     session, max_size=500, max_age=3600)
+        >>> artist = session.get_artist(
+        ...     'spotify:artist:421vyBBkhgRAOz4cYPvrZJ')
+        >>> browser = artist.browse().load()
+        >>> artist.browse() is browser
+        True
+
+    Album browsers are keyed by the album, and artist browsers by the artist
+    and the :class:`ArtistBrowserType`. At most ``max_size`` browsers are
+    kept, and when the cache is full the least recently used browser is
+    evicted. A browser is kept for at most ``max_age`` seconds after it was
+    created, or until it is evicted if ``max_age`` is :class:`None`. Browsers
+    that fail are not kept once they complete.
+
+    If an identical browser is still loading, the same browser is returned
+    instead of making another request, and the ``callback`` is called when
+    the shared browser completes. If the browser has already completed, the
+    ``callback`` is called right away.
+
+    ``hits`` is the number of browsers answered with a completed browser,
+    ``coalesced`` the number of browsers that joined a browser in progress,
+    and ``misses`` the number of browsers that had to be requested from
+    Spotify. ``backend_time_saved`` is the sum of the
+    :attr:`~ArtistBrowser.backend_request_duration` of the requests avoided
+    by hits and coalesced browsers, in ms.
+    """
+
+    def __init__(self, session, max_size=1000, max_age=3600):
+        super(BrowseCache, self).__init__(max_size=max_size, max_age=max_age)
+        self._session = session
+        self.backend_time_saved = 0
+
+    def browse_album(self, album, callback=None):
+        """Get the :class:`AlbumBrowser` for the :class:`Album` from the
+        cache, or create a new browser if it isn't cached."""
+        # The album is kept alive with the browser, so that its pointer isn't
+        # reused for another album.
+        return self.get(
+            ('album', album._sp_album),
+            functools.partial(
+                spotify.AlbumBrowser, self._session, album=album),
+            callback=callback, keep_alive=album)
+
+    def browse_artist(self, artist, type=None, callback=None):
+        """Get the :class:`ArtistBrowser` of the given ``type`` for the
+        :class:`Artist` from the cache, or create a new browser if it isn't
+        cached.
+
+        If ``type`` is :class:`None`, it defaults to
+        :attr:`ArtistBrowserType.FULL`.
+        """
+        if type is None:
+            type = spotify.ArtistBrowserType.FULL
+        return self.get(
+            ('artist', artist._sp_artist, type),
+            functools.partial(
+                spotify.ArtistBrowser, self._session, artist=artist,
+                type=type),
+            callback=callback, keep_alive=artist)
+
+    @serialized
+    def clear(self):
+        """Remove all browsers from the cache, and reset all counters to
+        zero.
+
+        Callbacks waiting for browsers in progress are still called when the
+        browsers complete.
+        """
+        super(BrowseCache, self).clear()
+        self.backend_time_saved = 0
+
+    def _requests_saved(self, browser, num_requests):
+        duration = browser.backend_request_duration
+        if duration is not None and duration > 0:
+            self.backend_time_saved += duration * num_requests
@@ -173,7 +173,9 @@ class Config(object):
 
         Defaults to :class:`False`.
 
-        See :meth:`Playlist.in_ram` for more details.
+        See :meth:`Playlist.in_ram` for more details, and
+        :class:`PlaylistRamManager` for a way to decide which playlists to
+        keep in RAM.
         """
         return bool(self._sp_session_config.initially_unload_playlists)
 
@@ -25,10 +25,11 @@ class Error(Exception):
 
         Internal method.
         """
-        ignores = set(ignores or [])
-        ignores.add(ErrorType.OK)
-        if error_type not in ignores:
-            raise LibError(error_type)
+        if error_type == ErrorType.OK:
+            return
+        if ignores is not None and error_type in ignores:
+            return
+        raise LibError(error_type)
 
 
 @utils.make_enum('SP_ERROR_')
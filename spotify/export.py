@@ -0,0 +1,234 @@
+from __future__ import unicode_literals
+
+import gzip
+import json
+import logging
+import struct
+
+import spotify
+from spotify import utils
+
+
+__all__ = []
+
+logger = logging.getLogger(__name__)
+
+
+def iter_records(container):
+    """Iterate over records describing all playlists and playlist tracks in
+    the given :class:`~spotify.PlaylistContainer`.
+
+    The records are dicts with a ``type`` key:
+
+    - ``start_folder`` and ``end_folder``: a :class:`~spotify.PlaylistFolder`,
+      with the keys ``id`` and ``name``.
+    - ``playlist``: a :class:`~spotify.Playlist`, with the keys ``uri``,
+      ``name``, and ``num_tracks``. The playlist record is followed by one
+      ``track`` record per track in the playlist.
+    - ``track``: a :class:`~spotify.PlaylistTrack`, with the keys ``uri``,
+      ``creator``, ``create_time``, ``seen``, and ``message``. The
+      ``creator`` is :class:`None` if unknown.
+
+    The container and its playlists are read one item at a time as the
+    records are consumed, so the memory used doesn't depend on the size of
+    the container. Playlists that aren't loaded are included with ``uri``
+    set to :class:`None` and without any tracks.
+    """
+    for i in range(len(container)):
+        try:
+            item = container[i]
+        except spotify.Error as exc:
+            logger.debug('Skipping playlist container item %d: %s', i, exc)
+            continue
+        if isinstance(item, spotify.PlaylistFolder):
+            yield {
+                'type': 'start_folder'
+                if item.type is spotify.PlaylistType.START_FOLDER
+                else 'end_folder',
+                'id': item.id,
+                'name': item.name,
+            }
+        else:
+            for record in iter_playlist_records(item):
+                yield record
+
+
+def iter_playlist_records(playlist):
+    """Iterate over a ``playlist`` record and a ``track`` record per track
+    in the given :class:`~spotify.Playlist`.
+
+    See :func:`iter_records` for a description of the records.
+    """
+    tracks = playlist.tracks
+    try:
+        uri = playlist.link.uri
+    except spotify.Error as exc:
+        logger.debug('Exporting playlist without URI: %s', exc)
+        uri = None
+    yield {
+        'type': 'playlist',
+        'uri': uri,
+        'name': playlist.name,
+        'num_tracks': len(tracks),
+    }
+    for start in range(0, len(tracks), _TRACK_CHUNK_SIZE):
+        metadata = playlist.get_track_metadata(
+            start, start + _TRACK_CHUNK_SIZE)
+        for i, (create_time, seen, creator, message) in enumerate(
+                zip(*metadata)):
+            yield {
+                'type': 'track',
+                'uri': tracks[start + i].link.uri,
+                'creator': creator,
+                'create_time': create_time,
+                'seen': seen,
+                'message': message,
+            }
+
+
+def write_json_lines(records, fileobj, compress=False):
+    """Write ``records`` to the binary file object ``fileobj`` as newline
+    delimited JSON, one record per line.
+
+    If ``compress`` is :class:`True`, the output is compressed with gzip.
+
+    Returns the number of records written.
+    """
+    return _write(records, fileobj, compress, _encode_json_line)
+
+
+def write_binary(records, fileobj, compress=False):
+    """Write ``records`` to the binary file object ``fileobj`` in a compact
+    binary format.
+
+    The output starts with the four bytes ``SPX\\x01``. Each record is then
+    written as one byte with the record type, the payload size as an
+    unsigned 32-bit integer, and the payload. All integers are big-endian.
+    Strings are written as their size in bytes as an unsigned 32-bit integer
+    followed by the UTF-8 encoded string, or ``0xFFFFFFFF`` for
+    :class:`None`. The payload of each record type is:
+
+    - ``playlist`` (type 1): ``uri`` and ``name`` strings, and
+      ``num_tracks`` as an unsigned 32-bit integer.
+    - ``track`` (type 2): ``uri`` and ``creator`` strings, ``create_time``
+      as a signed 64-bit integer, ``seen`` as one byte, and ``message``
+      string.
+    - ``start_folder`` (type 3) and ``end_folder`` (type 4): ``id`` as an
+      unsigned 64-bit integer, and ``name`` string.
+
+    Use :func:`read_binary` to read the records back.
+
+    If ``compress`` is :class:`True`, the output is compressed with gzip.
+
+    Returns the number of records written.
+    """
+    return _write(records, fileobj, compress, _encode_binary_record,
+                  header=_BINARY_HEADER)
+
+
+def read_binary(fileobj, compress=False):
+    """Iterate over the records in the binary file object ``fileobj``
+    written by :func:`write_binary`.
+
+    If ``compress`` is :class:`True`, the input is decompressed with gzip.
+    """
+    if compress:
+        fileobj = gzip.GzipFile(fileobj=fileobj, mode='rb')
+    if _read_exactly(fileobj, len(_BINARY_HEADER)) != _BINARY_HEADER:
+        raise ValueError('Not a pyspotify binary export')
+    while True:
+        head = fileobj.read(_RECORD_HEAD.size)
+        if not head:
+            return
+        if len(head) < _RECORD_HEAD.size:
+            raise ValueError('Truncated record')
+        type_code, size = _RECORD_HEAD.unpack(head)
+        if type_code not in _RECORD_FORMATS:
+            raise ValueError('Unknown record type: %d' % type_code)
+        type_, fields = _RECORD_FORMATS[type_code]
+        payload = _read_exactly(fileobj, size)
+        record = {'type': type_}
+        offset = 0
+        for name, fmt in fields:
+            record[name], offset = _unpack_field(fmt, payload, offset)
+        yield record
+
+
+# The number of tracks to read the metadata of at a time
+_TRACK_CHUNK_SIZE = 1000
+
+_BINARY_HEADER = b'SPX\x01'
+
+_RECORD_HEAD = struct.Struct(str('>BI'))
+
+_NONE_LENGTH = 0xFFFFFFFF
+
+_RECORD_FORMATS = {
+    1: ('playlist', [('uri', 's'), ('name', 's'), ('num_tracks', 'I')]),
+    2: ('track', [
+        ('uri', 's'), ('creator', 's'), ('create_time', 'q'),
+        ('seen', '?'), ('message', 's')]),
+    3: ('start_folder', [('id', 'Q'), ('name', 's')]),
+    4: ('end_folder', [('id', 'Q'), ('name', 's')]),
+}
+
+_RECORD_TYPES = dict(
+    (type_, (type_code, fields))
+    for type_code, (type_, fields) in _RECORD_FORMATS.items())
+
+
+def _write(records, fileobj, compress, encode, header=b''):
+    if compress:
+        fileobj = gzip.GzipFile(fileobj=fileobj, mode='wb')
+    try:
+        fileobj.write(header)
+        count = 0
+        for record in records:
+            fileobj.write(encode(record))
+            count += 1
+        return count
+    finally:
+        if compress:
+            # Only closes the gzip stream, not the underlying file object
+            fileobj.close()
+
+
+def _encode_json_line(record):
+    line = json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+    return utils.to_bytes(line) + b'\n'
+
+
+def _encode_binary_record(record):
+    type_code, fields = _RECORD_TYPES[record['type']]
+    payload = b''.join(
+        _pack_field(fmt, record[name]) for name, fmt in fields)
+    return _RECORD_HEAD.pack(type_code, len(payload)) + payload
+
+
+def _pack_field(fmt, value):
+    if fmt != 's':
+        return struct.pack(str('>' + fmt), value)
+    if value is None:
+        return struct.pack(str('>I'), _NONE_LENGTH)
+    data = utils.to_bytes(value)
+    return struct.pack(str('>I'), len(data)) + data
+
+
+def _unpack_field(fmt, payload, offset):
+    if fmt != 's':
+        fmt = str('>' + fmt)
+        value, = struct.unpack_from(fmt, payload, offset)
+        return value, offset + struct.calcsize(fmt)
+    length, = struct.unpack_from(str('>I'), payload, offset)
+    offset += 4
+    if length == _NONE_LENGTH:
+        return None, offset
+    value = payload[offset:offset + length].decode('utf-8')
+    return value, offset + length
+
+
+def _read_exactly(fileobj, size):
+    data = fileobj.read(size)
+    if len(data) != size:
+        raise ValueError('Truncated record')
+    return data
@@ -148,7 +148,7 @@ class Image(object):
     @property
     def link(self):
         """A :class:`Link` to the image."""
-        return spotify.Link(
+        return spotify.Link._cached(
             self._session,
             sp_link=lib.sp_link_create_from_image(self._sp_image),
             add_ref=False)
@@ -1,11 +1,17 @@
 from __future__ import unicode_literals
 
+import collections
+import re
+
 try:
     # Python 3
-    from urllib.parse import urlparse  # noqa
+    from urllib.parse import unquote_plus  # noqa
 except ImportError:
     # Python 2
-    from urlparse import urlparse  # noqa
+    from urllib import unquote_plus as _unquote_plus  # noqa
+
+    def unquote_plus(value):
+        return _unquote_plus(value.encode('utf-8')).decode('utf-8')
 
 import spotify
 from spotify import ffi, lib, serialized, utils
@@ -13,6 +19,8 @@ from spotify import ffi, lib, serialized, utils
 __all__ = [
     'Link',
     'LinkType',
+    'ParsedUri',
+    'parse_uri',
 ]
 
 
@@ -57,6 +65,28 @@ class Link(object):
         Link('spotify:track:4wl1dK5dHGp3Ig51stvxb0')
     """
 
+    __slots__ = ('_session', '_sp_link', '__weakref__')
+
+    @classmethod
+    @serialized
+    def _cached(cls, session, sp_link, add_ref=True):
+        """
+        Get :class:`Link` instance for the given ``sp_link``. If it already
+        exists, it is retrieved from cache.
+
+        Internal method.
+        """
+        link = session._cache.get(sp_link)
+        if isinstance(link, Link):
+            if not add_ref:
+                # We were given a reference we don't need, as the cached
+                # instance already holds one.
+                lib.sp_link_release(sp_link)
+            return link
+        link = Link(session, sp_link=sp_link, add_ref=add_ref)
+        session._cache[sp_link] = link
+        return link
+
     def __init__(self, session, uri=None, sp_link=None, add_ref=True):
         assert uri or sp_link, 'uri or sp_link is required'
 
@@ -78,10 +108,10 @@ class Link(object):
     def _normalize_uri(uri):
         if uri.startswith('spotify:'):
             return uri
-        parsed = urlparse(uri)
-        if parsed.netloc not in ('open.spotify.com', 'play.spotify.com'):
+        match = _URL_RE.match(uri)
+        if match is None:
             return uri
-        return 'spotify%s' % parsed.path.strip().replace('/', ':')
+        return 'spotify%s' % match.group(1).strip().replace('/', ':')
 
     def __repr__(self):
         return 'Link(%r)' % self.uri
@@ -124,7 +154,8 @@ class Link(object):
         sp_track = lib.sp_link_as_track(self._sp_link)
         if sp_track == ffi.NULL:
             return None
-        return spotify.Track(self._session, sp_track=sp_track, add_ref=True)
+        return spotify.Track._cached(
+            self._session, sp_track=sp_track, add_ref=True)
 
     def as_track_offset(self):
         """Get the track offset in milliseconds from the link."""
@@ -140,7 +171,8 @@ class Link(object):
         sp_album = lib.sp_link_as_album(self._sp_link)
         if sp_album == ffi.NULL:
             return None
-        return spotify.Album(self._session, sp_album=sp_album, add_ref=True)
+        return spotify.Album._cached(
+            self._session, sp_album=sp_album, add_ref=True)
 
     @serialized
     def as_artist(self):
@@ -148,7 +180,8 @@ class Link(object):
         sp_artist = lib.sp_link_as_artist(self._sp_link)
         if sp_artist == ffi.NULL:
             return None
-        return spotify.Artist(self._session, sp_artist=sp_artist, add_ref=True)
+        return spotify.Artist._cached(
+            self._session, sp_artist=sp_artist, add_ref=True)
 
     def as_playlist(self):
         """Make a :class:`Playlist` from the link."""
@@ -167,7 +200,8 @@ class Link(object):
         sp_user = lib.sp_link_as_user(self._sp_link)
         if sp_user == ffi.NULL:
             return None
-        return spotify.User(self._session, sp_user=sp_user, add_ref=True)
+        return spotify.User._cached(
+            self._session, sp_user=sp_user, add_ref=True)
 
     def as_image(self, callback=None):
         """Make an :class:`Image` from the link.
@@ -189,3 +223,104 @@ class Link(object):
 @utils.make_enum('SP_LINKTYPE_')
 class LinkType(utils.IntEnum):
     pass
+
+
+_URL_RE = re.compile(r'^https?://(?:open|play)\.spotify\.com(/[^?#]*)')
+
+_ID = r'(?P<id>[0-9A-Za-z]{22})'
+_USER = r'(?P<user>[^:]+)'
+
+_URI_RES = {
+    'track': [(
+        LinkType.TRACK,
+        re.compile(
+            r'^spotify:track:%s(?:#(?P<minutes>\d+):(?P<seconds>\d\d))?$'
+            % _ID))],
+    'album': [(LinkType.ALBUM, re.compile(r'^spotify:album:%s$' % _ID))],
+    'artist': [(LinkType.ARTIST, re.compile(r'^spotify:artist:%s$' % _ID))],
+    'user': [
+        (LinkType.PLAYLIST, re.compile(
+            r'^spotify:user:%s:playlist:%s$' % (_USER, _ID))),
+        (LinkType.STARRED, re.compile(r'^spotify:user:%s:starred$' % _USER)),
+        (LinkType.PROFILE, re.compile(r'^spotify:user:%s$' % _USER)),
+    ],
+    'local': [(
+        LinkType.LOCALTRACK,
+        re.compile(
+            r'^spotify:local:(?P<artist>[^:]*):(?P<album>[^:]*):'
+            r'(?P<title>[^:]*):(?P<duration>\d*)$'))],
+    'image': [(
+        LinkType.IMAGE, re.compile(r'^spotify:image:(?P<id>[0-9a-f]{40})$'))],
+    'search': [(
+        LinkType.SEARCH, re.compile(r'^spotify:search:(?P<query>.+)$'))],
+}
+
+
+class ParsedUri(collections.namedtuple('ParsedUri', [
+        'type', 'uri', 'id', 'user', 'offset', 'query',
+        'artist', 'album', 'title', 'duration'])):
+
+    """The components of a Spotify URI, as returned by :func:`parse_uri`.
+
+    ``type`` is a :class:`LinkType` and ``uri`` is the URI with any
+    open.spotify.com or play.spotify.com URL converted to a Spotify URI.
+
+    The other components are :class:`None` unless they are part of the URI
+    type:
+
+    - ``id``: the base62 ID of tracks, albums, artists, and playlists, or the
+      hex ID of images.
+    - ``user``: the username of playlists, starred lists, and user profiles.
+    - ``offset``: the offset into a track in milliseconds, if the track URI
+      has one, e.g. ``spotify:track:2Foc5Q5nqNiosCNqttzHof#1:30``.
+    - ``query``: the query of searches.
+    - ``artist``, ``album``, ``title``, and ``duration``: the components of
+      local tracks. ``duration`` is in seconds. Any of them may be empty.
+    """
+
+
+_EMPTY_PARSED_URI = ParsedUri(*([None] * len(ParsedUri._fields)))
+
+
+def parse_uri(uri):
+    """Parse a Spotify URI or open.spotify.com/play.spotify.com URL into a
+    :class:`ParsedUri`, without calling libspotify.
+
+    This is useful for validating URIs or finding their type without having to
+    create :class:`Link` objects. Raises :exc:`ValueError` if the URI isn't
+    valid.
+
+    Example::
+
+        >>> spotify.parse_uri(
+        ...     'http://open.spotify.com/track/2Foc5Q5nqNiosCNqttzHof')
+        ParsedUri(type=<LinkType.TRACK: 1>,
+            uri=u'spotify:track:2Foc5Q5nqNiosCNqttzHof',
+            id=u'2Foc5Q5nqNiosCNqttzHof', user=None, offset=None, query=None,
+            artist=None, album=None, title=None, duration=None)
+    """
+    uri = Link._normalize_uri(utils.to_unicode(uri).strip())
+    parts = uri.split(':', 2)
+    if len(parts) == 3 and parts[0] == 'spotify':
+        for link_type, regex in _URI_RES.get(parts[1], []):
+            match = regex.match(uri)
+            if match is not None:
+                return _parsed_uri(link_type, uri, match.groupdict())
+    raise ValueError('Invalid Spotify URI: %r' % uri)
+
+
+def _parsed_uri(link_type, uri, groups):
+    components = {'type': link_type, 'uri': uri}
+    for name, value in groups.items():
+        if name in ('minutes', 'seconds'):
+            continue
+        if name != 'id' and value is not None:
+            value = unquote_plus(value)
+        components[name] = value
+    if groups.get('minutes') is not None:
+        components['offset'] = (
+            int(groups['minutes']) * 60 + int(groups['seconds'])) * 1000
+    if link_type is LinkType.LOCALTRACK:
+        components['duration'] = (
+            int(groups['duration']) if groups['duration'] else None)
+    return _EMPTY_PARSED_URI._replace(**components)
@@ -1,7 +1,9 @@
 from __future__ import unicode_literals
 
+import bisect
 import collections
 import logging
+import time
 
 import spotify
 from spotify import ffi, lib, serialized, utils
@@ -11,6 +13,8 @@ __all__ = [
     'Playlist',
     'PlaylistEvent',
     'PlaylistOfflineStatus',
+    'PlaylistSyncOperation',
+    'PlaylistTrackMetadata',
 ]
 
 logger = logging.getLogger(__name__)
@@ -142,6 +146,52 @@ class Playlist(utils.EventEmitter):
 
         return _PlaylistTracks(self._session, self)
 
+    @serialized
+    def get_track_metadata(self, start=0, stop=None):
+        """Get the metadata specific to the playlist for the tracks from
+        index ``start`` up to, but not including, index ``stop``.
+
+        The indexes work like in a slice. If ``stop`` isn't specified, the
+        metadata for all tracks from ``start`` is returned.
+
+        Returns a :class:`PlaylistTrackMetadata` with one list per field. The
+        metadata of the track at index ``start + i`` is at index ``i`` in
+        each list. All the metadata is read while holding the global lock,
+        without creating any :class:`PlaylistTrack` or :class:`User`
+        objects, which makes this much faster than reading the metadata
+        through :attr:`tracks_with_metadata` for large playlists.
+
+        Will always return empty lists if the playlist isn't loaded.
+        """
+        num_tracks = (
+            lib.sp_playlist_num_tracks(self._sp_playlist)
+            if self.is_loaded else 0)
+        indexes = range(*slice(start, stop).indices(num_tracks))
+        sp_playlist = self._sp_playlist
+        creator_names = {}
+
+        def get_creator(index):
+            sp_user = lib.sp_playlist_track_creator(sp_playlist, index)
+            if sp_user == ffi.NULL:
+                return None
+            if sp_user not in creator_names:
+                creator_names[sp_user] = utils.to_unicode(
+                    lib.sp_user_canonical_name(sp_user))
+            return creator_names[sp_user]
+
+        return PlaylistTrackMetadata(
+            create_times=[
+                lib.sp_playlist_track_create_time(sp_playlist, i)
+                for i in indexes],
+            seen=[
+                bool(lib.sp_playlist_track_seen(sp_playlist, i))
+                for i in indexes],
+            creators=[get_creator(i) for i in indexes],
+            messages=[
+                utils.to_unicode_or_none(
+                    lib.sp_playlist_track_message(sp_playlist, i))
+                for i in indexes])
+
     @property
     @serialized
     def name(self):
@@ -151,7 +201,8 @@ class Playlist(utils.EventEmitter):
 
         Will always return :class:`None` if the playlist isn't loaded.
         """
-        name = utils.to_unicode(lib.sp_playlist_name(self._sp_playlist))
+        name = utils.to_unicode_interned(
+            self._session, lib.sp_playlist_name(self._sp_playlist))
         return name if name else None
 
     @name.setter
@@ -167,7 +218,7 @@ class Playlist(utils.EventEmitter):
     @serialized
     def owner(self):
         """The :class:`User` object for the owner of the playlist."""
-        return spotify.User(
+        return spotify.User._cached(
             self._session,
             sp_user=lib.sp_playlist_owner(self._sp_playlist), add_ref=True)
 
@@ -245,6 +296,60 @@ class Playlist(utils.EventEmitter):
             self._sp_playlist, [t._sp_track for t in tracks], len(tracks),
             index, self._session._sp_session))
 
+    def add_tracks_in_chunks(
+            self, tracks, index=None, chunk_size=100, callback=None,
+            wait=False, timeout=None):
+        """Add the given ``tracks`` to playlist at the given ``index``, in
+        chunks of ``chunk_size`` tracks.
+
+        This is useful when adding thousands of tracks, which may be too many
+        for the Spotify servers to accept in one change. The global lock is
+        released between chunks, so other threads can use pyspotify while the
+        tracks are added.
+
+        ``tracks`` is a list of :class:`~spotify.Track` objects. If ``index``
+        isn't specified, the tracks are added to the end of the playlist.
+
+        If ``callback`` is given, it is called after each chunk with the
+        playlist, the number of tracks added so far, and the total number of
+        tracks to add.
+
+        If ``wait`` is :class:`True`, the method blocks after each chunk until
+        the server has acknowledged the changes, as reported by
+        :attr:`has_pending_changes`. After ``timeout`` seconds with pending
+        changes :exc:`~spotify.Timeout` is raised. If ``timeout`` is
+        :class:`None` the default timeout is used.
+        """
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be at least 1')
+        tracks = list(tracks)
+        if index is None:
+            index = len(self.tracks)
+        sp_tracks = ffi.new('sp_track *[]', [t._sp_track for t in tracks])
+        num_added = 0
+        while num_added < len(tracks):
+            num_tracks = min(chunk_size, len(tracks) - num_added)
+            spotify.Error.maybe_raise(lib.sp_playlist_add_tracks(
+                self._sp_playlist, sp_tracks + num_added, num_tracks,
+                index + num_added, self._session._sp_session))
+            num_added += num_tracks
+            if wait:
+                self._wait_for_pending_changes(timeout)
+            if callback is not None:
+                callback(self, num_added, len(tracks))
+
+    def _wait_for_pending_changes(self, timeout=None):
+        if timeout is None:
+            timeout = 10
+        deadline = time.time() + timeout
+        while self.has_pending_changes:
+            self._session.process_events()
+            if not self.has_pending_changes:
+                return
+            if time.time() > deadline:
+                raise spotify.Timeout(timeout)
+            time.sleep(0.001)
+
     def remove_tracks(self, indexes):
         """Remove the tracks at the given ``indexes`` from the playlist.
 
@@ -271,6 +376,61 @@ class Playlist(utils.EventEmitter):
         spotify.Error.maybe_raise(lib.sp_playlist_reorder_tracks(
             self._sp_playlist, indexes, len(indexes), new_index))
 
+    def sync_to(self, tracks, dry_run=False):
+        """Change the playlist to contain the given ``tracks``, in the given
+        order, with as few changes as possible.
+
+        ``tracks`` is a list of :class:`~spotify.Track` objects or Spotify
+        track URIs. Tracks are compared by URI. Tracks already in the
+        playlist are kept and moved as needed, instead of being removed and
+        added again, which keeps their metadata, like who added the track
+        and when, and avoids notifying the playlist's subscribers about
+        changes that doesn't change anything.
+
+        The changes are made with at most one :meth:`remove_tracks` call,
+        followed by as few :meth:`reorder_tracks` and :meth:`add_tracks` calls
+        as possible. Any reordering of n tracks, like reversing the playlist,
+        takes at most about log2(n) :meth:`reorder_tracks` calls.
+
+        Returns the list of :class:`PlaylistSyncOperation` objects describing
+        the changes. If ``dry_run`` is :class:`True`, the changes are only
+        planned and returned, and the playlist is not changed.
+
+        The playlist must be loaded, or :exc:`spotify.Error` is raised.
+        """
+        if not self.is_loaded:
+            raise spotify.Error('The playlist must be loaded to be synced')
+        targets = list(tracks)
+        target_uris = [
+            track if isinstance(track, utils.string_types)
+            else track.link.uri
+            for track in targets]
+        current_uris = [track.link.uri for track in self.tracks]
+
+        operations = []
+        for type_, indexes, index in _plan_sync(current_uris, target_uris):
+            if type_ == 'add':
+                add_tracks = [targets[i] for i in indexes]
+                operations.append(PlaylistSyncOperation(
+                    type_, None, add_tracks, index))
+            else:
+                operations.append(PlaylistSyncOperation(
+                    type_, indexes, None, index))
+        if dry_run:
+            return operations
+
+        for operation in operations:
+            if operation.type == 'remove':
+                self.remove_tracks(operation.indexes)
+            elif operation.type == 'reorder':
+                self.reorder_tracks(operation.indexes, operation.index)
+            elif operation.type == 'add':
+                self.add_tracks([
+                    self._session.get_track(track)
+                    if isinstance(track, utils.string_types) else track
+                    for track in operation.tracks], index=operation.index)
+        return operations
+
     @property
     def num_subscribers(self):
         """The number of subscribers to the playlist.
@@ -379,7 +539,8 @@ class Playlist(utils.EventEmitter):
             # XXX Figure out why we can still get NULL here even if
             # the playlist is both loaded and in RAM.
             raise spotify.Error('Failed to get link from Spotify playlist')
-        return spotify.Link(self._session, sp_link=sp_link, add_ref=False)
+        return spotify.Link._cached(
+            self._session, sp_link=sp_link, add_ref=False)
 
     @serialized
     def on(self, event, listener, *user_args):
@@ -593,7 +754,7 @@ class _PlaylistCallbacks(object):
         playlist = Playlist._cached(
             spotify._session_instance, sp_playlist, add_ref=True)
         tracks = [
-            spotify.Track(
+            spotify.Track._cached(
                 spotify._session_instance, sp_track=sp_tracks[i], add_ref=True)
             for i in range(num_tracks)]
         playlist.emit(
@@ -664,7 +825,7 @@ class _PlaylistCallbacks(object):
         logger.debug('Playlist track created changed')
         playlist = Playlist._cached(
             spotify._session_instance, sp_playlist, add_ref=True)
-        user = spotify.User(
+        user = spotify.User._cached(
             spotify._session_instance, sp_user=sp_user, add_ref=True)
         playlist.emit(
             PlaylistEvent.TRACK_CREATED_CHANGED,
@@ -731,6 +892,22 @@ class PlaylistOfflineStatus(utils.IntEnum):
     pass
 
 
+class PlaylistSyncOperation(collections.namedtuple(
+        'PlaylistSyncOperation', ['type', 'indexes', 'tracks', 'index'])):
+
+    """A change to a playlist planned by :meth:`Playlist.sync_to`."""
+    pass
+
+
+class PlaylistTrackMetadata(collections.namedtuple(
+        'PlaylistTrackMetadata',
+        ['create_times', 'seen', 'creators', 'messages'])):
+
+    """Metadata for a range of a playlist's tracks, as returned by
+    :meth:`Playlist.get_track_metadata`."""
+    pass
+
+
 class _Tracks(utils.Sequence, collections.MutableSequence):
 
     def __init__(self, session, playlist):
@@ -745,7 +922,7 @@ class _Tracks(utils.Sequence, collections.MutableSequence):
 
     @serialized
     def get_track(self, sp_playlist, key):
-        return spotify.Track(
+        return spotify.Track._cached(
             self._session,
             sp_track=lib.sp_playlist_track(sp_playlist, key), add_ref=True)
 
@@ -759,26 +936,45 @@ class _Tracks(utils.Sequence, collections.MutableSequence):
         if isinstance(key, slice):
             if not isinstance(value, collections.Iterable):
                 raise TypeError('can only assign an iterable')
+            value = list(value)
         if isinstance(key, int):
             if not 0 <= key < self.__len__():
                 raise IndexError('list index out of range')
             key = slice(key, key + 1)
             value = [value]
 
-        for i, val in enumerate(value, key.start):
-            self._playlist.add_tracks(val, index=i)
+        start, stop, step = key.indices(self.__len__())
+        if step != 1:
+            self._set_extended_slice(range(start, stop, step), value)
+            return
 
-        key = slice(key.start + len(value), key.stop + len(value), key.step)
-        del self[key]
+        # Add all the new tracks in front of the old ones, and then remove
+        # all the old tracks, which have been moved by the added tracks.
+        stop = max(start, stop)
+        if value:
+            self._playlist.add_tracks(value, index=start)
+        self._remove_indexes(range(start + len(value), stop + len(value)))
+
+    def _set_extended_slice(self, indexes, value):
+        if len(indexes) != len(value):
+            raise ValueError(
+                'attempt to assign sequence of size %d '
+                'to extended slice of size %d' % (len(value), len(indexes)))
+        if indexes and indexes[0] > indexes[-1]:
+            indexes, value = indexes[::-1], value[::-1]
+        self._remove_indexes(indexes)
+
+        # With the old tracks removed, adding the new tracks from the lowest
+        # index and up puts each of them where the old track was.
+        for i, val in zip(indexes, value):
+            self._playlist.add_tracks([val], index=i)
 
     def __delitem__(self, key):
         # Required by collections.MutableSequence
 
         if isinstance(key, slice):
             start, stop, step = key.indices(self.__len__())
-            indexes = range(start, stop, step)
-            for i in reversed(sorted(indexes)):
-                self._playlist.remove_tracks(i)
+            self._remove_indexes(range(start, stop, step))
             return
         if not isinstance(key, int):
             raise TypeError(
@@ -788,6 +984,13 @@ class _Tracks(utils.Sequence, collections.MutableSequence):
             raise IndexError('list index out of range')
         self._playlist.remove_tracks(key)
 
+    def _remove_indexes(self, indexes):
+        # All tracks are removed with a single call, as libspotify then emits
+        # a single tracks_removed event instead of one per track.
+        indexes = list(indexes)
+        if indexes:
+            self._playlist.remove_tracks(indexes)
+
     def insert(self, index, value):
         # Required by collections.MutableSequence
 
@@ -799,3 +1002,175 @@ class _PlaylistTracks(_Tracks):
     @serialized
     def get_track(self, sp_playlist, key):
         return spotify.PlaylistTrack(self._session, sp_playlist, key)
+
+
+def _plan_sync(current, target):
+    """Plan the changes needed to turn the list ``current`` into ``target``.
+
+    Returns a list of ``(type, indexes, index)`` tuples, where ``type`` is
+    one of:
+
+    - ``remove``: remove the items at ``indexes``, which are indexes into
+      ``current``.
+    - ``reorder``: move the items at ``indexes`` to before the item at
+      ``index``, with both indexes counted before the move.
+    - ``add``: add the items at ``indexes`` in ``target`` at ``index``.
+    """
+    # Match each target item with the first unused equal current item.
+    unused = collections.defaultdict(collections.deque)
+    for i, key in enumerate(current):
+        unused[key].append(i)
+    matches = [None] * len(current)
+    for j, key in enumerate(target):
+        if unused[key]:
+            matches[unused[key].popleft()] = j
+
+    operations = []
+    removed = [i for i, j in enumerate(matches) if j is None]
+    if removed:
+        operations.append(('remove', removed, None))
+
+    kept = [j for j in matches if j is not None]
+    kept_index = dict((j, i) for i, j in enumerate(kept))
+    operations.extend(min(
+        _plan_chain_moves(kept), _plan_radix_moves(kept), key=len))
+
+    # All kept items are now in the target order, so the new items can be
+    # added at their target indexes from the start of the playlist and up.
+    added = []
+    for j in range(len(target)):
+        if j in kept_index:
+            continue
+        if added and added[-1][-1] == j - 1:
+            added[-1].append(j)
+        else:
+            added.append([j])
+    for run in added:
+        operations.append(('add', run, run[0]))
+
+    return operations
+
+
+def _plan_chain_moves(kept):
+    """Plan the reorders that sort ``kept`` by moving the fewest items.
+
+    ``kept`` is the target indexes of the items, in the order they have in
+    the playlist. The longest increasing subsequence of them stays in place,
+    and the rest is moved, each to after the item before it in the target.
+    """
+    operations = []
+    staying = _longest_increasing_subsequence(kept)
+    kept_index = dict((j, i) for i, j in enumerate(kept))
+    chains = collections.OrderedDict([(None, [])])
+    anchor = None
+    for j in sorted(kept):
+        if j in staying:
+            anchor = j
+            chains[anchor] = []
+        else:
+            chains[anchor].append(j)
+
+    # Keep track of the items' positions by giving each item a slot for
+    # where it is now and each moved item a slot for where it is moved to,
+    # and counting the occupied slots before a slot.
+    old_slots = {}
+    new_slots = {}
+    num_slots = 0
+    for j in chains[None]:
+        new_slots[j] = num_slots
+        num_slots += 1
+    for j in kept:
+        old_slots[j] = num_slots
+        num_slots += 1
+        for k in chains.get(j, []):
+            new_slots[k] = num_slots
+            num_slots += 1
+    occupied = _FenwickTree(num_slots)
+    for slot in old_slots.values():
+        occupied.add(slot, 1)
+
+    for chain in chains.values():
+        # Items in the same chain can be moved together if they already are
+        # in the same order as in the target.
+        runs = []
+        for j in chain:
+            if runs and kept_index[j] > kept_index[runs[-1][-1]]:
+                runs[-1].append(j)
+            else:
+                runs.append([j])
+        for run in runs:
+            indexes = [occupied.count_before(old_slots[j]) for j in run]
+            index = occupied.count_before(new_slots[run[0]])
+            operations.append(('reorder', indexes, index))
+            for j in run:
+                occupied.add(old_slots[j], -1)
+                occupied.add(new_slots[j], 1)
+
+    return operations
+
+
+def _plan_radix_moves(kept):
+    """Plan the reorders that sort ``kept`` with a radix sort.
+
+    Each reorder moves the items with a given bit set in their rank in the
+    target order to the end of the playlist, keeping their order, starting
+    with the lowest bit. This takes at most log2(n) reorders for n items, no
+    matter how they are ordered.
+    """
+    operations = []
+    ranks = dict((j, rank) for rank, j in enumerate(sorted(kept)))
+    order = [ranks[j] for j in kept]
+    for bit in range(max(len(order) - 1, 0).bit_length()):
+        zeros = [rank for rank in order if not rank >> bit & 1]
+        if order[:len(zeros)] == zeros:
+            continue  # The items with the bit set are already at the end
+        indexes = [i for i, rank in enumerate(order) if rank >> bit & 1]
+        operations.append(('reorder', indexes, len(order)))
+        order = zeros + [order[i] for i in indexes]
+    return operations
+
+
+def _longest_increasing_subsequence(values):
+    """Get the set of values in a longest strictly increasing subsequence of
+    ``values``."""
+    tails = []  # Index of the last value of the best subsequence per length
+    tail_values = []
+    previous = [None] * len(values)
+    for i, value in enumerate(values):
+        length = bisect.bisect_left(tail_values, value)
+        if length > 0:
+            previous[i] = tails[length - 1]
+        if length == len(tails):
+            tails.append(i)
+            tail_values.append(value)
+        else:
+            tails[length] = i
+            tail_values[length] = value
+    result = set()
+    i = tails[-1] if tails else None
+    while i is not None:
+        result.add(values[i])
+        i = previous[i]
+    return result
+
+
+class _FenwickTree(object):
+
+    """Counts of items in slots, which can be summed in O(log n) time."""
+
+    def __init__(self, size):
+        self._tree = [0] * (size + 1)
+
+    def add(self, slot, count):
+        i = slot + 1
+        while i < len(self._tree):
+            self._tree[i] += count
+            i += i & -i
+
+    def count_before(self, slot):
+        total = 0
+        i = slot
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
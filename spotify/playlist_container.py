@@ -4,6 +4,7 @@ import collections
 import logging
 import pprint
 import re
+import weakref
 
 import spotify
 from spotify import ffi, lib, serialized, utils
@@ -13,6 +14,7 @@ __all__ = [
     'PlaylistContainer',
     'PlaylistContainerEvent',
     'PlaylistFolder',
+    'PlaylistFolderNode',
     'PlaylistType',
 ]
 
@@ -110,6 +112,15 @@ class PlaylistContainer(collections.MutableSequence, utils.EventEmitter):
         # added callbacks with.
         self._lib = lib
 
+        # Map of folder IDs to the indexes of the start and end of the folder.
+        # Built when first needed and kept up to date by the
+        # playlist_added/removed/moved callbacks.
+        self._folder_ranges = None
+
+        # Index of the playlists by name and URI. Built when first needed and
+        # kept up to date like the folder index.
+        self._playlist_index = None
+
     def __del__(self):
         if not hasattr(self, '_lib'):
             return
@@ -171,24 +182,27 @@ class PlaylistContainer(collections.MutableSequence, utils.EventEmitter):
             key += self.__len__()
         if not 0 <= key < self.__len__():
             raise IndexError('list index out of range')
+        return self._get_item(key)
 
+    @serialized
+    def _get_item(self, index):
         playlist_type = PlaylistType(lib.sp_playlistcontainer_playlist_type(
-            self._sp_playlistcontainer, key))
+            self._sp_playlistcontainer, index))
 
         if playlist_type is PlaylistType.PLAYLIST:
             sp_playlist = lib.sp_playlistcontainer_playlist(
-                self._sp_playlistcontainer, key)
+                self._sp_playlistcontainer, index)
             return spotify.Playlist._cached(
                 self._session, sp_playlist, add_ref=True)
         elif playlist_type in (
                 PlaylistType.START_FOLDER, PlaylistType.END_FOLDER):
             return PlaylistFolder(
                 id=lib.sp_playlistcontainer_playlist_folder_id(
-                    self._sp_playlistcontainer, key),
+                    self._sp_playlistcontainer, index),
                 name=utils.get_with_fixed_buffer(
                     100,
                     lib.sp_playlistcontainer_playlist_folder_name,
-                    self._sp_playlistcontainer, key),
+                    self._sp_playlistcontainer, index),
                 type=playlist_type)
         else:
             raise spotify.Error('Unknown playlist type: %r' % playlist_type)
@@ -209,26 +223,54 @@ class PlaylistContainer(collections.MutableSequence, utils.EventEmitter):
             key = slice(key, key + 1)
             value = [value]
 
+        start, stop, step = key.indices(self.__len__())
+        if step != 1:
+            self._set_extended_slice(range(start, stop, step), list(value))
+            return
+
         # In case playlist creation fails, we create before we remove any
         # playlists.
-        for i, val in enumerate(value, key.start):
-            if isinstance(val, spotify.Playlist):
-                self.add_playlist(val, index=i)
-            else:
-                self.add_new_playlist(val, index=i)
+        playlists = self.insert_many(value, index=start)
 
-        # Adjust for the new playlist at index key.start.
-        key = slice(key.start + len(value), key.stop + len(value), key.step)
-        del self[key]
+        # Adjust for the new playlists at index start.
+        num_added = len([p for p in playlists if p is not None])
+        self.remove_many(
+            range(start + num_added, max(start, stop) + num_added, step))
+
+    @serialized
+    def _set_extended_slice(self, indexes, value):
+        if len(indexes) != len(value):
+            raise ValueError(
+                'attempt to assign sequence of size %d '
+                'to extended slice of size %d' % (len(value), len(indexes)))
+        if indexes and indexes[0] > indexes[-1]:
+            indexes, value = indexes[::-1], value[::-1]
+
+        # In case playlist creation fails, we create the new playlists at the
+        # end before we remove any playlists.
+        playlists = self.insert_many(value)
+        self.remove_many(indexes)
+
+        # Then the new playlists are moved from the end to where the old
+        # playlists were, from the lowest index and up. Playlists that
+        # already were in the container aren't added, and leave no gap.
+        num_added = len([p for p in playlists if p is not None])
+        end = self.__len__() - num_added
+        num_skipped = 0
+        for index, playlist in zip(indexes, playlists):
+            if playlist is None:
+                num_skipped += 1
+                continue
+            if end != index - num_skipped:
+                self.move_playlist(end, index - num_skipped)
+            end += 1
 
     def __delitem__(self, key):
         # Required by collections.MutableSequence
 
         if isinstance(key, slice):
             start, stop, step = key.indices(self.__len__())
-            indexes = range(start, stop, step)
-            for i in reversed(sorted(indexes)):
-                self.remove_playlist(i)
+            self.remove_many(range(start, stop, step))
             return
         if not isinstance(key, int):
             raise TypeError(
@@ -324,31 +366,266 @@ class PlaylistContainer(collections.MutableSequence, utils.EventEmitter):
 
         Using ``del playlist_container[3]`` is equivalent to
         ``playlist_container.remove_playlist(3)``. Similarly, ``del
-        playlist_container[0:2]`` is equivalent to calling this method with
-        indexes ``1`` and ``0``.
+        playlist_container[0:2]`` is equivalent to
+        ``playlist_container.remove_many([0, 1])``.
         """
-        item = self[index]
-        if isinstance(item, PlaylistFolder):
-            indexes = self._find_folder_indexes(self, item.id, recursive)
-        else:
-            indexes = [index]
-        for i in reversed(sorted(indexes)):
+        self.remove_many([index], recursive=recursive)
+
+    @serialized
+    def remove_many(self, indexes, recursive=False):
+        """Remove the playlists at the given ``indexes`` from the container.
+
+        Folders are removed like with :meth:`remove_playlist`. All the
+        ``indexes`` refer to the positions in the container before any
+        playlist is removed, and all of them are checked before the first
+        playlist is removed. The playlists are then removed from the highest
+        index to the lowest, so that no index is shifted before it is removed.
+        """
+        num_items = self.__len__()
+        removed = set()
+        for index in indexes:
+            if index < 0:
+                index += num_items
+            if not 0 <= index < num_items:
+                raise IndexError('list index out of range')
+            playlist_type = lib.sp_playlistcontainer_playlist_type(
+                self._sp_playlistcontainer, index)
+            if playlist_type in (
+                    PlaylistType.START_FOLDER, PlaylistType.END_FOLDER):
+                folder_id = lib.sp_playlistcontainer_playlist_folder_id(
+                    self._sp_playlistcontainer, index)
+                removed.update(self._get_folder_indexes(folder_id, recursive))
+            else:
+                removed.add(index)
+        for index in sorted(removed, reverse=True):
             spotify.Error.maybe_raise(
                 lib.sp_playlistcontainer_remove_playlist(
-                    self._sp_playlistcontainer, i))
+                    self._sp_playlistcontainer, index))
 
-    @staticmethod
-    def _find_folder_indexes(container, folder_id, recursive):
-        indexes = []
-        for i, item in enumerate(container):
-            if isinstance(item, PlaylistFolder) and item.id == folder_id:
-                indexes.append(i)
-        assert len(indexes) <= 2, (
-            'Found more than 2 items with the same playlist folder ID')
-        if recursive and len(indexes) == 2:
-            start, end = indexes
-            indexes = list(range(start, end + 1))
-        return indexes
+    @serialized
+    def insert_many(self, items, index=None):
+        """Add the given ``items`` to the container, starting at the given
+        ``index``.
+
+        Each item can be a :class:`~spotify.Playlist` or a
+        :class:`~spotify.Link` to add an existing playlist like with
+        :meth:`add_playlist`, or a name to add a new empty playlist like with
+        :meth:`add_new_playlist`.
+
+        If the ``index`` isn't specified, the playlists are added at the end
+        of the container.
+
+        Returns a list with the added playlist for each item, or
+        :class:`None` if the playlist already existed in the container.
+        """
+        end = self.__len__()
+        if index is None:
+            index = end
+        playlists = []
+        for item in items:
+            if isinstance(item, (spotify.Playlist, spotify.Link)):
+                playlist = self.add_playlist(item)
+            else:
+                playlist = self.add_new_playlist(item)
+            playlists.append(playlist)
+            if playlist is None:
+                continue
+            # The playlist is added at the end, and is moved in place before
+            # the next is added, so that we always know where it is.
+            if index != end:
+                self.move_playlist(end, index)
+            index += 1
+            end += 1
+        return playlists
+
+    @serialized
+    def _get_folder_indexes(self, folder_id, recursive):
+        # The folder index is checked against the container before use, in
+        # case it was changed without us getting the callbacks yet.
+        start, end = self._get_folder_ranges().get(folder_id, (None, None))
+        if not (self._is_folder_at(start, folder_id) and
+                self._is_folder_at(end, folder_id)) or start is end is None:
+            self._folder_ranges = None
+            start, end = self._get_folder_ranges().get(
+                folder_id, (None, None))
+        if recursive and start is not None and end is not None:
+            return list(range(start, end + 1))
+        return [i for i in (start, end) if i is not None]
+
+    def _is_folder_at(self, index, folder_id):
+        if index is None:
+            return True
+        if not 0 <= index < self.__len__():
+            return False
+        return (
+            lib.sp_playlistcontainer_playlist_type(
+                self._sp_playlistcontainer, index) in (
+                PlaylistType.START_FOLDER, PlaylistType.END_FOLDER) and
+            lib.sp_playlistcontainer_playlist_folder_id(
+                self._sp_playlistcontainer, index) == folder_id)
+
+    @serialized
+    def _get_folder_ranges(self):
+        if self._folder_ranges is None:
+            ranges = {}
+            for i in range(self.__len__()):
+                playlist_type = lib.sp_playlistcontainer_playlist_type(
+                    self._sp_playlistcontainer, i)
+                if playlist_type == PlaylistType.START_FOLDER:
+                    folder_id = lib.sp_playlistcontainer_playlist_folder_id(
+                        self._sp_playlistcontainer, i)
+                    ranges.setdefault(folder_id, [None, None])[0] = i
+                elif playlist_type == PlaylistType.END_FOLDER:
+                    folder_id = lib.sp_playlistcontainer_playlist_folder_id(
+                        self._sp_playlistcontainer, i)
+                    ranges.setdefault(folder_id, [None, None])[1] = i
+            self._folder_ranges = ranges
+        return self._folder_ranges
+
+    def _on_item_added(self, playlist, index):
+        if self._folder_ranges is None and self._playlist_index is None:
+            return
+        is_playlist = lib.sp_playlistcontainer_playlist_type(
+            self._sp_playlistcontainer, index) == PlaylistType.PLAYLIST
+        if self._folder_ranges is not None:
+            if is_playlist:
+                self._shift_folder_ranges(index, 1)
+            else:
+                self._folder_ranges = None
+        if self._playlist_index is not None:
+            self._playlist_index.insert(
+                index, playlist if is_playlist else None)
+
+    def _on_item_removed(self, index):
+        if self._playlist_index is not None:
+            self._playlist_index.remove(index)
+        if self._folder_ranges is None:
+            return
+        for start, end in self._folder_ranges.values():
+            if index in (start, end):
+                self._folder_ranges = None
+                return
+        self._shift_folder_ranges(index + 1, -1)
+
+    def _on_item_moved(self, old_index, new_index):
+        # The new index is counted before the item was removed.
+        index = new_index - 1 if new_index > old_index else new_index
+        if self._playlist_index is not None:
+            self._playlist_index.move(old_index, index)
+        if self._folder_ranges is None:
+            return
+        for start, end in self._folder_ranges.values():
+            if old_index in (start, end):
+                self._folder_ranges = None
+                return
+        self._shift_folder_ranges(old_index + 1, -1)
+        self._shift_folder_ranges(index, 1)
+
+    def _shift_folder_ranges(self, from_index, offset):
+        for indexes in self._folder_ranges.values():
+            for i, index in enumerate(indexes):
+                if index is not None and index >= from_index:
+                    indexes[i] = index + offset
+
+    @serialized
+    def tree(self):
+        """Get the items in the container as a tree of folders.
+
+        Returns a list of the top level items in the container. Each item is
+        either a :class:`~spotify.Playlist` or a :class:`PlaylistFolderNode`
+        with the folder's name and a list of the items in the folder.
+
+        The whole container is read while holding the global lock, so the
+        tree is a consistent view of the container.
+        """
+        root = []
+        children = root
+        parents = []
+        ranges = {}
+        for i in range(self.__len__()):
+            item = self._get_item(i)
+            if not isinstance(item, PlaylistFolder):
+                children.append(item)
+            elif item.type is PlaylistType.START_FOLDER:
+                node = PlaylistFolderNode(id=item.id, name=item.name, items=[])
+                children.append(node)
+                parents.append(children)
+                children = node.items
+                ranges[item.id] = [i, None]
+            else:
+                ranges.setdefault(item.id, [None, None])[1] = i
+                if parents:
+                    children = parents.pop()
+        self._folder_ranges = ranges
+        return root
+
+    @serialized
+    def find_by_name(self, name):
+        """Get a list of the playlists in the container with the given
+        ``name``, in the order they are in the container.
+
+        The first lookup reads all the playlists in the container into an
+        index, which is kept up to date from the container's events and the
+        playlists' :attr:`~PlaylistEvent.PLAYLIST_RENAMED` and
+        :attr:`~PlaylistEvent.PLAYLIST_STATE_CHANGED` events. Playlists that
+        aren't loaded yet are added to the index when they are loaded. Later
+        lookups don't call libspotify.
+        """
+        return self._get_playlist_index().find_by_name(name)
+
+    @serialized
+    def find_by_uri(self, uri):
+        """Get the playlist in the container with the given ``uri``, or
+        :class:`None` if the playlist isn't in the container.
+
+        Use :meth:`index` to get the playlist's position in the container.
+        See :meth:`find_by_name` for how the playlists are indexed.
+        """
+        return self._get_playlist_index().find_by_uri(uri)
+
+    @serialized
+    def index(self, value, *args):
+        """Get the index of the first occurrence of ``value``.
+
+        Looking up a :class:`~spotify.Playlist` uses the same index as
+        :meth:`find_by_name`.
+        """
+        if args or not isinstance(value, spotify.Playlist):
+            return super(PlaylistContainer, self).index(value, *args)
+        index = self._get_playlist_index().index(value)
+        if index is not None and lib.sp_playlistcontainer_playlist(
+                self._sp_playlistcontainer, index) != value._sp_playlist:
+            self._playlist_index.close()
+            self._playlist_index = None
+            index = self._get_playlist_index().index(value)
+        if index is None:
+            raise ValueError('Playlist is not in the playlist container')
+        return index
+
+    @serialized
+    def _get_playlist_index(self):
+        # The container may have changed without us getting the callbacks
+        # yet, which we can detect cheaply if the number of items differ.
+        num_items = self.__len__()
+        if (self._playlist_index is not None and
+                len(self._playlist_index) != num_items):
+            self._playlist_index.close()
+            self._playlist_index = None
+        if self._playlist_index is None:
+            playlists = []
+            for i in range(num_items):
+                if lib.sp_playlistcontainer_playlist_type(
+                        self._sp_playlistcontainer, i) == (
+                        PlaylistType.PLAYLIST):
+                    playlists.append(spotify.Playlist._cached(
+                        self._session,
+                        lib.sp_playlistcontainer_playlist(
+                            self._sp_playlistcontainer, i),
+                        add_ref=True))
+                else:
+                    playlists.append(None)
+            self._playlist_index = _PlaylistIndex(playlists)
+        return self._playlist_index
 
     def move_playlist(self, from_index, to_index, dry_run=False):
         """Move playlist at ``from_index`` to ``to_index``.
@@ -363,7 +640,7 @@ class PlaylistContainer(collections.MutableSequence, utils.EventEmitter):
     @serialized
     def owner(self):
         """The :class:`User` object for the owner of the playlist container."""
-        return spotify.User(
+        return spotify.User._cached(
             self._session,
             sp_user=lib.sp_playlistcontainer_owner(self._sp_playlistcontainer),
             add_ref=True)
@@ -407,6 +684,163 @@ class PlaylistContainer(collections.MutableSequence, utils.EventEmitter):
     off.__doc__ = utils.EventEmitter.off.__doc__
 
 
+class _PlaylistIndex(object):
+
+    """Index of the playlists in a playlist container by name and URI.
+
+    The index is given the playlist at each position in the container, or
+    :class:`None` for folders, and must be told about all changes to the
+    container. The names and URIs of the playlists are read when they are
+    added to the index, or when they are loaded if they weren't loaded yet.
+
+    The positions of the playlists are kept in a :class:`utils.PositionTree`,
+    so changes to the container and getting the index of a playlist take
+    O(log n) time.
+    """
+
+    def __init__(self, playlists):
+        self._tree = utils.PositionTree()
+        self._nodes = {}
+        self._names = collections.defaultdict(list)
+        self._uris = {}
+        self._keys = {}
+        self._unresolved = set()
+
+        # The playlists don't keep the index alive, as that would create
+        # reference cycles through Playlist.__del__.
+        index_ref = weakref.ref(self)
+
+        def on_renamed(playlist):
+            index = index_ref()
+            if index is not None:
+                index._forget(playlist)
+                index._resolve(playlist)
+
+        def on_state_changed(playlist):
+            index = index_ref()
+            if index is not None:
+                index._resolve(playlist)
+
+        self._on_renamed = on_renamed
+        self._on_state_changed = on_state_changed
+
+        nodes = [utils.PositionTreeNode(playlist) for playlist in playlists]
+        self._tree.insert(0, nodes)
+        for node in nodes:
+            if node.value is not None:
+                self._add(node)
+
+    def __len__(self):
+        return len(self._tree)
+
+    def insert(self, index, playlist):
+        node = utils.PositionTreeNode(playlist)
+        self._tree.insert(index, [node])
+        if playlist is not None:
+            self._add(node)
+
+    def remove(self, index):
+        # If the index is out of sync with the container, it is rebuilt when
+        # the number of items differ on the next lookup.
+        if not 0 <= index < len(self._tree):
+            return None
+        node = self._tree.pop(index)
+        playlist = node.value
+        if playlist is None:
+            return playlist
+        nodes = self._nodes[playlist]
+        nodes.remove(node)
+        if not nodes:
+            del self._nodes[playlist]
+            utils.EventEmitter.off(
+                playlist, spotify.PlaylistEvent.PLAYLIST_RENAMED,
+                self._on_renamed)
+            self._set_unresolved(playlist, False)
+            self._forget(playlist)
+        return playlist
+
+    def move(self, old_index, new_index):
+        if not 0 <= old_index < len(self._tree):
+            return
+        self._tree.insert(new_index, [self._tree.pop(old_index)])
+
+    def close(self):
+        for playlist in self._nodes:
+            utils.EventEmitter.off(
+                playlist, spotify.PlaylistEvent.PLAYLIST_RENAMED,
+                self._on_renamed)
+        for playlist in list(self._unresolved):
+            self._set_unresolved(playlist, False)
+
+    @serialized
+    def find_by_name(self, name):
+        return sorted(self._names.get(name, []), key=self.index)
+
+    @serialized
+    def find_by_uri(self, uri):
+        return self._uris.get(uri)
+
+    def index(self, playlist):
+        nodes = self._nodes.get(playlist)
+        if not nodes:
+            return None
+        return min(self._tree.index(node) for node in nodes)
+
+    def _add(self, node):
+        playlist = node.value
+        nodes = self._nodes.setdefault(playlist, [])
+        nodes.append(node)
+        if len(nodes) == 1:
+            # Playlist.on() would add the playlist to the session's list of
+            # emitters, which is slow for thousands of playlists. The index
+            # keeps the playlists alive itself.
+            utils.EventEmitter.on(
+                playlist, spotify.PlaylistEvent.PLAYLIST_RENAMED,
+                self._on_renamed)
+            self._resolve(playlist)
+
+    def _resolve(self, playlist):
+        if playlist not in self._nodes or playlist in self._keys:
+            return
+        if not playlist.is_loaded:
+            self._set_unresolved(playlist, True)
+            return
+        self._set_unresolved(playlist, False)
+        name = playlist.name
+        try:
+            uri = playlist.link.uri
+        except spotify.Error:
+            uri = None
+        self._keys[playlist] = (name, uri)
+        self._names[name].append(playlist)
+        if uri is not None:
+            self._uris[uri] = playlist
+
+    def _set_unresolved(self, playlist, unresolved):
+        # Unresolved playlists are resolved when their state changes, which
+        # it does when they are loaded.
+        if unresolved and playlist not in self._unresolved:
+            self._unresolved.add(playlist)
+            utils.EventEmitter.on(
+                playlist, spotify.PlaylistEvent.PLAYLIST_STATE_CHANGED,
+                self._on_state_changed)
+        elif not unresolved and playlist in self._unresolved:
+            self._unresolved.discard(playlist)
+            utils.EventEmitter.off(
+                playlist, spotify.PlaylistEvent.PLAYLIST_STATE_CHANGED,
+                self._on_state_changed)
+
+    def _forget(self, playlist):
+        if playlist not in self._keys:
+            return
+        name, uri = self._keys.pop(playlist)
+        self._names[name].remove(playlist)
+        if not self._names[name]:
+            del self._names[name]
+        if uri is not None and self._uris.get(uri) == playlist:
+            del self._uris[uri]
+
+
 class PlaylistContainerEvent(object):
 
     """Playlist container events.
@@ -503,6 +937,7 @@ class _PlaylistContainerCallbacks(object):
             spotify._session_instance, sp_playlistcontainer, add_ref=True)
         playlist = spotify.Playlist._cached(
             spotify._session_instance, sp_playlist, add_ref=True)
+        playlist_container._on_item_added(playlist, index)
         playlist_container.emit(
             PlaylistContainerEvent.PLAYLIST_ADDED,
             playlist_container, playlist, index)
@@ -518,6 +953,7 @@ class _PlaylistContainerCallbacks(object):
             spotify._session_instance, sp_playlistcontainer, add_ref=True)
         playlist = spotify.Playlist._cached(
             spotify._session_instance, sp_playlist, add_ref=True)
+        playlist_container._on_item_removed(index)
         playlist_container.emit(
             PlaylistContainerEvent.PLAYLIST_REMOVED,
             playlist_container, playlist, index)
@@ -535,6 +971,7 @@ class _PlaylistContainerCallbacks(object):
             spotify._session_instance, sp_playlistcontainer, add_ref=True)
         playlist = spotify.Playlist._cached(
             spotify._session_instance, sp_playlist, add_ref=True)
+        playlist_container._on_item_moved(old_index, new_index)
         playlist_container.emit(
             PlaylistContainerEvent.PLAYLIST_MOVED,
             playlist_container, playlist, old_index, new_index)
@@ -557,6 +994,14 @@ class PlaylistFolder(collections.namedtuple(
     pass
 
 
+class PlaylistFolderNode(collections.namedtuple(
+        'PlaylistFolderNode', ['id', 'name', 'items'])):
+
+    """A playlist folder and its content, as returned by
+    :meth:`PlaylistContainer.tree`."""
+    pass
+
+
 @utils.make_enum('SP_PLAYLIST_TYPE_')
 class PlaylistType(utils.IntEnum):
     pass
@@ -0,0 +1,207 @@
+from __future__ import unicode_literals
+
+import collections
+
+import spotify
+from spotify import serialized, utils
+
+
+__all__ = [
+    'PlaylistMirror',
+    'PlaylistMirrorChange',
+]
+
+
+class PlaylistMirror(collections.Sequence):
+
+    """An in-memory copy of the track URIs of a playlist.
+
+    The mirror reads all the playlist's track URIs once when it is created,
+    and then keeps itself up to date by listening to the playlist's
+    :attr:`~PlaylistEvent.TRACKS_ADDED`,
+    :attr:`~PlaylistEvent.TRACKS_REMOVED`, and
+    :attr:`~PlaylistEvent.TRACKS_MOVED` events. Reading from the mirror never
+    calls libspotify::
+
+        >>> mirror = spotify.PlaylistMirror(playlist.load())
+        >>> len(mirror)
+        3
+        >>> mirror[0]
+        u'spotify:track:6xkJysqhkj9uwufFbUb8sP'
+        >>> u'spotify:track:6xkJysqhkj9uwufFbUb8sP' in mirror
+        True
+        >>> mirror.positions(u'spotify:track:6xkJysqhkj9uwufFbUb8sP')
+        [0]
+
+    Each event only gets the URIs of the tracks it affects from libspotify.
+    The URIs are kept in a balanced tree ordered by position, so applying an
+    event that affects k tracks takes O(k log n) time for a playlist of n
+    tracks, and so does getting the :meth:`positions` of a track that is k
+    times in the playlist. Getting a track by index takes O(log n) time, and
+    membership tests and :meth:`count` take constant time.
+
+    Every change to the playlist increases :attr:`version` by one and is
+    recorded as a :class:`PlaylistMirrorChange`, which can be read with
+    :meth:`changes`. Up to ``max_changes`` changes are kept.
+
+    The playlist should be loaded before the mirror is created. Call
+    :meth:`close` to stop listening to the playlist's events.
+    """
+
+    def __init__(self, playlist, max_changes=1000):
+        self.playlist = playlist
+        self.version = 0
+        self._changes = collections.deque(maxlen=max_changes)
+        self._reset()
+
+        self._listeners = [
+            (spotify.PlaylistEvent.TRACKS_ADDED, self._on_tracks_added),
+            (spotify.PlaylistEvent.TRACKS_REMOVED, self._on_tracks_removed),
+            (spotify.PlaylistEvent.TRACKS_MOVED, self._on_tracks_moved),
+        ]
+        for event, listener in self._listeners:
+            playlist.on(event, listener)
+
+    playlist = None
+    """The :class:`Playlist` being mirrored."""
+
+    version = None
+    """The number of changes applied to the mirror since it was created."""
+
+    def __repr__(self):
+        return 'PlaylistMirror(%r, version=%d)' % (self.playlist, self.version)
+
+    def __len__(self):
+        return len(self._tree)
+
+    @serialized
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [
+                self._tree.get(i).value
+                for i in range(*key.indices(len(self._tree)))]
+        if not isinstance(key, int):
+            raise TypeError(
+                'list indices must be int or slice, not %s' %
+                key.__class__.__name__)
+        if key < 0:
+            key += len(self._tree)
+        if not 0 <= key < len(self._tree):
+            raise IndexError('list index out of range')
+        return self._tree.get(key).value
+
+    @serialized
+    def __iter__(self):
+        return iter([node.value for node in self._tree])
+
+    def __contains__(self, uri):
+        return uri in self._nodes
+
+    def count(self, uri):
+        """Get the number of times the track with the given ``uri`` is in the
+        playlist."""
+        return len(self._nodes.get(uri, ()))
+
+    @serialized
+    def positions(self, uri):
+        """Get the list of indexes the track with the given ``uri`` is at in
+        the playlist."""
+        return sorted(
+            self._tree.index(node) for node in self._nodes.get(uri, ()))
+
+    @serialized
+    def snapshot(self):
+        """Get a tuple of the :attr:`version` and a tuple of all the track
+        URIs at that version."""
+        return self.version, tuple(node.value for node in self._tree)
+
+    @serialized
+    def changes(self, since=0):
+        """Get the list of :class:`PlaylistMirrorChange` objects with a
+        version newer than ``since``, oldest first.
+
+        To follow the changes to the playlist, pass the version of the last
+        change you've seen, or the version returned by :meth:`snapshot`.
+
+        If some of the changes are no longer kept, :exc:`spotify.Error` is
+        raised, and you should start over with :meth:`snapshot`.
+        """
+        oldest = self.version - len(self._changes)
+        if since < oldest:
+            raise spotify.Error(
+                'Changes since version %d are no longer available' % since)
+        return list(self._changes)[since - oldest:]
+
+    @serialized
+    def refresh(self):
+        """Read all the track URIs from the playlist again.
+
+        This increases :attr:`version` by one and clears all changes, so that
+        anyone following the changes must start over with :meth:`snapshot`.
+        """
+        self.version += 1
+        self._changes.clear()
+        self._reset()
+
+    def close(self):
+        """Stop listening to the playlist's events."""
+        for event, listener in self._listeners:
+            self.playlist.off(event, listener)
+
+    @serialized
+    def _reset(self):
+        self._tree = utils.PositionTree()
+        self._nodes = {}
+        self._insert(0, [track.link.uri for track in self.playlist.tracks])
+
+    def _insert(self, index, uris):
+        nodes = [utils.PositionTreeNode(uri) for uri in uris]
+        for node in nodes:
+            self._nodes.setdefault(node.value, set()).add(node)
+        self._tree.insert(index, nodes)
+
+    def _pop_all(self, indexes):
+        # Popping the highest index first keeps the lower indexes valid.
+        nodes = [self._tree.pop(i) for i in reversed(indexes)]
+        nodes.reverse()
+        return nodes
+
+    def _record(self, type_, uris, indexes, index):
+        self.version += 1
+        self._changes.append(PlaylistMirrorChange(
+            self.version, type_, uris, indexes, index))
+
+    @serialized
+    def _on_tracks_added(self, playlist, tracks, index):
+        uris = [track.link.uri for track in tracks]
+        self._insert(index, uris)
+        self._record('add', uris, None, index)
+
+    @serialized
+    def _on_tracks_removed(self, playlist, indexes):
+        indexes = sorted(set(indexes))
+        nodes = self._pop_all(indexes)
+        for node in nodes:
+            same_uri = self._nodes[node.value]
+            same_uri.discard(node)
+            if not same_uri:
+                del self._nodes[node.value]
+        self._record('remove', [node.value for node in nodes], indexes, None)
+
+    @serialized
+    def _on_tracks_moved(self, playlist, old_indexes, new_index):
+        old_indexes = sorted(set(old_indexes))
+        nodes = self._pop_all(old_indexes)
+        # The new index counts the moved tracks that were in front of it.
+        index = new_index - len([i for i in old_indexes if i < new_index])
+        self._tree.insert(index, nodes)
+        self._record(
+            'move', [node.value for node in nodes], old_indexes, new_index)
+
+
+class PlaylistMirrorChange(collections.namedtuple(
+        'PlaylistMirrorChange',
+        ['version', 'type', 'uris', 'indexes', 'index'])):
+
+    """A change to a playlist recorded by :class:`PlaylistMirror`."""
+    pass
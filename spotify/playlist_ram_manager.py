@@ -0,0 +1,181 @@
+from __future__ import unicode_literals
+
+import collections
+import logging
+import weakref
+
+import spotify
+from spotify import serialized, utils
+
+
+__all__ = [
+    'PlaylistRamManager',
+]
+
+logger = logging.getLogger(__name__)
+
+
+class PlaylistRamManager(utils.CacheStats):
+
+    """Keeps the most recently used playlists in RAM, within a budget.
+
+    This is useful together with
+    :attr:`~spotify.Config.initially_unload_playlists`, which makes
+    libspotify keep playlists on disk until :meth:`Playlist.set_in_ram` is
+    called. Get playlists through the manager with :meth:`get` to have them
+    loaded into RAM::
+
+        >>> manager = spotify.PlaylistRamManager(session, max_tracks=50000)
+        >>> playlist = manager.get(
+        ...     'spotify:user:fiat500c:playlist:54k50VZdvtnIPt4d8RBCmZ')
+        >>> playlist.is_in_ram
+        True
+
+    The budget is ``max_playlists`` playlists, ``max_tracks`` tracks in
+    total, or both. When the budget is exceeded, the least recently used
+    playlists are removed from RAM with ``set_in_ram(False)``. The number of
+    tracks in a playlist isn't known until the playlist is loaded, so it is
+    read again each time the playlist is got, and whenever the playlist
+    emits :attr:`~PlaylistEvent.PLAYLIST_STATE_CHANGED`,
+    :attr:`~PlaylistEvent.TRACKS_ADDED`, or
+    :attr:`~PlaylistEvent.TRACKS_REMOVED`. The most recently used playlist
+    is never removed from RAM to stay within the budget.
+
+    ``hits`` is the number of times a playlist was already in RAM, ``misses``
+    the number of times a playlist had to be put in RAM, and ``evictions``
+    the number of times a playlist was removed from RAM to stay within the
+    budget.
+    """
+
+    def __init__(self, session, max_playlists=None, max_tracks=None):
+        if max_playlists is None and max_tracks is None:
+            raise ValueError('max_playlists or max_tracks must be set')
+        self._session = session
+        self.max_playlists = max_playlists
+        self.max_tracks = max_tracks
+        self._playlists = collections.OrderedDict()
+        self._num_tracks = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # The listener only keeps a weak reference to the manager, so that
+        # the playlists don't keep the manager alive through a cycle.
+        manager_ref = weakref.ref(self)
+
+        def on_playlist_changed(playlist, *args):
+            manager = manager_ref()
+            if manager is not None:
+                manager._update(playlist)
+
+        self._on_playlist_changed = on_playlist_changed
+
+    max_playlists = None
+    """The maximum number of playlists to keep in RAM, or :class:`None` for
+    no limit."""
+
+    max_tracks = None
+    """The maximum total number of tracks in the playlists kept in RAM, or
+    :class:`None` for no limit."""
+
+    def __repr__(self):
+        return (
+            'PlaylistRamManager(playlists=%d, tracks=%d, '
+            'hits=%d, misses=%d, evictions=%d)' % (
+                len(self), self.num_tracks, self.hits, self.misses,
+                self.evictions))
+
+    def __len__(self):
+        return len(self._playlists)
+
+    def __contains__(self, playlist):
+        return playlist in self._playlists
+
+    @property
+    def num_tracks(self):
+        """The total number of tracks in the playlists kept in RAM."""
+        return self._num_tracks
+
+    @serialized
+    def get(self, playlist):
+        """Get the given ``playlist`` and make sure it is in RAM.
+
+        The ``playlist`` can be a :class:`Playlist` or a playlist URI.
+
+        The playlist becomes the most recently used, and the least recently
+        used playlists are removed from RAM until the budget is met again.
+        The playlist itself is never removed by this call, even if it alone
+        exceeds the budget.
+        """
+        if not isinstance(playlist, spotify.Playlist):
+            playlist = self._session.get_playlist(playlist)
+        if playlist in self._playlists:
+            self.hits += 1
+            self._num_tracks -= self._playlists.pop(playlist)
+        else:
+            self.misses += 1
+            playlist.set_in_ram(True)
+            for event in _EVENTS:
+                playlist.on(event, self._on_playlist_changed)
+        num_tracks = len(playlist.tracks)
+        self._playlists[playlist] = num_tracks
+        self._num_tracks += num_tracks
+        self._evict(keep=playlist)
+        return playlist
+
+    @serialized
+    def discard(self, playlist):
+        """Remove the given ``playlist`` from RAM, if it is kept in RAM by
+        the manager."""
+        if playlist in self._playlists:
+            self._remove(playlist)
+
+    @serialized
+    def clear(self):
+        """Remove all playlists kept in RAM by the manager from RAM, and
+        reset all counters to zero."""
+        while self._playlists:
+            self._remove(next(iter(self._playlists)))
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @serialized
+    def _update(self, playlist):
+        if playlist not in self._playlists:
+            return
+        num_tracks = len(playlist.tracks)
+        self._num_tracks += num_tracks - self._playlists[playlist]
+        self._playlists[playlist] = num_tracks
+        self._evict(keep=next(reversed(self._playlists)))
+
+    def _evict(self, keep):
+        while self._over_budget():
+            playlist = next(iter(self._playlists))
+            if playlist == keep:
+                break
+            self._remove(playlist)
+            self.evictions += 1
+
+    def _over_budget(self):
+        return (
+            (self.max_playlists is not None and
+                len(self._playlists) > self.max_playlists) or
+            (self.max_tracks is not None and
+                self._num_tracks > self.max_tracks))
+
+    def _remove(self, playlist):
+        self._num_tracks -= self._playlists.pop(playlist)
+        for event in _EVENTS:
+            playlist.off(event, self._on_playlist_changed)
+        try:
+            playlist.set_in_ram(False)
+        except spotify.Error as exc:
+            logger.warning('Failed to remove playlist from RAM: %s', exc)
+
+
+_EVENTS = [
+    spotify.PlaylistEvent.PLAYLIST_STATE_CHANGED,
+    spotify.PlaylistEvent.TRACKS_ADDED,
+    spotify.PlaylistEvent.TRACKS_REMOVED,
+]
@@ -21,6 +21,8 @@ class PlaylistTrack(object):
     :class:`PlaylistTrack`.
     """
 
+    __slots__ = ('_session', '_sp_playlist', '_index')
+
     def __init__(self, session, sp_playlist, index):
         self._session = session
 
@@ -51,7 +53,7 @@ class PlaylistTrack(object):
     @serialized
     def track(self):
         """The :class:`~spotify.Track`."""
-        return spotify.Track(
+        return spotify.Track._cached(
             self._session,
             sp_track=lib.sp_playlist_track(self._sp_playlist, self._index),
             add_ref=True)
@@ -68,7 +70,7 @@ class PlaylistTrack(object):
     @serialized
     def creator(self):
         """The :class:`~spotify.User` that added the track to the playlist."""
-        return spotify.User(
+        return spotify.User._cached(
             self._session,
             sp_user=lib.sp_playlist_track_creator(
                 self._sp_playlist, self._index),
@@ -24,8 +24,6 @@ class PlaylistUnseenTracks(collections.Sequence):
     Returned by :meth:`PlaylistContainer.get_unseen_tracks`.
     """
 
-    _BATCH_SIZE = 100
-
     @serialized
     def __init__(self, session, sp_playlistcontainer, sp_playlist):
         self._session = session
@@ -43,9 +41,12 @@ class PlaylistUnseenTracks(collections.Sequence):
 
     @serialized
     def _get_more_tracks(self):
-        self._sp_tracks_len = min(
-            self._num_tracks, self._sp_tracks_len + self._BATCH_SIZE)
+        # libspotify returns the total number of unseen tracks, so we can get
+        # them all at once with an array of exactly that size. The array is
+        # only replaced if the number of unseen tracks has grown since.
+        self._sp_tracks_len = self._num_tracks
         self._sp_tracks = ffi.new('sp_track *[]', self._sp_tracks_len)
+        self._tracks = {}
         self._num_tracks = lib.sp_playlistcontainer_get_unseen_tracks(
             self._sp_playlistcontainer, self._sp_playlist,
             self._sp_tracks, self._sp_tracks_len)
@@ -69,10 +70,26 @@ class PlaylistUnseenTracks(collections.Sequence):
             raise IndexError('list index out of range')
         while key >= self._sp_tracks_len:
             self._get_more_tracks()
-        sp_track = self._sp_tracks[key]
-        if sp_track == ffi.NULL:
-            return None
-        return spotify.Track(self._session, sp_track=sp_track, add_ref=True)
+        return self._get_track(key)
+
+    def __iter__(self):
+        if self._sp_tracks_len < self._num_tracks:
+            self._get_more_tracks()
+        for i in range(min(self._num_tracks, self._sp_tracks_len)):
+            yield self._get_track(i)
+
+    def _get_track(self, index):
+        # Track objects are kept, so that getting the same track again
+        # doesn't create a new Track object.
+        track = self._tracks.get(index)
+        if track is None:
+            sp_track = self._sp_tracks[index]
+            if sp_track == ffi.NULL:
+                return None
+            track = spotify.Track._cached(
+                self._session, sp_track=sp_track, add_ref=True)
+            self._tracks[index] = track
+        return track
 
     def __repr__(self):
         return 'PlaylistUnseenTracks(%s)' % pprint.pformat(list(self))
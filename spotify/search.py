@@ -1,5 +1,6 @@
 from __future__ import unicode_literals
 
+import collections
 import logging
 import threading
 
@@ -9,12 +10,17 @@ from spotify import ffi, lib, serialized, utils
 
 __all__ = [
     'Search',
+    'SearchBatchResult',
     'SearchPlaylist',
     'SearchType',
 ]
 
 logger = logging.getLogger(__name__)
 
+# libspotify doesn't document it, but returns at most 200 results of each type
+# per search.
+_MAX_PAGE_SIZE = 200
+
 
 class Search(object):
 
@@ -147,7 +153,7 @@ class Search(object):
 
         @serialized
         def get_track(sp_search, key):
-            return spotify.Track(
+            return spotify.Track._cached(
                 self._session,
                 sp_track=lib.sp_search_track(sp_search, key),
                 add_ref=True)
@@ -184,7 +190,7 @@ class Search(object):
 
         @serialized
         def get_album(sp_search, key):
-            return spotify.Album(
+            return spotify.Album._cached(
                 self._session,
                 sp_album=lib.sp_search_album(sp_search, key),
                 add_ref=True)
@@ -221,7 +227,7 @@ class Search(object):
 
         @serialized
         def get_artist(sp_search, key):
-            return spotify.Artist(
+            return spotify.Artist._cached(
                 self._session,
                 sp_artist=lib.sp_search_artist(sp_search, key),
                 add_ref=True)
@@ -315,10 +321,108 @@ class Search(object):
             playlist_offset=playlist_offset, playlist_count=playlist_count,
             search_type=self.search_type)
 
+    def iter_tracks(
+            self, page_size=_MAX_PAGE_SIZE, concurrency=1, max_results=None,
+            timeout=None):
+        """Iterate over all the tracks matching the search query.
+
+        The iteration starts with the tracks in this search, and continues
+        with new searches for the following pages of up to ``page_size``
+        tracks each, until :attr:`track_total` tracks or ``max_results``
+        tracks have been returned. The page size is capped at 200 tracks,
+        which is the most libspotify returns per search.
+
+        While the tracks of one page are returned, the searches for the next
+        ``concurrency`` pages are already running. Each search is waited for
+        up to ``timeout`` seconds, like with :meth:`load`.
+        """
+        return self._iter_results(
+            'track', page_size, concurrency, max_results, timeout)
+
+    def iter_albums(
+            self, page_size=_MAX_PAGE_SIZE, concurrency=1, max_results=None,
+            timeout=None):
+        """Iterate over all the albums matching the search query.
+
+        See :meth:`iter_tracks` for details.
+        """
+        return self._iter_results(
+            'album', page_size, concurrency, max_results, timeout)
+
+    def iter_artists(
+            self, page_size=_MAX_PAGE_SIZE, concurrency=1, max_results=None,
+            timeout=None):
+        """Iterate over all the artists matching the search query.
+
+        See :meth:`iter_tracks` for details.
+        """
+        return self._iter_results(
+            'artist', page_size, concurrency, max_results, timeout)
+
+    def iter_playlists(
+            self, page_size=_MAX_PAGE_SIZE, concurrency=1, max_results=None,
+            timeout=None):
+        """Iterate over all the playlists matching the search query, as
+        :class:`SearchPlaylist` objects.
+
+        See :meth:`iter_tracks` for details.
+        """
+        return self._iter_results(
+            'playlist', page_size, concurrency, max_results, timeout)
+
+    def _iter_results(
+            self, kind, page_size, concurrency, max_results, timeout):
+        if concurrency < 1:
+            raise ValueError('concurrency must be at least 1')
+        page_size = max(1, min(page_size, _MAX_PAGE_SIZE))
+        return self._iter_pages(
+            kind, page_size, concurrency, max_results, timeout)
+
+    def _iter_pages(self, kind, page_size, concurrency, max_results, timeout):
+        self.load(timeout=timeout)
+        query = self.query
+        offset = getattr(self, '%s_offset' % kind)
+        end = getattr(self, '%s_total' % kind)
+        if max_results is not None:
+            end = min(end, offset + max_results)
+        next_offset = offset + len(getattr(self, '%ss' % kind))
+
+        pages = collections.deque([self])
+        while pages:
+            # Start the searches for the next pages before returning the
+            # results of this page.
+            while len(pages) <= concurrency and next_offset < end:
+                pages.append(self._search_page(
+                    query, kind, next_offset,
+                    min(page_size, end - next_offset)))
+                next_offset += page_size
+            page = pages.popleft()
+            results = getattr(page.load(timeout=timeout), '%ss' % kind)
+            if page is not self and len(results) == 0:
+                return
+            for result in results:
+                if offset >= end:
+                    return
+                yield result
+                offset += 1
+
+    def _search_page(self, query, kind, offset, count):
+        kwargs = {
+            'track_count': 0,
+            'album_count': 0,
+            'artist_count': 0,
+            'playlist_count': 0,
+        }
+        kwargs['%s_offset' % kind] = offset
+        kwargs['%s_count' % kind] = count
+        # Made through the session, so that Session.search_cache is used
+        return self._session.search(
+            query, search_type=self.search_type, **kwargs)
+
     @property
     def link(self):
         """A :class:`Link` to the search."""
-        return spotify.Link(
+        return spotify.Link._cached(
             self._session,
             sp_link=lib.sp_link_create_from_search(self._sp_search),
             add_ref=False)
@@ -343,20 +447,28 @@ class SearchPlaylist(object):
 
     """A playlist matching a search query."""
 
-    name = None
-    """The name of the playlist."""
-
-    uri = None
-    """The URI of the playlist."""
-
-    image_uri = None
-    """The URI of the playlist's image."""
+    __slots__ = ('_session', '_name', '_uri', '_image_uri')
 
     def __init__(self, session, name, uri, image_uri):
         self._session = session
-        self.name = name
-        self.uri = uri
-        self.image_uri = image_uri
+        self._name = name
+        self._uri = uri
+        self._image_uri = image_uri
+
+    @property
+    def name(self):
+        """The name of the playlist."""
+        return self._name
+
+    @property
+    def uri(self):
+        """The URI of the playlist."""
+        return self._uri
+
+    @property
+    def image_uri(self):
+        """The URI of the playlist's image."""
+        return self._image_uri
 
     def __repr__(self):
         return 'SearchPlaylist(name=%r, uri=%r)' % (self.name, self.uri)
@@ -377,3 +489,10 @@ class SearchPlaylist(object):
 @utils.make_enum('SP_SEARCH_')
 class SearchType(utils.IntEnum):
     pass
+
+
+class SearchBatchResult(collections.namedtuple(
+        'SearchBatchResult', ['query', 'search', 'wait_time', 'duration'])):
+
+    """A completed search, as returned by :meth:`Session.search_many`."""
+    pass
@@ -0,0 +1,83 @@
+from __future__ import unicode_literals
+
+import functools
+
+import spotify
+from spotify import utils
+
+
+__all__ = [
+    'SearchCache',
+]
+
+
+class SearchCache(utils.RequestCache):
+
+    """Keeps the results of recent searches, so that repeating a search
+    doesn't make a new search request to Spotify.
+
+    To cache all searches made with :meth:`Session.search`, set
+    :attr:`Session.search_cache` to a cache::
+
+        >>> session.search_cache = spotify.SearchCache(
+        ...     session, max_size=1000, ttl=300)
+        >>> search = session.search('massive attack').load()
+        >>> session.search('massive attack') is search
+        True
+
+    Searches are keyed by their query, offsets, counts, and search type. At
+    most ``max_size`` searches are kept, and when the cache is full the least
+    recently used search is evicted. A search is kept for at most ``ttl``
+    seconds after it was started, or forever if ``ttl`` is :class:`None`.
+    Searches that fail are not kept once they complete.
+
+    If an identical search is still in progress, the same :class:`Search` is
+    returned instead of starting another one, and the ``callback`` is called
+    when the shared search completes. If the search has already completed,
+    the ``callback`` is called right away.
+
+    ``hits`` is the number of searches answered with a completed search,
+    ``coalesced`` the number of searches that joined a search in progress,
+    and ``misses`` the number of searches that had to be sent to Spotify.
+    """
+
+    def __init__(self, session, max_size=1000, ttl=300):
+        super(SearchCache, self).__init__(max_size=max_size, max_age=ttl)
+        self._session = session
+
+    @property
+    def ttl(self):
+        """The number of seconds to keep a search, or :class:`None` to keep
+        searches until they are evicted."""
+        return self.max_age
+
+    @ttl.setter
+    def ttl(self, value):
+        self.max_age = value
+
+    def search(
+            self, query, callback=None,
+            track_offset=0, track_count=20,
+            album_offset=0, album_count=20,
+            artist_offset=0, artist_count=20,
+            playlist_offset=0, playlist_count=20,
+            search_type=None):
+        """Get the :class:`Search` for the given arguments from the cache, or
+        start a new search if it isn't cached.
+
+        Takes the same arguments as :meth:`Session.search`.
+        """
+        if search_type is None:
+            search_type = spotify.SearchType.STANDARD
+        key = (
+            query, track_offset, track_count, album_offset, album_count,
+            artist_offset, artist_count, playlist_offset, playlist_count,
+            search_type)
+        create = functools.partial(
+            spotify.Search, self._session, query=query,
+            track_offset=track_offset, track_count=track_count,
+            album_offset=album_offset, album_count=album_count,
+            artist_offset=artist_offset, artist_count=artist_count,
+            playlist_offset=playlist_offset, playlist_count=playlist_count,
+            search_type=search_type)
+        return self.get(key, create, callback=callback)
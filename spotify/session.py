@@ -1,6 +1,9 @@
 from __future__ import unicode_literals
 
+import collections
+import functools
 import logging
+import time
 import weakref
 
 import spotify
@@ -64,6 +67,16 @@ class Session(utils.EventEmitter):
         self._cache = weakref.WeakValueDictionary()
         self._emitters = []
         self._callback_handles = set()
+        self._metadata_generation = 0
+
+        self.memoize_metadata = False
+        self.memo_stats = utils.MemoStats()
+
+        self.intern_strings = False
+        self.string_cache = utils.InternCache()
+
+        self.search_cache = None
+        self.browse_cache = None
 
         self.connection = spotify.connection.Connection(self)
         self.offline = spotify.offline.Offline(self)
@@ -109,6 +122,15 @@ class Session(utils.EventEmitter):
     Internal attribute.
     """
 
+    _metadata_generation = None
+    """A counter that is increased every time metadata is updated.
+
+    Used by :func:`~spotify.utils.memoize_loaded` to find out if memoized
+    metadata is still valid.
+
+    Internal attribute.
+    """
+
     config = None
     """A :class:`Config` instance with the current configuration.
 
@@ -131,6 +153,49 @@ class Session(utils.EventEmitter):
     """A :class:`~spotify.social.Social` instance for controlling social
     sharing."""
 
+    memoize_metadata = None
+    """Whether to memoize the metadata of loaded objects.
+
+    Defaults to :class:`False`. If set to :class:`True`, metadata that never
+    changes once an object is loaded, like a track's name, duration, and
+    artists, is fetched from libspotify once and then kept on the object until
+    the next :attr:`~SessionEvent.METADATA_UPDATED` event.
+    """
+
+    memo_stats = None
+    """A :class:`~spotify.utils.MemoStats` instance counting the hits and
+    misses of the metadata memoization enabled by :attr:`memoize_metadata`."""
+
+    intern_strings = None
+    """Whether to share string objects between equal names.
+
+    Defaults to :class:`False`. If set to :class:`True`, the names of albums,
+    artists, and playlists are looked up in :attr:`string_cache`, so that an
+    artist name shared by thousands of tracks is only kept in memory once.
+    """
+
+    string_cache = None
+    """A :class:`~spotify.utils.InternCache` instance holding the strings
+    shared when :attr:`intern_strings` is enabled.
+
+    Replace it with a new instance to change the max number of strings kept.
+    """
+
+    search_cache = None
+    """A :class:`SearchCache` used by :meth:`search`, or :class:`None` to
+    send every search to Spotify.
+
+    Defaults to :class:`None`.
+    """
+
+    browse_cache = None
+    """A :class:`BrowseCache` used by :meth:`Album.browse` and
+    :meth:`Artist.browse`, or :class:`None` to make a new request to Spotify
+    for every browser.
+
+    Defaults to :class:`None`.
+    """
+
     def login(self, username, password=None, remember_me=False, blob=None):
         """Authenticate to Spotify's servers.
 
@@ -200,7 +265,7 @@ class Session(utils.EventEmitter):
         sp_user = lib.sp_session_user(self._sp_session)
         if sp_user == ffi.NULL:
             return None
-        return spotify.User(self, sp_user=sp_user, add_ref=True)
+        return spotify.User._cached(self, sp_user=sp_user, add_ref=True)
 
     @property
     @serialized
@@ -390,6 +455,37 @@ class Session(utils.EventEmitter):
         """
         return spotify.Track(self, uri=uri)
 
+    def get_tracks(self, uris, load=False, timeout=None):
+        """
+        Get :class:`Track` objects for many Spotify track URIs at once.
+
+        This is faster than calling :meth:`get_track` for each URI, as all the
+        URIs are resolved at once, and repeated URIs are only resolved once.
+
+        Returns a list with a :class:`Track` for each URI in ``uris``, in the
+        same order. If a URI can't be resolved, the list contains a
+        :exc:`ValueError` instead of a track, so that one bad URI doesn't stop
+        you from getting the other tracks.
+
+        If ``load`` is :class:`True`, the method blocks until all the tracks
+        are loaded, or until ``timeout`` seconds have passed, like
+        :meth:`Track.load`. Tracks that fail to load are replaced with a
+        :exc:`LibError` in the returned list.
+
+        Example::
+
+            >>> session = spotify.Session()
+            # ...
+            >>> session.get_tracks([
+            ...     'spotify:track:2Foc5Q5nqNiosCNqttzHof',
+            ...     'spotify:track:foo'])
+            [Track(u'spotify:track:2Foc5Q5nqNiosCNqttzHof'),
+             ValueError(u"Failed to get track from Spotify URI: 'spotify:..."]
+        """
+        return self._get_many(
+            uris, spotify.Track, lib.sp_link_as_track, 'track',
+            load, timeout)
+
     def get_local_track(
             self, artist=None, title=None, album=None, length=None):
         """
@@ -440,7 +536,7 @@ class Session(utils.EventEmitter):
         album = utils.to_char(album)
         sp_track = lib.sp_localtrack_create(artist, title, album, length)
 
-        return spotify.Track(self, sp_track=sp_track, add_ref=False)
+        return spotify.Track._cached(self, sp_track=sp_track, add_ref=False)
 
     def get_album(self, uri):
         """
@@ -457,6 +553,16 @@ class Session(utils.EventEmitter):
         """
         return spotify.Album(self, uri=uri)
 
+    def get_albums(self, uris, load=False, timeout=None):
+        """
+        Get :class:`Album` objects for many Spotify album URIs at once.
+
+        Works like :meth:`get_tracks`, but for albums.
+        """
+        return self._get_many(
+            uris, spotify.Album, lib.sp_link_as_album, 'album',
+            load, timeout)
+
     def get_artist(self, uri):
         """
         Get :class:`Artist` from a Spotify artist URI.
@@ -472,6 +578,53 @@ class Session(utils.EventEmitter):
         """
         return spotify.Artist(self, uri=uri)
 
+    def get_artists(self, uris, load=False, timeout=None):
+        """
+        Get :class:`Artist` objects for many Spotify artist URIs at once.
+
+        Works like :meth:`get_tracks`, but for artists.
+        """
+        return self._get_many(
+            uris, spotify.Artist, lib.sp_link_as_artist, 'artist',
+            load, timeout)
+
+    def _get_many(self, uris, cls, as_func, name, load, timeout):
+        uris = list(uris)
+        objs = self._resolve_uris(set(uris), cls, as_func, name)
+        if load:
+            utils.load_all(
+                self,
+                set(obj for obj in objs.values()
+                    if not isinstance(obj, Exception)),
+                timeout=timeout)
+            for uri, obj in objs.items():
+                error_type = getattr(obj, 'error', spotify.ErrorType.OK)
+                if error_type not in (
+                        spotify.ErrorType.OK, spotify.ErrorType.IS_LOADING):
+                    objs[uri] = spotify.LibError(error_type)
+        return [objs[uri] for uri in uris]
+
+    @serialized
+    def _resolve_uris(self, uris, cls, as_func, name):
+        objs = {}
+        for uri in uris:
+            sp_link = lib.sp_link_create_from_string(
+                utils.to_char(spotify.Link._normalize_uri(uri)))
+            if sp_link == ffi.NULL:
+                objs[uri] = ValueError(
+                    'Failed to get %s from Spotify URI: %r' % (name, uri))
+                continue
+            try:
+                sp_obj = as_func(sp_link)
+                if sp_obj == ffi.NULL:
+                    objs[uri] = ValueError(
+                        'Failed to get %s from Spotify URI: %r' % (name, uri))
+                else:
+                    objs[uri] = cls._cached(self, sp_obj, add_ref=True)
+            finally:
+                lib.sp_link_release(sp_link)
+        return objs
+
     def get_playlist(self, uri):
         """
         Get :class:`Playlist` from a Spotify playlist URI.
@@ -554,8 +707,20 @@ class Session(utils.EventEmitter):
         ``search_type`` is a :class:`SearchType` value. It defaults to
         :attr:`SearchType.STANDARD`.
 
+        If :attr:`search_cache` is set, the search is looked up in the cache
+        first.
+
         Returns a :class:`Search` instance.
         """
+        if self.search_cache is not None:
+            return self.search_cache.search(
+                query, callback=callback,
+                track_offset=track_offset, track_count=track_count,
+                album_offset=album_offset, album_count=album_count,
+                artist_offset=artist_offset, artist_count=artist_count,
+                playlist_offset=playlist_offset,
+                playlist_count=playlist_count,
+                search_type=search_type)
         return spotify.Search(
             self, query=query, callback=callback,
             track_offset=track_offset, track_count=track_count,
@@ -564,6 +729,105 @@ class Session(utils.EventEmitter):
             playlist_offset=playlist_offset, playlist_count=playlist_count,
             search_type=search_type)
 
+    def search_many(
+            self, queries, concurrency=10, max_rate=None, timeout=None,
+            **kwargs):
+        """
+        Search Spotify for many queries, and iterate over the searches as they
+        complete.
+
+        At most ``concurrency`` searches are in progress at a time, and if
+        ``max_rate`` is set, at most ``max_rate`` searches are started per
+        second. Any other keyword arguments, like ``track_count`` and
+        ``search_type``, are passed on to :meth:`search` for every query,
+        except ``callback``, as the searches are yielded instead.
+
+        While iterating, :meth:`process_events` is called to make the
+        searches progress, so the iteration must happen in the thread you
+        use for accessing Spotify, and not while an
+        :class:`~spotify.EventLoop` is running.
+
+        Yields a :class:`SearchBatchResult` per query, in the order the
+        searches complete, with the time each query waited before its search
+        was started and the time the search took. Failed searches are
+        yielded too, so check the :attr:`~Search.error` of each search.
+
+        If a search hasn't completed after ``timeout`` seconds,
+        :exc:`~spotify.Timeout` is raised. If unspecified, the ``timeout``
+        defaults to 10s.
+
+        Example::
+
+            >>> session = spotify.Session()
+            # ...
+            >>> for result in session.search_many(
+            ...         ['massive attack', 'portishead'], track_count=1):
+            ...     print(result.query, result.search.tracks[0].name)
+            massive attack Teardrop
+            portishead Glory Box
+        """
+        if concurrency < 1:
+            raise ValueError('concurrency must be at least 1')
+        if max_rate is not None and max_rate <= 0:
+            raise ValueError('max_rate must be greater than 0')
+        if 'callback' in kwargs:
+            raise TypeError('search_many() does not take a callback')
+        return self._search_many(
+            list(queries), concurrency, max_rate, timeout, kwargs)
+
+    def _search_many(self, queries, concurrency, max_rate, timeout, kwargs):
+        if not queries:
+            return
+        if self.connection.state is not spotify.ConnectionState.LOGGED_IN:
+            raise spotify.Error(
+                'Session must be logged in and online to search: %r'
+                % self.connection.state)
+        if timeout is None:
+            timeout = 10
+        interval = 0 if max_rate is None else 1.0 / max_rate
+
+        queued = collections.deque(enumerate(queries))
+        completed = collections.deque()
+        in_flight = {}
+        started_at = time.time()
+        next_start = started_at
+
+        def search_complete(index, search):
+            completed.append((index, search, time.time()))
+
+        while queued or in_flight or completed:
+            while completed:
+                index, search, completed_at = completed.popleft()
+                search_started_at = in_flight.pop(index)
+                yield spotify.SearchBatchResult(
+                    query=queries[index], search=search,
+                    wait_time=search_started_at - started_at,
+                    duration=completed_at - search_started_at)
+
+            now = time.time()
+            while queued and len(in_flight) < concurrency and (
+                    now >= next_start):
+                index, query = queued.popleft()
+                in_flight[index] = now
+                next_start = max(next_start, now) + interval
+                self.search(
+                    query, callback=functools.partial(search_complete, index),
+                    **kwargs)
+
+            if completed:
+                # Searches completed right away, e.g. from the search cache
+                continue
+            if not in_flight:
+                # Waiting for the rate limit to allow the next search
+                time.sleep(max(0, next_start - time.time()))
+                continue
+            if time.time() > min(in_flight.values()) + timeout:
+                raise spotify.Timeout(timeout)
+            self.process_events()
+
+            # See utils.load() on why this is a tight loop.
+            time.sleep(0.001)
+
     def get_toplist(
             self, type=None, region=None, canonical_username=None,
             callback=None):
@@ -940,6 +1204,7 @@ class _SessionCallbacks(object):
         if not spotify._session_instance:
             return
         logger.debug('Metadata updated')
+        spotify._session_instance._metadata_generation += 1
         spotify._session_instance.emit(
             SessionEvent.METADATA_UPDATED, spotify._session_instance)
 
@@ -148,7 +148,7 @@ class Toplist(object):
 
         @serialized
         def get_track(sp_toplistbrowse, key):
-            return spotify.Track(
+            return spotify.Track._cached(
                 self._session,
                 sp_track=lib.sp_toplistbrowse_track(sp_toplistbrowse, key),
                 add_ref=True)
@@ -173,7 +173,7 @@ class Toplist(object):
 
         @serialized
         def get_album(sp_toplistbrowse, key):
-            return spotify.Album(
+            return spotify.Album._cached(
                 self._session,
                 sp_album=lib.sp_toplistbrowse_album(sp_toplistbrowse, key),
                 add_ref=True)
@@ -198,7 +198,7 @@ class Toplist(object):
 
         @serialized
         def get_artist(sp_toplistbrowse, key):
-            return spotify.Artist(
+            return spotify.Artist._cached(
                 self._session,
                 sp_artist=lib.sp_toplistbrowse_artist(sp_toplistbrowse, key),
                 add_ref=True)
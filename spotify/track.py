@@ -25,6 +25,28 @@ class Track(object):
         u'Get Lucky'
     """
 
+    __slots__ = ('_session', '_sp_track', '_memo', '__weakref__')
+
+    @classmethod
+    @serialized
+    def _cached(cls, session, sp_track, add_ref=True):
+        """
+        Get :class:`Track` instance for the given ``sp_track``. If it already
+        exists, it is retrieved from cache.
+
+        Internal method.
+        """
+        track = session._cache.get(sp_track)
+        if isinstance(track, Track):
+            if not add_ref:
+                # We were given a reference we don't need, as the cached
+                # instance already holds one.
+                lib.sp_track_release(sp_track)
+            return track
+        track = Track(session, sp_track=sp_track, add_ref=add_ref)
+        session._cache[sp_track] = track
+        return track
+
     def __init__(self, session, uri=None, sp_track=None, add_ref=True):
         assert uri or sp_track, 'uri or sp_track is required'
 
@@ -36,11 +58,13 @@ class Track(object):
                 raise ValueError(
                     'Failed to get track from Spotify URI: %r' % uri)
             sp_track = track._sp_track
+            session._cache[sp_track] = self
             add_ref = True
 
         if add_ref:
             lib.sp_track_add_ref(sp_track)
         self._sp_track = ffi.gc(sp_track, lib.sp_track_release)
+        self._memo = None
 
     def __repr__(self):
         return 'Track(%r)' % self.link.uri
@@ -150,7 +174,7 @@ class Track(object):
             self.error, ignores=[spotify.ErrorType.IS_LOADING])
         if not self.is_loaded:
             return None
-        return Track(
+        return Track._cached(
             self._session,
             sp_track=lib.sp_track_get_playable(
                 self._session._sp_session, self._sp_track),
@@ -206,6 +230,7 @@ class Track(object):
             bool(value)))
 
     @property
+    @utils.memoize_loaded
     @serialized
     def artists(self):
         """The artists performing on the track.
@@ -219,7 +244,7 @@ class Track(object):
 
         @serialized
         def get_artist(sp_track, key):
-            return spotify.Artist(
+            return spotify.Artist._cached(
                 self._session,
                 sp_artist=lib.sp_track_artist(sp_track, key),
                 add_ref=True)
@@ -232,6 +257,7 @@ class Track(object):
             getitem_func=get_artist)
 
     @property
+    @utils.memoize_loaded
     @serialized
     def album(self):
         """The album of the track.
@@ -243,9 +269,11 @@ class Track(object):
         if not self.is_loaded:
             return None
         sp_album = lib.sp_track_album(self._sp_track)
-        return spotify.Album(self._session, sp_album=sp_album, add_ref=True)
+        return spotify.Album._cached(
+            self._session, sp_album=sp_album, add_ref=True)
 
     @property
+    @utils.memoize_loaded
     @serialized
     def name(self):
         """The track's name.
@@ -259,6 +287,7 @@ class Track(object):
         return utils.to_unicode(lib.sp_track_name(self._sp_track))
 
     @property
+    @utils.memoize_loaded
     def duration(self):
         """The track's duration in milliseconds.
 
@@ -283,6 +312,7 @@ class Track(object):
         return lib.sp_track_popularity(self._sp_track)
 
     @property
+    @utils.memoize_loaded
     def disc(self):
         """The track's disc number. 1 or higher.
 
@@ -296,6 +326,7 @@ class Track(object):
         return lib.sp_track_disc(self._sp_track)
 
     @property
+    @utils.memoize_loaded
     def index(self):
         """The track's index number. 1 or higher.
 
@@ -316,7 +347,7 @@ class Track(object):
     def link_with_offset(self, offset):
         """A :class:`Link` to the track with an ``offset`` in milliseconds into
         the track."""
-        return spotify.Link(
+        return spotify.Link._cached(
             self._session,
             sp_link=lib.sp_link_create_from_track(self._sp_track, offset),
             add_ref=False)
@@ -23,6 +23,28 @@ class User(object):
         u'jodal'
     """
 
+    __slots__ = ('_session', '_sp_user', '__weakref__')
+
+    @classmethod
+    @serialized
+    def _cached(cls, session, sp_user, add_ref=True):
+        """
+        Get :class:`User` instance for the given ``sp_user``. If it already
+        exists, it is retrieved from cache.
+
+        Internal method.
+        """
+        user = session._cache.get(sp_user)
+        if isinstance(user, User):
+            if not add_ref:
+                # We were given a reference we don't need, as the cached
+                # instance already holds one.
+                lib.sp_user_release(sp_user)
+            return user
+        user = User(session, sp_user=sp_user, add_ref=add_ref)
+        session._cache[sp_user] = user
+        return user
+
     def __init__(self, session, uri=None, sp_user=None, add_ref=True):
         assert uri or sp_user, 'uri or sp_user is required'
 
@@ -34,6 +56,7 @@ class User(object):
                 raise ValueError(
                     'Failed to get user from Spotify URI: %r' % uri)
             sp_user = user._sp_user
+            session._cache[sp_user] = self
             add_ref = True
 
         if add_ref:
@@ -73,7 +96,7 @@ class User(object):
     @property
     def link(self):
         """A :class:`Link` to the user."""
-        return spotify.Link(
+        return spotify.Link._cached(
             self._session,
             sp_link=lib.sp_link_create_from_user(self._sp_user), add_ref=False)
 
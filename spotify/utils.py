@@ -2,14 +2,19 @@ from __future__ import unicode_literals
 
 import collections
 import functools
+import logging
 import pprint
+import random
 import sys
+import threading
 import time
 
 import spotify
 from spotify import ffi, lib, serialized
 
 
+logger = logging.getLogger(__name__)
+
 PY2 = sys.version_info[0] == 2
 
 if PY2:  # pragma: no branch
@@ -115,20 +120,36 @@ class _Listener(collections.namedtuple(
     """An listener of events from an :class:`EventEmitter`"""
 
 
+_MAX_TABLE_LENGTH = 256
+
+
 class IntEnum(int):
 
     """An enum type for values mapping to integers.
 
     Tries to stay as close as possible to the enum type specified in
     :pep:`435` and introduced in Python 3.4.
+
+    Enums created with :func:`make_enum` get a lookup table of all their
+    values, so that getting an enum value from an integer is a single index
+    into a tuple.
     """
 
+    _table = ()
+
     def __new__(cls, value):
-        if not hasattr(cls, '_values'):
-            cls._values = {}
-        if value not in cls._values:
-            cls._values[value] = int.__new__(cls, value)
-        return cls._values[value]
+        try:
+            member = cls._table[value]
+            if member == value:
+                return member
+        except (IndexError, TypeError):
+            pass
+        values = cls.__dict__.get('_values')
+        if values is None:
+            values = cls._values = {}
+        if value not in values:
+            values[value] = int.__new__(cls, value)
+        return values[value]
 
     def __repr__(self):
         if hasattr(self, '_name'):
@@ -143,6 +164,20 @@ class IntEnum(int):
         attr._name = name
         setattr(cls, name, attr)
 
+    @classmethod
+    def _make_table(cls):
+        """Make a lookup table of all the enum's values, indexed by value.
+
+        The table is only made if all values are small non-negative integers.
+        """
+        values = cls.__dict__.get('_values')
+        if not values or min(values) < 0 or max(values) >= _MAX_TABLE_LENGTH:
+            return
+        table = [None] * (max(values) + 1)
+        for value, member in values.items():
+            table[value] = member
+        cls._table = tuple(table)
+
 
 def make_enum(lib_prefix, enum_prefix=''):
     """Class decorator for automatically adding enum values.
@@ -158,10 +193,38 @@ def make_enum(lib_prefix, enum_prefix=''):
             if attr.startswith(lib_prefix):
                 name = attr.replace(lib_prefix, enum_prefix)
                 cls.add(name, getattr(lib, attr))
+        cls._make_table()
         return cls
     return wrapper
 
 
+_MAX_POOLED_BUFFER_LENGTH = 1024
+
+_buffer_pool = threading.local()
+
+_buffer_lengths = {}
+
+
+def _get_buffer(length):
+    """Get a char buffer of at least ``length`` bytes.
+
+    Buffers up to :attr:`_MAX_POOLED_BUFFER_LENGTH` bytes are reused by later
+    calls from the same thread, so the buffer's content must be copied out of
+    it before the next call. A reused buffer is reset to an empty string, so
+    that a C function failing without writing to it doesn't return the
+    previous call's string.
+    """
+    if length > _MAX_POOLED_BUFFER_LENGTH:
+        return ffi.new('char[]', length)
+    buffer_ = getattr(_buffer_pool, 'buffer', None)
+    if buffer_ is None or len(buffer_) < length:
+        buffer_ = ffi.new('char[]', length)
+        _buffer_pool.buffer = buffer_
+    else:
+        buffer_[0] = b'\0'
+    return buffer_
+
+
 def get_with_fixed_buffer(buffer_length, func, *args):
     """Get a unicode string from a C function that takes a fixed-size buffer.
 
@@ -170,9 +233,8 @@ def get_with_fixed_buffer(buffer_length, func, *args):
 
     Returns the buffer's value decoded from UTF-8 to a unicode string.
     """
-    func = functools.partial(func, *args)
-    buffer_ = ffi.new('char[]', buffer_length)
-    func(buffer_, buffer_length)
+    buffer_ = _get_buffer(buffer_length)
+    func(*(args + (buffer_, buffer_length)))
     return to_unicode(buffer_)
 
 
@@ -181,22 +243,28 @@ def get_with_growing_buffer(func, *args):
     needed to return the full string.
 
     The C function ``func`` is called with any arguments given in ``args``, a
-    buffer of fixed size, and the buffer size. If the C function returns a
-    size that is larger than the buffer already filled, the C function is
-    called again with a buffer large enough to get the full string from the C
-    function.
+    buffer, and the buffer size. If the C function returns a size that is
+    larger than the buffer already filled, the C function is called again with
+    a buffer large enough to get the full string from the C function.
+
+    The initial buffer size is learned from earlier calls to the same C
+    function, so that most calls only need to call the C function once.
 
     Returns the buffer's value decoded from UTF-8 to a unicode string.
     """
-    func = functools.partial(func, *args)
-    actual_length = 10
-    buffer_length = actual_length
-    while actual_length >= buffer_length:
+    buffer_length = _buffer_lengths.get(func, 11)
+    while True:
+        buffer_ = _get_buffer(buffer_length)
+        buffer_length = len(buffer_)
+        actual_length = func(*(args + (buffer_, buffer_length)))
+        if actual_length < buffer_length:
+            break
         buffer_length = actual_length + 1
-        buffer_ = ffi.new('char[]', buffer_length)
-        actual_length = func(buffer_, buffer_length)
     if actual_length == -1:
         return None
+    if actual_length >= _buffer_lengths.get(func, 0):
+        _buffer_lengths[func] = min(
+            actual_length + 1, _MAX_POOLED_BUFFER_LENGTH)
     return to_unicode(buffer_)
 
 
@@ -258,6 +326,424 @@ def load(session, obj, timeout=None):
     return obj
 
 
+def _is_done_loading(obj):
+    error_type = getattr(obj, 'error', spotify.ErrorType.OK)
+    if error_type not in (spotify.ErrorType.OK, spotify.ErrorType.IS_LOADING):
+        return True
+    return obj.is_loaded
+
+
+def load_all(session, objs, timeout=None):
+    """Block until all the objects' data is loaded.
+
+    Works like :func:`load`, except that it waits for many objects at once,
+    and that objects with errors are not waited for, and no errors are
+    raised for them. Check the ``error`` attribute of the objects to find out
+    which failed to load.
+
+    After ``timeout`` seconds with some objects still loading
+    :exc:`~spotify.Timeout` is raised. If unspecified, the ``timeout``
+    defaults to 10s.
+
+    Returns the list of objects.
+    """
+    objs = list(objs)
+    pending = [obj for obj in objs if not _is_done_loading(obj)]
+    if not pending:
+        return objs
+
+    if session.connection.state is not spotify.ConnectionState.LOGGED_IN:
+        raise spotify.Error(
+            'Session must be logged in and online to load objects: %r'
+            % session.connection.state)
+
+    if timeout is None:
+        timeout = 10
+    deadline = time.time() + timeout
+
+    while True:
+        session.process_events()
+        pending = [obj for obj in pending if not _is_done_loading(obj)]
+        if not pending:
+            return objs
+        if time.time() > deadline:
+            raise spotify.Timeout(timeout)
+
+        # See load() on why this is a tight loop.
+        time.sleep(0.001)
+
+
+def memoize_loaded(func):
+    """Decorator for methods returning metadata that never changes once the
+    object is loaded.
+
+    If :attr:`spotify.Session.memoize_metadata` is :class:`True` and the
+    object is loaded, the result is stored on the object and returned on later
+    calls, without calling into libspotify. The stored results are discarded
+    after the next :attr:`~spotify.SessionEvent.METADATA_UPDATED` event.
+
+    The object must have ``_session``, ``_memo``, and ``is_loaded``
+    attributes. The ``_memo`` attribute must initially be :class:`None`.
+
+    The hits and misses are counted in :attr:`spotify.Session.memo_stats`.
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(self):
+        session = self._session
+        if not session.memoize_metadata:
+            return func(self)
+
+        memo = self._memo
+        generation = session._metadata_generation
+        if memo is None or memo[0] != generation:
+            if memo is not None:
+                session.memo_stats.invalidations += 1
+                self._memo = None
+            if not self.is_loaded:
+                return func(self)
+            memo = self._memo = (generation, {})
+
+        values = memo[1]
+        if name in values:
+            session.memo_stats.hits += 1
+            return values[name]
+        session.memo_stats.misses += 1
+        value = values[name] = func(self)
+        return value
+
+    return wrapper
+
+
+class CacheStats(object):
+
+    """Mixin for adding :attr:`hit_rate` to a class counting ``hits`` and
+    ``misses``.
+
+    If the class also counts ``coalesced`` lookups, which joined a request
+    that was already in progress, they are counted as hits.
+    """
+
+    __slots__ = ()
+
+    @property
+    def hit_rate(self):
+        """The share of lookups that were hits, from 0.0 to 1.0."""
+        hits = self.hits + getattr(self, 'coalesced', 0)
+        lookups = hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return float(hits) / lookups
+
+
+class MemoStats(CacheStats):
+
+    """Counters for the metadata memoized by :func:`memoize_loaded`.
+
+    ``hits`` is the number of lookups answered from the memo, ``misses`` is
+    the number of lookups that had to call libspotify, and ``invalidations``
+    is the number of memos discarded because metadata was updated. Use them to
+    find out if :attr:`spotify.Session.memoize_metadata` is worthwhile for your
+    application.
+    """
+
+    __slots__ = ('hits', 'misses', 'invalidations')
+
+    def __init__(self):
+        self.reset()
+
+    def __repr__(self):
+        return 'MemoStats(hits=%d, misses=%d, invalidations=%d)' % (
+            self.hits, self.misses, self.invalidations)
+
+    def reset(self):
+        """Reset all counters to zero."""
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+
+class RequestCache(CacheStats):
+
+    """Bounded cache of requests to Spotify that complete asynchronously, like
+    searches and browsers, which shares requests that are still in progress.
+
+    At most ``max_size`` requests are kept, and when the cache is full the
+    least recently used request is evicted. A request is kept for at most
+    ``max_age`` seconds after it was created, or until it is evicted if
+    ``max_age`` is :class:`None`. Requests that fail are not kept once they
+    complete.
+
+    ``hits`` is the number of lookups answered with a completed request,
+    ``coalesced`` the number of lookups that joined a request in progress,
+    and ``misses`` the number of lookups that had to make a new request.
+    """
+
+    def __init__(self, max_size=1000, max_age=None):
+        self.max_size = max_size
+        self.max_age = max_age
+        self._entries = collections.OrderedDict()
+        self._waiting = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    max_size = None
+    """The maximum number of requests to keep."""
+
+    max_age = None
+    """The number of seconds to keep a request, or :class:`None` to keep
+    requests until they are evicted."""
+
+    def __repr__(self):
+        return '%s(size=%d, max_size=%d, hits=%d, misses=%d, coalesced=%d)' % (
+            self.__class__.__name__, len(self), self.max_size, self.hits,
+            self.misses, self.coalesced)
+
+    def __len__(self):
+        return len(self._entries)
+
+    @serialized
+    def get(self, key, create, callback=None, keep_alive=None):
+        """Get the request cached with the given ``key``, or make a new
+        request if it isn't cached.
+
+        ``create`` makes the new request. It is called with a ``callback``
+        keyword argument, which the request must call with itself when it
+        completes. ``keep_alive`` is kept with the request while it is
+        cached.
+
+        If the request is still in progress, ``callback`` is called with the
+        request when it completes. Else, it is called right away.
+        """
+        request = self._lookup(key)
+        if request is None:
+            self.misses += 1
+            request = self._create(key, create, keep_alive)
+        elif request in self._waiting:
+            self.coalesced += 1
+            self._waiting[request][0] += 1
+        else:
+            self.hits += 1
+            self._requests_saved(request, 1)
+            if callback is not None:
+                callback(request)
+            return request
+
+        if callback is not None:
+            self._waiting[request][1].append(callback)
+        return request
+
+    @serialized
+    def clear(self):
+        """Remove all requests from the cache, and reset all counters to
+        zero.
+
+        Callbacks waiting for requests in progress are still called when the
+        requests complete.
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def _lookup(self, key):
+        if key not in self._entries:
+            return None
+        request, keep_alive, expires = self._entries.pop(key)
+        if expires is not None and time.time() >= expires:
+            return None
+        self._entries[key] = (request, keep_alive, expires)
+        return request
+
+    def _create(self, key, create, keep_alive):
+        request = create(callback=functools.partial(self._complete, key))
+        # The number of coalesced lookups, and the callbacks to call
+        self._waiting[request] = [0, []]
+        expires = None if self.max_age is None else time.time() + self.max_age
+        self._entries[key] = (request, keep_alive, expires)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return request
+
+    @serialized
+    def _complete(self, key, request):
+        num_coalesced, callbacks = self._waiting.pop(request, [0, []])
+        if request.error is spotify.ErrorType.OK:
+            self._requests_saved(request, num_coalesced)
+        else:
+            logger.debug('Not caching failed request: %s', request.error)
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] is request:
+                del self._entries[key]
+        for callback in callbacks:
+            callback(request)
+
+    def _requests_saved(self, request, num_requests):
+        # Called when sharing ``request`` saved ``num_requests`` requests to
+        # Spotify. Subclasses can override this to count the savings.
+        pass
+
+
+class PositionTree(object):
+
+    """Sequence of :class:`PositionTreeNode` objects, which can find the
+    position of any node in the sequence.
+
+    The nodes are kept in a treap ordered by position, so inserting and
+    removing nodes, getting the node at an index, and getting the index of a
+    node take O(log n) expected time. Inserting k nodes at once takes O(k +
+    log n) expected time.
+    """
+
+    def __init__(self):
+        self._root = None
+
+    def __len__(self):
+        return _tree_size(self._root)
+
+    def __iter__(self):
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield node
+                node = node.right
+
+    def get(self, index):
+        """Get the node at the given ``index``, which must be in range."""
+        node = self._root
+        while True:
+            left_size = _tree_size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node
+            else:
+                index -= left_size + 1
+                node = node.right
+
+    def index(self, node):
+        """Get the index of the given ``node``, which must be in the tree."""
+        index = _tree_size(node.left)
+        while node.parent is not None:
+            if node is node.parent.right:
+                index += _tree_size(node.parent.left) + 1
+            node = node.parent
+        return index
+
+    def insert(self, index, nodes):
+        """Insert the given list of ``nodes`` at the given ``index``.
+
+        The nodes must not be in any tree.
+        """
+        left, right = _tree_split(self._root, index)
+        self._set_root(
+            _tree_merge(_tree_merge(left, _tree_build(nodes)), right))
+
+    def pop(self, index):
+        """Remove and return the node at the given ``index``.
+
+        The node can be inserted again, into this tree or another one.
+        """
+        left, right = _tree_split(self._root, index)
+        node, right = _tree_split(right, 1)
+        self._set_root(_tree_merge(left, right))
+        return node
+
+    def _set_root(self, root):
+        if root is not None:
+            root.parent = None
+        self._root = root
+
+
+class PositionTreeNode(object):
+
+    """A node holding a ``value`` in a :class:`PositionTree`."""
+
+    __slots__ = ('value', 'priority', 'size', 'parent', 'left', 'right')
+
+    def __init__(self, value):
+        self.value = value
+        self.priority = random.random()
+
+
+def _tree_size(node):
+    return 0 if node is None else node.size
+
+
+def _tree_update(node):
+    node.size = 1 + _tree_size(node.left) + _tree_size(node.right)
+    for child in (node.left, node.right):
+        if child is not None:
+            child.parent = node
+
+
+def _tree_build(nodes):
+    # Builds a treap of the nodes in the given order in O(n) time, by keeping
+    # the right spine of the tree built so far on a stack.
+    spine = []
+    for node in nodes:
+        node.left = node.right = None
+        last = None
+        while spine and spine[-1].priority < node.priority:
+            last = spine.pop()
+        node.left = last
+        if spine:
+            spine[-1].right = node
+        spine.append(node)
+    if not spine:
+        return None
+
+    # Every node comes after its parent in a pre-order walk, so updating the
+    # nodes in the reverse order updates the children before their parents.
+    order = [spine[0]]
+    for node in order:
+        order.extend(
+            child for child in (node.left, node.right) if child is not None)
+    for node in reversed(order):
+        _tree_update(node)
+    spine[0].parent = None
+    return spine[0]
+
+
+def _tree_split(node, index):
+    # Splits the tree into the first ``index`` nodes and the rest.
+    if node is None:
+        return None, None
+    node.parent = None
+    if index <= _tree_size(node.left):
+        left, node.left = _tree_split(node.left, index)
+        _tree_update(node)
+        return left, node
+    else:
+        node.right, right = _tree_split(
+            node.right, index - _tree_size(node.left) - 1)
+        _tree_update(node)
+        return node, right
+
+
+def _tree_merge(left, right):
+    # Merges two trees where all nodes in ``left`` come first.
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _tree_merge(left.right, right)
+        _tree_update(left)
+        return left
+    else:
+        right.left = _tree_merge(left, right.left)
+        _tree_update(right)
+        return right
+
+
 class Sequence(collections.Sequence):
 
     """Helper class for making sequences from a length and getitem function.
@@ -265,8 +751,15 @@ class Sequence(collections.Sequence):
     The ``sp_obj`` is assumed to already have gotten an extra reference through
     ``sp_*_add_ref`` and to be automatically released through ``sp_*_release``
     when the ``sp_obj`` object is GC-ed.
+
+    Iteration gets the items in growing batches of up to :attr:`batch_size`
+    items, holding the global lock while getting each batch.
     """
 
+    batch_size = 100
+    """Max number of items to get while holding the global lock when
+    iterating."""
+
     def __init__(
             self, sp_obj, add_ref_func, release_func, len_func, getitem_func):
 
@@ -280,17 +773,43 @@ class Sequence(collections.Sequence):
 
     def __getitem__(self, key):
         if isinstance(key, slice):
-            return list(self).__getitem__(key)
+            return self._get_items(range(*key.indices(self.__len__())))
         if not isinstance(key, int):
             raise TypeError(
                 'list indices must be int or slice, not %s' %
                 key.__class__.__name__)
+        length = self.__len__()
         if key < 0:
-            key += self.__len__()
-        if not 0 <= key < self.__len__():
+            key += length
+        if not 0 <= key < length:
             raise IndexError('list index out of range')
         return self._getitem_func(self._sp_obj, key)
 
+    def __iter__(self):
+        return self._iter_in_batches(range(self.__len__()))
+
+    def __reversed__(self):
+        return self._iter_in_batches(range(self.__len__() - 1, -1, -1))
+
+    def _iter_in_batches(self, indexes):
+        # Start with small batches and grow them up to the batch size, so that
+        # e.g. ``in`` doesn't get many more items than needed if it stops
+        # early.
+        start, size = 0, 1
+        while start < len(indexes):
+            for item in self._get_items(indexes[start:start + size]):
+                yield item
+            start += size
+            size = min(size * 2, self.batch_size)
+
+    @serialized
+    def _get_items(self, indexes):
+        # The sequence may have shrunk since the indexes were computed, e.g. if
+        # tracks were removed from a playlist while iterating over it.
+        length = self.__len__()
+        return [
+            self._getitem_func(self._sp_obj, i) for i in indexes if i < length]
+
     def __repr__(self):
         return '%s(%s)' % (
             self.__class__.__name__, pprint.pformat(list(self)))
@@ -336,6 +855,76 @@ def to_unicode(value):
         raise ValueError('Value must be text, bytes, or char[]')
 
 
+class InternCache(CacheStats):
+
+    """Bounded cache of unicode strings decoded from UTF-8 C strings.
+
+    Strings are keyed by their raw bytes, so that all lookups of the same
+    bytes return the same unicode string object instead of decoding and
+    allocating a new string each time. When the cache holds ``max_size``
+    strings, the least recently used string is evicted to make room for the
+    next one.
+
+    ``hits`` is the number of strings found in the cache, and ``misses`` is
+    the number of strings that had to be decoded.
+    """
+
+    __slots__ = ('max_size', 'hits', 'misses', '_strings')
+
+    def __init__(self, max_size=10000):
+        self.max_size = max_size
+        self._strings = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return 'InternCache(size=%d, max_size=%d, hits=%d, misses=%d)' % (
+            len(self), self.max_size, self.hits, self.misses)
+
+    def __len__(self):
+        return len(self._strings)
+
+    def to_unicode(self, value):
+        """Like :func:`to_unicode`, but returns the cached string if the same
+        bytes have been decoded before."""
+        if isinstance(value, ffi.CData):
+            value = ffi.string(value)
+        elif not isinstance(value, binary_type):
+            return to_unicode(value)
+        result = self._strings.pop(value, None)
+        if result is not None:
+            self.hits += 1
+            # Reinserted to mark the string as the most recently used
+            self._strings[value] = result
+            return result
+        self.misses += 1
+        result = value.decode('utf-8')
+        if len(self._strings) >= self.max_size > 0:
+            self._strings.popitem(last=False)
+        if self.max_size > 0:
+            self._strings[value] = result
+        return result
+
+    def clear(self):
+        """Remove all strings from the cache and reset all counters to
+        zero."""
+        self._strings.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def to_unicode_interned(session, value):
+    """Converts bytes and C char arrays to unicode strings, sharing string
+    objects through the session's :class:`InternCache`.
+
+    The cache is only used if :attr:`spotify.Session.intern_strings` is
+    :class:`True`. Else, this is the same as :func:`to_unicode`.
+    """
+    if session.intern_strings:
+        return session.string_cache.to_unicode(value)
+    return to_unicode(value)
+
+
 def to_unicode_or_none(value):
     """Converts C char arrays to unicode and C NULL values to None.
 
@@ -36,6 +36,7 @@ def buffer_writer(string):
         # encode and copy chars one by one.
         for i in range(length):
             buffer_[i] = string[i].encode('utf-8')
+        buffer_[length] = b'\0'
 
         return len(string)
 
@@ -56,6 +57,13 @@ def create_session_mock():
     session._cache = weakref.WeakValueDictionary()
     session._emitters = []
     session._callback_handles = set()
+    session._metadata_generation = 0
+    session.memoize_metadata = False
+    session.memo_stats = spotify.utils.MemoStats()
+    session.intern_strings = False
+    session.string_cache = spotify.utils.InternCache()
+    session.search_cache = None
+    session.browse_cache = None
     return session
 
 
@@ -0,0 +1,151 @@
+"""Benchmarks for pyspotify's hot paths.
+
+The benchmarks run against a mocked libspotify, so they don't need a Spotify
+account or a network connection. They aren't collected by py.test. Run them
+one at a time from the root of the source tree, e.g.::
+
+    python -m tests.benchmarks.music_delivery --help
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import contextlib
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    # Python < 3.4
+    tracemalloc = None
+
+import spotify
+
+import tests
+from tests import mock
+
+
+# Most precise clock available. time.perf_counter() was added in Python 3.3.
+clock = getattr(time, 'perf_counter', time.time)
+
+
+@contextlib.contextmanager
+def mocked_session():
+    """Context manager yielding a real :class:`spotify.Session` backed by a
+    mocked ``spotify.session.lib``."""
+    with mock.patch('spotify.session.lib', spec=spotify.lib) as lib_mock:
+        session = tests.create_real_session(lib_mock)
+        try:
+            yield session
+        finally:
+            spotify._session_instance = None
+
+
+def _noop(*args):
+    return 0
+
+
+class NoopLib(object):
+
+    """Stand-in for :attr:`spotify.lib` where all functions do nothing and
+    return 0, except the functions given as keyword arguments.
+
+    Unlike a :class:`mock.Mock`, it does not record calls, which would be
+    included in the measurements.
+    """
+
+    def __init__(self, **funcs):
+        self.__dict__.update(funcs)
+
+    def __getattr__(self, name):
+        return _noop
+
+
+@contextlib.contextmanager
+def patched_lib(modules, lib):
+    """Context manager replacing the ``lib`` attribute of the given spotify
+    modules with ``lib``."""
+    patchers = [mock.patch('%s.lib' % module, lib) for module in modules]
+    for patcher in patchers:
+        patcher.start()
+    try:
+        yield lib
+    finally:
+        for patcher in patchers:
+            patcher.stop()
+
+
+def percentile(sorted_values, percent):
+    """Get the ``percent`` percentile from a sorted list of values, using the
+    nearest-rank method."""
+    if not sorted_values:
+        return 0
+    rank = int(round(percent / 100 * (len(sorted_values) - 1)))
+    return sorted_values[rank]
+
+
+class AllocationTracker(object):
+
+    """Counts the memory blocks allocated by individual calls.
+
+    Uses :mod:`tracemalloc`, which is only available on Python 3.4 and newer.
+    On older Pythons, calls are passed through without any measurements.
+
+    The blocks are counted by comparing snapshots taken before and after each
+    call, so blocks that are allocated and freed again during the call are
+    not counted.
+    """
+
+    enabled = tracemalloc is not None
+
+    def __init__(self):
+        self.samples = []
+
+    def call(self, func, *args):
+        """Call ``func`` with ``args`` and return its result, recording the
+        number of blocks allocated during the call."""
+        if not self.enabled:
+            return func(*args)
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            result = func(*args)
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        # The first snapshot is allocated while tracing, so tracemalloc's own
+        # allocations must be left out.
+        own = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        stats = after.filter_traces(own).compare_to(
+            before.filter_traces(own), 'lineno')
+        self.samples.append(
+            sum(stat.count_diff for stat in stats if stat.count_diff > 0))
+        return result
+
+    @property
+    def mean_allocations(self):
+        """Mean number of blocks allocated per call, or :class:`None` if
+        nothing was measured."""
+        if not self.samples:
+            return None
+        return sum(self.samples) / len(self.samples)
+
+
+def timed(func, *args):
+    """Call ``func`` with ``args`` and return a tuple with the result and the
+    number of seconds the call took."""
+    start = clock()
+    result = func(*args)
+    return result, clock() - start
+
+
+def print_table(headers, rows):
+    """Print ``rows`` of values as a plain text table below ``headers``."""
+    rows = [[str(value) for value in row] for row in rows]
+    widths = [
+        max([len(str(header))] + [len(row[i]) for row in rows])
+        for i, header in enumerate(headers)]
+    print('  '.join(
+        str(header).rjust(width) for header, width in zip(headers, widths)))
+    for row in rows:
+        print('  '.join(
+            value.rjust(width) for value, width in zip(row, widths)))
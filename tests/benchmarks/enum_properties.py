@@ -0,0 +1,137 @@
+"""Benchmark of reading properties returning enum values.
+
+Reads properties like :attr:`spotify.Track.availability` and
+:attr:`spotify.connection.Connection.state` many times from a mocked
+libspotify. Each read creates one or more :class:`spotify.utils.IntEnum`
+values and most of them check for errors with
+:meth:`spotify.Error.maybe_raise`. For comparison, the same is done with
+:func:`_legacy_new` and :func:`_legacy_maybe_raise`, which work the way
+:class:`spotify.utils.IntEnum` and :meth:`spotify.Error.maybe_raise` did
+before enums got lookup tables.
+
+Example::
+
+    python -m tests.benchmarks.enum_properties --reads 1000000
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import argparse
+
+import spotify
+from spotify import ffi, utils
+
+import tests
+from tests import mock
+from tests.benchmarks import NoopLib, clock, patched_lib, print_table
+
+
+def _legacy_new(cls, value):
+    if not hasattr(cls, '_values'):
+        cls._values = {}
+    if value not in cls._values:
+        cls._values[value] = int.__new__(cls, value)
+    return cls._values[value]
+
+
+def _legacy_maybe_raise(cls, error_type, ignores=None):
+    ignores = set(ignores or [])
+    ignores.add(spotify.ErrorType.OK)
+    if error_type not in ignores:
+        raise spotify.LibError(error_type)
+
+
+def _fake_lib():
+    def error(sp_track):
+        return spotify.lib.SP_ERROR_OK
+
+    def is_loaded(sp_track):
+        return 1
+
+    def availability(sp_session, sp_track):
+        return spotify.lib.SP_TRACK_AVAILABILITY_AVAILABLE
+
+    def offline_status(sp_track):
+        return spotify.lib.SP_TRACK_OFFLINE_DONE
+
+    def connection_state(sp_session):
+        return spotify.lib.SP_CONNECTION_STATE_LOGGED_IN
+
+    return NoopLib(
+        sp_track_error=error,
+        sp_track_is_loaded=is_loaded,
+        sp_track_get_availability=availability,
+        sp_track_offline_get_status=offline_status,
+        sp_session_connectionstate=connection_state)
+
+
+_MODULES = ['spotify.connection', 'spotify.track']
+
+PROPERTIES = [
+    ('Track.error', lambda track, connection: track.error),
+    ('Track.availability', lambda track, connection: track.availability),
+    ('Track.offline_status', lambda track, connection: track.offline_status),
+    ('Connection.state', lambda track, connection: connection.state),
+    ('Error.maybe_raise', lambda track, connection: (
+        spotify.Error.maybe_raise(spotify.ErrorType.OK))),
+]
+
+
+def measure(func, reads, *args):
+    """Get the number of seconds it takes to call ``func`` with ``args``
+    ``reads`` times."""
+    started = clock()
+    for _ in range(reads):
+        func(*args)
+    return clock() - started
+
+
+def measure_legacy(func, reads, *args):
+    """Like :func:`measure`, but with the legacy enum and error code."""
+    with mock.patch.object(
+            utils.IntEnum, '__new__', staticmethod(_legacy_new)), \
+            mock.patch.object(
+                spotify.Error, 'maybe_raise',
+                classmethod(_legacy_maybe_raise)):
+        return measure(func, reads, *args)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Measure the time used to read enum properties.')
+    parser.add_argument(
+        '--reads', type=int, default=1000000,
+        help='number of reads of each property (default: 1000000)')
+    parser.add_argument(
+        '--repeat', type=int, default=3,
+        help='number of times to repeat the reads (default: 3)')
+    args = parser.parse_args(argv)
+
+    session = tests.create_session_mock()
+    session._sp_session = ffi.cast('sp_session *', 1)
+    rows = []
+    with patched_lib(_MODULES, _fake_lib()):
+        track = spotify.Track(
+            session, sp_track=ffi.cast('sp_track *', 1), add_ref=False)
+        connection = spotify.connection.Connection(session)
+        for name, func in PROPERTIES:
+            timings = {measure_legacy: [], measure: []}
+            for _ in range(args.repeat):
+                for measure_func, values in timings.items():
+                    values.append(
+                        measure_func(func, args.reads, track, connection))
+            before = min(timings[measure_legacy])
+            after = min(timings[measure])
+            rows.append([
+                name, '%.3f' % before, '%.3f' % after,
+                '%.2f' % (before / args.reads * 1e6),
+                '%.2f' % (after / args.reads * 1e6),
+                '%.2fx' % (before / after)])
+
+    print_table(
+        ['property', 'before s', 'after s', 'before us', 'after us',
+         'speedup'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""Benchmark of the memory used by the names of a large library.
+
+Reads the names of the album and artist of every track in a library of many
+tracks from a mocked libspotify, keeping all the names in memory like an
+application listing the library would. This is done both with and without
+:attr:`spotify.Session.intern_strings`, and the memory used by the kept names
+and the hit rate of the :attr:`spotify.Session.string_cache` is reported for
+each field.
+
+The memory is measured with :mod:`tracemalloc`, which is only available on
+Python 3.4 and newer.
+
+Example::
+
+    python -m tests.benchmarks.interned_names --tracks 50000
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import argparse
+import gc
+
+import spotify
+from spotify import ffi, utils
+
+import tests
+from tests.benchmarks import (
+    NoopLib, clock, patched_lib, print_table, tracemalloc)
+
+
+def _fake_lib(names):
+    """Create a fake libspotify where the name of the object behind pointer
+    ``i`` is ``names[i - 1]``."""
+    native_names = [ffi.new('char[]', name.encode('utf-8')) for name in names]
+
+    def name(sp_obj):
+        return native_names[int(ffi.cast('intptr_t', sp_obj)) - 1]
+
+    return NoopLib(
+        sp_album_name=name,
+        sp_artist_name=name)
+
+
+_MODULES = ['spotify.album', 'spotify.artist']
+
+FIELDS = [
+    ('album', 'sp_album *', lambda session, sp: spotify.Album(
+        session, sp_album=sp)),
+    ('artist', 'sp_artist *', lambda session, sp: spotify.Artist(
+        session, sp_artist=sp)),
+]
+
+
+def _library(num_tracks, num_names):
+    """Get the name of each of ``num_tracks`` items, when there are
+    ``num_names`` different names."""
+    return [
+        'Name number %d of the library' % (i * 7919 % num_names)
+        for i in range(num_tracks)]
+
+
+def measure(session, wrappers):
+    """Get the number of bytes used by the names of the ``wrappers`` and the
+    number of seconds it took to get them."""
+    gc.collect()
+    if tracemalloc is not None:
+        tracemalloc.start()
+    started = clock()
+    names = [wrapper.name for wrapper in wrappers]
+    elapsed = clock() - started
+    if tracemalloc is not None:
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    else:
+        size = 0
+    assert all(names)
+    del names
+    return size, elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Measure the memory used by the names of a library.')
+    parser.add_argument(
+        '--tracks', type=int, default=50000,
+        help='number of tracks in the library (default: 50000)')
+    parser.add_argument(
+        '--albums', type=int, default=4000,
+        help='number of different albums (default: 4000)')
+    parser.add_argument(
+        '--artists', type=int, default=1500,
+        help='number of different artists (default: 1500)')
+    args = parser.parse_args(argv)
+
+    num_names = {'album': args.albums, 'artist': args.artists}
+    session = tests.create_session_mock()
+    rows = []
+    for field, type_name, create in FIELDS:
+        names = _library(args.tracks, num_names[field])
+        with patched_lib(_MODULES, _fake_lib(names)):
+            wrappers = [
+                create(session, ffi.cast(type_name, i + 1))
+                for i in range(args.tracks)]
+
+            session.intern_strings = False
+            before, before_elapsed = measure(session, wrappers)
+
+            session.intern_strings = True
+            session.string_cache = utils.InternCache(max_size=args.tracks)
+            after, after_elapsed = measure(session, wrappers)
+            cache = session.string_cache
+
+        rows.append([
+            field, num_names[field], '%.1f' % (before / 1024),
+            '%.1f' % (after / 1024),
+            '%.1f' % ((before - after) / before * 100 if before else 0),
+            '%.1f' % (cache.hit_rate * 100),
+            '%.2f' % (before_elapsed / args.tracks * 1e6),
+            '%.2f' % (after_elapsed / args.tracks * 1e6)])
+
+    print_table(
+        ['field', 'unique', 'before KiB', 'after KiB', 'saved %', 'hit %',
+         'before us', 'after us'], rows)
+    if tracemalloc is None:
+        print('Memory use not measured, as tracemalloc is not available.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark of getting the URI of many tracks.
+
+Gets :attr:`spotify.Link.uri` for the links of many tracks from a mocked
+libspotify, which returns 36 byte track URIs. For comparison, the same is
+done with :func:`_legacy_get_with_growing_buffer`, which gets strings the way
+:func:`spotify.utils.get_with_growing_buffer` did before it learned buffer
+sizes and reused buffers.
+
+Example::
+
+    python -m tests.benchmarks.link_uri --count 100000
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import argparse
+import gc
+
+import spotify
+from spotify import ffi, utils
+
+import tests
+from tests import mock
+from tests.benchmarks import NoopLib, clock, patched_lib, print_table
+
+
+def _legacy_get_with_growing_buffer(func, *args):
+    actual_length = 10
+    buffer_length = actual_length
+    while actual_length >= buffer_length:
+        buffer_length = actual_length + 1
+        buffer_ = ffi.new('char[]', buffer_length)
+        actual_length = func(*(args + (buffer_, buffer_length)))
+    if actual_length == -1:
+        return None
+    return utils.to_unicode(buffer_)
+
+
+class _LinkAsString(object):
+
+    """Fake ``sp_link_as_string()`` which counts its calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, sp_link, buffer_, buffer_size):
+        self.calls += 1
+        uri = b'spotify:track:%022d' % int(ffi.cast('intptr_t', sp_link))
+        if buffer_size > 0:
+            length = min(len(uri), buffer_size - 1)
+            ffi.memmove(buffer_, uri, length)
+            buffer_[length] = b'\0'
+        return len(uri)
+
+
+IMPLEMENTATIONS = [
+    ('before', _legacy_get_with_growing_buffer),
+    ('after', utils.get_with_growing_buffer),
+]
+
+
+def run(links, getter, link_as_string):
+    with mock.patch.object(utils, 'get_with_growing_buffer', getter):
+        link_as_string.calls = 0
+        gc.collect()
+        started = clock()
+        uris = [link.uri for link in links]
+        elapsed = clock() - started
+    assert all(len(uri) == 36 for uri in uris)
+    return elapsed, link_as_string.calls
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Measure the time used to get the URI of many links.')
+    parser.add_argument(
+        '--count', type=int, default=100000,
+        help='number of track links to get the URI of (default: 100000)')
+    args = parser.parse_args(argv)
+
+    session = tests.create_session_mock()
+    link_as_string = _LinkAsString()
+    rows = []
+    with patched_lib(['spotify.link'], NoopLib(
+            sp_link_as_string=link_as_string)):
+        links = [
+            spotify.Link(
+                session, sp_link=ffi.cast('sp_link *', i + 1), add_ref=False)
+            for i in range(args.count)]
+        for name, getter in IMPLEMENTATIONS:
+            elapsed, calls = run(links, getter, link_as_string)
+            rows.append([
+                name, '%.3f' % elapsed, '%.2f' % (elapsed / args.count * 1e6),
+                '%.2f' % (calls / args.count)])
+
+    print_table(
+        ['', 'total s', 'us/uri', 'C calls/uri'], rows)
+
+
+if __name__ == '__main__':
+    main()
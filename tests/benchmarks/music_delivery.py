@@ -0,0 +1,291 @@
+"""Benchmark of the audio delivery hot path.
+
+Calls ``_SessionCallbacks.music_delivery`` directly, the same way libspotify
+does from its audio thread, with a fake ``sp_audioformat`` and generated frame
+buffers. Each sink is attached to a session with a mocked libspotify and fed
+frames at real-time speed or faster. The sinks write to fake audio devices
+which play back at real-time speed, so feeding them too fast makes them reject
+frames, just like a real device would.
+
+For each sink, the benchmark reports the per-callback latency percentiles, the
+number of memory blocks allocated per second, and the share of the delivered
+frames that were consumed or rejected by the sink.
+
+Examples::
+
+    # Deliver 10s of audio at real-time speed to all sinks
+    python -m tests.benchmarks.music_delivery
+
+    # Deliver as fast as possible, failing if the 99th percentile latency of
+    # the bare listener exceeds 100us
+    python -m tests.benchmarks.music_delivery --speed 0 --sinks listener \\
+        --max-p99 100
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import argparse
+import os
+import sys
+import time
+
+import spotify
+from spotify.session import _SessionCallbacks
+
+from tests import mock
+from tests.benchmarks import (
+    AllocationTracker, clock, mocked_session, percentile, print_table)
+
+
+class _PlaybackBuffer(object):
+
+    """The buffer of a fake audio device that plays back at real-time speed.
+    """
+
+    def __init__(self, sample_rate, capacity):
+        self.sample_rate = sample_rate
+        self.capacity = capacity
+        self._started = None
+        self._written = 0
+
+    def room(self):
+        """Number of frames that can be written without overflowing."""
+        if self._started is None:
+            return self.capacity
+        played = int((clock() - self._started) * self.sample_rate)
+        level = max(0, self._written - played)
+        if level == 0:
+            # Buffer underrun. Playback restarts when more frames arrive.
+            self._started = None
+            self._written = 0
+        return self.capacity - level
+
+    def write(self, num_frames):
+        """Write up to ``num_frames`` frames and return the number written."""
+        num_frames = min(num_frames, self.room())
+        if self._started is None:
+            self._started = clock()
+        self._written += num_frames
+        return num_frames
+
+
+class _FakeAlsaPCM(object):
+
+    """Fake ``alsaaudio.PCM`` in non-blocking mode."""
+
+    def __init__(self, mode=None, card=None):
+        self._channels = 2
+        self._rate = 44100
+        self._buffer = None
+
+    def setformat(self, format):
+        pass
+
+    def setrate(self, rate):
+        self._rate = rate
+
+    def setchannels(self, channels):
+        self._channels = channels
+
+    def setperiodsize(self, period_size):
+        pass
+
+    def write(self, frames):
+        if self._buffer is None:
+            # ALSA's default buffer holds about half a second of audio.
+            self._buffer = _PlaybackBuffer(self._rate, self._rate // 2)
+        return self._buffer.write(len(frames) // (2 * self._channels))
+
+    def close(self):
+        pass
+
+
+class _FakePyAudioStream(object):
+
+    """Fake ``pyaudio.Stream`` with a blocking :meth:`write`."""
+
+    def __init__(self, rate):
+        self._buffer = _PlaybackBuffer(rate, rate // 2)
+
+    def write(self, frames, num_frames=None):
+        while num_frames > 0:
+            written = self._buffer.write(num_frames)
+            num_frames -= written
+            if num_frames > 0:
+                time.sleep(0.001)
+
+    def close(self):
+        pass
+
+
+class _FakePyAudio(object):
+
+    """Fake ``pyaudio.PyAudio``."""
+
+    def open(self, format=None, channels=None, rate=None, output=None):
+        return _FakePyAudioStream(rate)
+
+
+def _create_listener(session):
+    def on_music_delivery(session, audio_format, frames, num_frames):
+        return num_frames
+
+    session.on(spotify.SessionEvent.MUSIC_DELIVERY, on_music_delivery)
+    return None
+
+
+def _create_alsa_sink(session):
+    alsaaudio = mock.Mock(PCM=_FakeAlsaPCM)
+    with mock.patch.dict('sys.modules', {'alsaaudio': alsaaudio}):
+        return spotify.AlsaSink(session)
+
+
+def _create_portaudio_sink(session):
+    pyaudio = mock.Mock(PyAudio=_FakePyAudio)
+    with mock.patch.dict('sys.modules', {'pyaudio': pyaudio}):
+        return spotify.PortAudioSink(session)
+
+
+SINKS = {
+    'listener': _create_listener,
+    'alsa': _create_alsa_sink,
+    'portaudio': _create_portaudio_sink,
+}
+
+
+def run(sink_name, seconds, speed, num_frames, alloc_sample_rate):
+    """Feed ``seconds`` of audio to the sink named ``sink_name``.
+
+    Returns a dict with the measurements.
+    """
+    sp_audioformat = spotify.ffi.new('sp_audioformat *')
+    sp_audioformat.sample_type = int(spotify.SampleType.INT16_NATIVE_ENDIAN)
+    sp_audioformat.sample_rate = 44100
+    sp_audioformat.channels = 2
+    frame_size = spotify.AudioFormat(sp_audioformat).frame_size()
+
+    # Keep the buffers alive while their void pointers are in use.
+    buffers = [
+        spotify.ffi.new('char[]', os.urandom(frame_size * num_frames))
+        for _ in range(8)]
+    frame_pointers = [spotify.ffi.cast('void *', b) for b in buffers]
+
+    num_callbacks = int(seconds * sp_audioformat.sample_rate / num_frames)
+    interval = (
+        num_frames / sp_audioformat.sample_rate / speed if speed else 0)
+    callback = _SessionCallbacks.music_delivery
+
+    latencies = []
+    allocations = AllocationTracker()
+    frames_consumed = 0
+
+    with mocked_session() as session:
+        sink = SINKS[sink_name](session)
+        sp_session = session._sp_session
+
+        started = clock()
+        for i in range(num_callbacks):
+            if interval:
+                delay = started + i * interval - clock()
+                if delay > 0:
+                    time.sleep(delay)
+            frames = frame_pointers[i % len(frame_pointers)]
+            if alloc_sample_rate and i % alloc_sample_rate == 0:
+                # tracemalloc slows down the call, so the sampled calls are
+                # not included in the latency measurements.
+                consumed = allocations.call(
+                    callback, sp_session, sp_audioformat, frames, num_frames)
+            else:
+                call_started = clock()
+                consumed = callback(
+                    sp_session, sp_audioformat, frames, num_frames)
+                latencies.append(clock() - call_started)
+            frames_consumed += consumed
+        elapsed = clock() - started
+
+        if sink is not None:
+            sink.off()
+
+    latencies.sort()
+    frames_delivered = num_callbacks * num_frames
+    allocations_per_second = None
+    if allocations.mean_allocations is not None:
+        allocations_per_second = (
+            allocations.mean_allocations * num_callbacks / elapsed)
+    return {
+        'sink': sink_name,
+        'callbacks': num_callbacks,
+        'elapsed': elapsed,
+        'p50': percentile(latencies, 50),
+        'p90': percentile(latencies, 90),
+        'p99': percentile(latencies, 99),
+        'max': latencies[-1] if latencies else 0,
+        'allocations_per_second': allocations_per_second,
+        'consumed': frames_consumed / frames_delivered,
+        'rejected': 1 - frames_consumed / frames_delivered,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Benchmark the music delivery callback and audio sinks.')
+    parser.add_argument(
+        '--seconds', type=float, default=10,
+        help='seconds of audio to deliver to each sink (default: 10)')
+    parser.add_argument(
+        '--speed', type=float, default=1,
+        help='delivery speed as a multiple of real-time, '
+        '0 for as fast as possible (default: 1)')
+    parser.add_argument(
+        '--frames', type=int, default=2048,
+        help='frames per callback (default: 2048)')
+    parser.add_argument(
+        '--sinks', nargs='+', choices=sorted(SINKS),
+        default=['listener', 'alsa', 'portaudio'],
+        help='sinks to benchmark (default: all)')
+    parser.add_argument(
+        '--alloc-sample', type=int, default=10, metavar='N',
+        help='measure allocations on every Nth callback, 0 to disable '
+        '(default: 10)')
+    parser.add_argument(
+        '--max-p99', type=float, metavar='USEC',
+        help='exit with an error if any 99th percentile latency is higher')
+    parser.add_argument(
+        '--min-consumed', type=float, metavar='PERCENT',
+        help='exit with an error if any sink consumed fewer frames')
+    args = parser.parse_args(argv)
+
+    results = [
+        run(sink, args.seconds, args.speed, args.frames, args.alloc_sample)
+        for sink in args.sinks]
+
+    def usec(seconds):
+        return '%.1f' % (seconds * 1e6)
+
+    def rate(value):
+        return 'n/a' if value is None else '%.1f' % value
+
+    print_table(
+        ['sink', 'callbacks', 'p50 us', 'p90 us', 'p99 us', 'max us',
+         'allocs/s', 'consumed %', 'rejected %'],
+        [[r['sink'], r['callbacks'], usec(r['p50']), usec(r['p90']),
+          usec(r['p99']), usec(r['max']), rate(r['allocations_per_second']),
+          '%.1f' % (r['consumed'] * 100), '%.1f' % (r['rejected'] * 100)]
+         for r in results])
+
+    failed = False
+    for result in results:
+        if args.max_p99 is not None and result['p99'] * 1e6 > args.max_p99:
+            print('%s: p99 latency above %.1fus' % (
+                result['sink'], args.max_p99))
+            failed = True
+        if (args.min_consumed is not None and
+                result['consumed'] * 100 < args.min_consumed):
+            print('%s: consumed less than %.1f%% of the frames' % (
+                result['sink'], args.min_consumed))
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
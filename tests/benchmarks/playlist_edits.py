@@ -0,0 +1,140 @@
+"""Benchmark of deleting and replacing slices of a playlist's tracks.
+
+Deletes and replaces slices of :attr:`spotify.Playlist.tracks` on a mocked
+libspotify, counting the calls that change the playlist. libspotify emits
+one ``tracks_added`` or ``tracks_removed`` event per call, and each call is
+a change the Spotify servers must acknowledge. For comparison, the same is
+done with :class:`_LegacyTracks`, which changes the playlist one track at a
+time, like :attr:`spotify.Playlist.tracks` did before slice operations were
+batched.
+
+Example::
+
+    python -m tests.benchmarks.playlist_edits --length 10000
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import argparse
+import collections
+
+import spotify
+from spotify import ffi
+from spotify.playlist import _Tracks
+
+import tests
+from tests.benchmarks import NoopLib, clock, patched_lib, print_table
+
+
+class _LegacyTracks(_Tracks):
+
+    """:class:`spotify.playlist._Tracks` as it used to be, adding and
+    removing one track per call."""
+
+    def __setitem__(self, key, value):
+        if isinstance(key, int):
+            key = slice(key, key + 1)
+            value = [value]
+        for i, val in enumerate(value, key.start):
+            self._playlist.add_tracks(val, index=i)
+        key = slice(key.start + len(value), key.stop + len(value), key.step)
+        del self[key]
+
+    def __delitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.__len__())
+            for i in reversed(sorted(range(start, stop, step))):
+                self._playlist.remove_tracks(i)
+            return
+        self._playlist.remove_tracks(key)
+
+
+class _FakePlaylist(object):
+
+    """Fake libspotify playlist which keeps a list of track pointers and
+    counts the calls changing it."""
+
+    def __init__(self, length):
+        self.sp_tracks = [ffi.cast('sp_track *', i + 1) for i in range(length)]
+        self.calls = collections.Counter()
+
+    def num_tracks(self, sp_playlist):
+        return len(self.sp_tracks)
+
+    def add_tracks(self, sp_playlist, sp_tracks, num_tracks, index, session):
+        self.calls['add'] += 1
+        self.sp_tracks[index:index] = list(sp_tracks)[:num_tracks]
+        return spotify.lib.SP_ERROR_OK
+
+    def remove_tracks(self, sp_playlist, indexes, num_indexes):
+        self.calls['remove'] += 1
+        removed = set(list(indexes)[:num_indexes])
+        self.sp_tracks = [
+            sp_track for i, sp_track in enumerate(self.sp_tracks)
+            if i not in removed]
+        return spotify.lib.SP_ERROR_OK
+
+    def lib(self):
+        return NoopLib(
+            sp_playlist_num_tracks=self.num_tracks,
+            sp_playlist_add_tracks=self.add_tracks,
+            sp_playlist_remove_tracks=self.remove_tracks)
+
+
+_MODULES = ['spotify.playlist', 'spotify.track']
+
+OPERATIONS = [
+    ('del first half', lambda tracks, new_tracks: tracks.__delitem__(
+        slice(0, len(tracks) // 2))),
+    ('replace 100', lambda tracks, new_tracks: tracks.__setitem__(
+        slice(0, 100), new_tracks[:100])),
+    ('insert 100', lambda tracks, new_tracks: tracks.__setitem__(
+        slice(10, 10), new_tracks[:100])),
+]
+
+
+def run(tracks_cls, func, length, session):
+    """Get the number of seconds used and the number of calls made when
+    calling ``func`` with the tracks of a playlist of ``length`` tracks."""
+    fake = _FakePlaylist(length)
+    with patched_lib(_MODULES, fake.lib()):
+        playlist = spotify.Playlist(
+            session, sp_playlist=ffi.cast('sp_playlist *', 1))
+        tracks = tracks_cls(session, playlist)
+        new_tracks = [
+            spotify.Track(session, sp_track=ffi.cast('sp_track *', -i - 1))
+            for i in range(100)]
+        started = clock()
+        func(tracks, new_tracks)
+        elapsed = clock() - started
+        expected = list(fake.sp_tracks)
+    return elapsed, sum(fake.calls.values()), expected
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Measure the calls used to edit slices of playlists.')
+    parser.add_argument(
+        '--length', type=int, default=10000,
+        help='number of tracks in the playlist (default: 10000)')
+    args = parser.parse_args(argv)
+
+    session = tests.create_session_mock()
+    rows = []
+    for name, func in OPERATIONS:
+        before, before_calls, before_result = run(
+            _LegacyTracks, func, args.length, session)
+        after, after_calls, after_result = run(
+            _Tracks, func, args.length, session)
+        assert before_result == after_result
+        rows.append([
+            name, before_calls, after_calls, '%.1f' % (before * 1e3),
+            '%.1f' % (after * 1e3)])
+
+    print_table(
+        ['operation', 'before calls', 'after calls', 'before ms', 'after ms'],
+        rows)
+
+
+if __name__ == '__main__':
+    main()
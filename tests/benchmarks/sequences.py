@@ -0,0 +1,143 @@
+"""Benchmark of iterating over and slicing sequences of tracks.
+
+Gets the tracks of a playlist, an album browser, and a search result from a
+mocked libspotify, and times common operations on them. For comparison, the
+same operations are also timed on :class:`_LegacySequence`, which accesses
+the items the way :class:`spotify.utils.Sequence` did before it got its own
+iteration and slicing.
+
+Example::
+
+    python -m tests.benchmarks.sequences --length 1000
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import argparse
+import collections
+import itertools
+
+import spotify
+from spotify import utils
+
+import tests
+from tests.benchmarks import NoopLib, clock, patched_lib, print_table
+
+
+class _LegacySequence(utils.Sequence):
+
+    """:class:`spotify.utils.Sequence` as it used to be, getting the length
+    twice per item, materializing the whole sequence on slicing, and iterating
+    item by item through :class:`collections.Sequence`."""
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return list(self).__getitem__(key)
+        if key < 0:
+            key += self.__len__()
+        if not 0 <= key < self.__len__():
+            raise IndexError('list index out of range')
+        return self._getitem_func(self._sp_obj, key)
+
+    __iter__ = collections.Sequence.__iter__
+    __reversed__ = collections.Sequence.__reversed__
+    __contains__ = collections.Sequence.__contains__
+
+
+def _legacy(seq):
+    return _LegacySequence(
+        sp_obj=seq._sp_obj,
+        add_ref_func=lambda sp_obj: None,
+        release_func=lambda sp_obj: None,
+        len_func=seq._len_func,
+        getitem_func=seq._getitem_func)
+
+
+def _fake_lib(length):
+    sp_tracks = [spotify.ffi.cast('sp_track *', i + 1) for i in range(length)]
+
+    def num_tracks(sp_obj):
+        return length
+
+    def track(sp_obj, index):
+        return sp_tracks[index]
+
+    def is_loaded(sp_obj):
+        return 1
+
+    return NoopLib(
+        sp_playlist_is_loaded=is_loaded,
+        sp_playlist_num_tracks=num_tracks,
+        sp_playlist_track=track,
+        sp_albumbrowse_is_loaded=is_loaded,
+        sp_albumbrowse_num_tracks=num_tracks,
+        sp_albumbrowse_track=track,
+        sp_search_is_loaded=is_loaded,
+        sp_search_num_tracks=num_tracks,
+        sp_search_track=track)
+
+
+_MODULES = [
+    'spotify.album', 'spotify.playlist', 'spotify.search', 'spotify.track']
+
+SEQUENCES = [
+    ('playlist', lambda session: spotify.Playlist(
+        session, sp_playlist=spotify.ffi.cast('sp_playlist *', 1)).tracks),
+    ('albumbrowse', lambda session: spotify.AlbumBrowser(
+        session, sp_albumbrowse=spotify.ffi.cast(
+            'sp_albumbrowse *', 1)).tracks),
+    ('search', lambda session: spotify.Search(
+        session, sp_search=spotify.ffi.cast('sp_search *', 1)).tracks),
+]
+
+OPERATIONS = [
+    ('iterate', lambda seq: [track for track in seq]),
+    ('slice 10', lambda seq: seq[len(seq) // 2:len(seq) // 2 + 10]),
+    ('reversed 10', lambda seq: list(itertools.islice(reversed(seq), 10))),
+    ('contains', lambda seq: seq[-1] in seq),
+    ('index', lambda seq: seq[-1]),
+]
+
+
+def measure(func, seq, repeat):
+    """Get the lowest number of seconds it takes to call ``func`` with
+    ``seq``, out of ``repeat`` calls."""
+    func(seq)  # Warm up
+    timings = []
+    for _ in range(repeat):
+        started = clock()
+        func(seq)
+        timings.append(clock() - started)
+    return min(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Measure the time used by operations on sequences.')
+    parser.add_argument(
+        '--length', type=int, default=500,
+        help='number of tracks in each sequence (default: 500)')
+    parser.add_argument(
+        '--repeat', type=int, default=20,
+        help='number of times to repeat each operation (default: 20)')
+    args = parser.parse_args(argv)
+
+    session = tests.create_session_mock()
+    rows = []
+    with patched_lib(_MODULES, _fake_lib(args.length)):
+        for seq_name, create in SEQUENCES:
+            seq = create(session)
+            legacy_seq = _legacy(seq)
+            for op_name, func in OPERATIONS:
+                before = measure(func, legacy_seq, args.repeat)
+                after = measure(func, seq, args.repeat)
+                rows.append([
+                    seq_name, op_name, '%.1f' % (before * 1e6),
+                    '%.1f' % (after * 1e6), '%.1fx' % (before / after)])
+
+    print_table(['sequence', 'operation', 'before us', 'after us', 'speedup'],
+                rows)
+
+
+if __name__ == '__main__':
+    main()
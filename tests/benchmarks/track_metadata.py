@@ -0,0 +1,98 @@
+"""Benchmark of reading the playlist specific metadata of all tracks.
+
+Reads the create time, seen flag, creator's username, and message of every
+track in a large playlist from a mocked libspotify, first through
+:attr:`spotify.Playlist.tracks_with_metadata`, which creates a
+:class:`spotify.PlaylistTrack` and a :class:`spotify.User` per track, and
+then with :meth:`spotify.Playlist.get_track_metadata`.
+
+Example::
+
+    python -m tests.benchmarks.track_metadata --tracks 10000
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import argparse
+
+import spotify
+from spotify import ffi
+
+import tests
+from tests.benchmarks import NoopLib, clock, patched_lib, print_table
+
+
+def _fake_lib(num_tracks, num_creators):
+    """Create a fake libspotify with a playlist of ``num_tracks`` tracks
+    added by ``num_creators`` different users."""
+    sp_users = [ffi.cast('sp_user *', i + 1) for i in range(num_creators)]
+    names = [
+        ffi.new('char[]', ('user%d' % i).encode('utf-8'))
+        for i in range(num_creators)]
+    message = ffi.new('char[]', b'Check this out')
+
+    def creator(sp_playlist, index):
+        return sp_users[index % num_creators]
+
+    def canonical_name(sp_user):
+        return names[int(ffi.cast('intptr_t', sp_user)) - 1]
+
+    return NoopLib(
+        sp_playlist_is_loaded=lambda sp_playlist: 1,
+        sp_playlist_num_tracks=lambda sp_playlist: num_tracks,
+        sp_playlist_track_create_time=lambda sp_playlist, index: index,
+        sp_playlist_track_creator=creator,
+        sp_user_canonical_name=canonical_name,
+        sp_playlist_track_message=lambda sp_playlist, index: message)
+
+
+_MODULES = ['spotify.playlist', 'spotify.playlist_track', 'spotify.user']
+
+
+def read_rows(playlist):
+    result = ([], [], [], [])
+    for playlist_track in playlist.tracks_with_metadata:
+        result[0].append(playlist_track.create_time)
+        result[1].append(playlist_track.seen)
+        result[2].append(playlist_track.creator.canonical_name)
+        result[3].append(playlist_track.message)
+    return result
+
+
+def read_columns(playlist):
+    return tuple(playlist.get_track_metadata())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Measure the time used to read playlist track metadata.')
+    parser.add_argument(
+        '--tracks', type=int, default=10000,
+        help='number of tracks in the playlist (default: 10000)')
+    parser.add_argument(
+        '--creators', type=int, default=20,
+        help='number of users adding tracks (default: 20)')
+    args = parser.parse_args(argv)
+
+    session = tests.create_session_mock()
+    rows = []
+    results = []
+    with patched_lib(_MODULES, _fake_lib(args.tracks, args.creators)):
+        playlist = spotify.Playlist(
+            session, sp_playlist=ffi.cast('sp_playlist *', 1))
+        for name, func in [
+                ('tracks_with_metadata', read_rows),
+                ('get_track_metadata', read_columns)]:
+            started = clock()
+            results.append(func(playlist))
+            elapsed = clock() - started
+            rows.append([
+                name, '%.1f' % (elapsed * 1e3),
+                '%.2f' % (elapsed / args.tracks * 1e6)])
+    assert results[0] == results[1]
+
+    print_table(['method', 'ms', 'us per track'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""Benchmark of reading all unseen tracks of a playlist.
+
+Iterates over a :class:`spotify.PlaylistUnseenTracks` with many tracks on a
+mocked libspotify, counting the calls to
+``sp_playlistcontainer_get_unseen_tracks`` and the number of track pointers
+they copied. For comparison, the same is done with
+:class:`_LegacyUnseenTracks`, which grows its array of tracks by 100 tracks
+at a time and creates a new :class:`spotify.Track` each time a track is got,
+like :class:`spotify.PlaylistUnseenTracks` did before.
+
+Example::
+
+    python -m tests.benchmarks.unseen_tracks --tracks 10000
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import argparse
+import collections
+
+import spotify
+from spotify import ffi, playlist_unseen_tracks
+
+import tests
+from tests.benchmarks import NoopLib, clock, patched_lib, print_table
+
+
+class _LegacyUnseenTracks(spotify.PlaylistUnseenTracks):
+
+    """:class:`spotify.PlaylistUnseenTracks` as it used to be, getting 100
+    more tracks at a time."""
+
+    _BATCH_SIZE = 100
+
+    def _get_more_tracks(self):
+        self._sp_tracks_len = min(
+            self._num_tracks, self._sp_tracks_len + self._BATCH_SIZE)
+        self._sp_tracks = ffi.new('sp_track *[]', self._sp_tracks_len)
+        self._num_tracks = (
+            playlist_unseen_tracks.lib.sp_playlistcontainer_get_unseen_tracks(
+                self._sp_playlistcontainer, self._sp_playlist,
+                self._sp_tracks, self._sp_tracks_len))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def _get_track(self, index):
+        sp_track = self._sp_tracks[index]
+        if sp_track == ffi.NULL:
+            return None
+        return spotify.Track._cached(
+            self._session, sp_track=sp_track, add_ref=True)
+
+
+class _FakeUnseenTracks(object):
+
+    """Fake libspotify with a list of unseen tracks, counting the calls
+    getting them."""
+
+    def __init__(self, num_tracks):
+        self.sp_tracks = [
+            ffi.cast('sp_track *', i + 1) for i in range(num_tracks)]
+        self.counts = collections.Counter()
+
+    def get_unseen_tracks(self, sp_pc, sp_playlist, sp_tracks, num_tracks):
+        self.counts['calls'] += 1
+        num_copied = min(num_tracks, len(self.sp_tracks))
+        sp_tracks[0:num_copied] = self.sp_tracks[:num_copied]
+        self.counts['copied'] += num_copied
+        return len(self.sp_tracks)
+
+    def lib(self):
+        return NoopLib(
+            sp_playlistcontainer_get_unseen_tracks=self.get_unseen_tracks)
+
+
+_MODULES = ['spotify.playlist_unseen_tracks', 'spotify.track']
+
+
+def run(cls, num_tracks, passes, session):
+    """Get the number of seconds used, the calls made, and the track pointers
+    copied when iterating ``passes`` times over the unseen tracks."""
+    fake = _FakeUnseenTracks(num_tracks)
+    with patched_lib(_MODULES, fake.lib()):
+        tracks = cls(
+            session, ffi.cast('sp_playlistcontainer *', 1),
+            ffi.cast('sp_playlist *', 1))
+        started = clock()
+        for _ in range(passes):
+            result = [track._sp_track for track in tracks]
+        elapsed = clock() - started
+    assert result == fake.sp_tracks
+    return elapsed, fake.counts['calls'], fake.counts['copied']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Measure the calls used to read unseen tracks.')
+    parser.add_argument(
+        '--tracks', type=int, default=10000,
+        help='number of unseen tracks (default: 10000)')
+    parser.add_argument(
+        '--passes', type=int, default=3,
+        help='number of times to iterate over the tracks (default: 3)')
+    args = parser.parse_args(argv)
+
+    session = tests.create_session_mock()
+    rows = []
+    for name, cls in [
+            ('before', _LegacyUnseenTracks),
+            ('after', spotify.PlaylistUnseenTracks)]:
+        elapsed, calls, copied = run(cls, args.tracks, args.passes, session)
+        rows.append([name, calls, copied, '%.1f' % (elapsed * 1e3)])
+
+    print_table(['version', 'calls', 'pointers copied', 'ms'], rows)
+
+
+if __name__ == '__main__':
+    main()
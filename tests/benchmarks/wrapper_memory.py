@@ -0,0 +1,130 @@
+"""Benchmark of the memory used by wrapper objects.
+
+Creates many instances of each wrapper class around fake ``sp_*`` pointers
+and reports the number of bytes used per wrapper, including the objects only
+referenced by the wrapper, like the :func:`spotify.ffi.gc` pointer object.
+
+To compare with wrappers without ``__slots__``, each wrapper is also copied to
+an object of a plain class that stores the same attributes in an instance
+``__dict__``.
+
+Example::
+
+    python -m tests.benchmarks.wrapper_memory --count 100000
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import argparse
+import gc
+import sys
+
+import spotify
+
+import tests
+from tests.benchmarks import NoopLib, patched_lib, print_table, tracemalloc
+
+
+class _PlainWrapper(object):
+
+    """A wrapper that keeps its attributes in an instance ``__dict__``."""
+
+
+def _with_instance_dict(obj):
+    plain = _PlainWrapper()
+    for cls in type(obj).__mro__:
+        for name in getattr(cls, '__slots__', ()):
+            if name != '__weakref__':
+                setattr(plain, name, getattr(obj, name))
+    return plain
+
+
+def _pointers(type_name, count):
+    return [spotify.ffi.cast(type_name, i + 1) for i in range(count)]
+
+
+_MODULES = [
+    'spotify.album', 'spotify.artist', 'spotify.link',
+    'spotify.playlist_track', 'spotify.track', 'spotify.user']
+
+WRAPPERS = [
+    ('Track', 'sp_track *', lambda session, sp: spotify.Track(
+        session, sp_track=sp)),
+    ('Album', 'sp_album *', lambda session, sp: spotify.Album(
+        session, sp_album=sp)),
+    ('Artist', 'sp_artist *', lambda session, sp: spotify.Artist(
+        session, sp_artist=sp)),
+    ('Link', 'sp_link *', lambda session, sp: spotify.Link(
+        session, sp_link=sp)),
+    ('User', 'sp_user *', lambda session, sp: spotify.User(
+        session, sp_user=sp)),
+    ('PlaylistTrack', 'sp_playlist *', lambda session, sp: (
+        spotify.PlaylistTrack(session, sp, 0))),
+    ('AudioFormat', 'sp_audioformat *', lambda session, sp: (
+        spotify.AudioFormat(sp))),
+    ('OfflineSyncStatus', 'sp_offline_sync_status *', lambda session, sp: (
+        spotify.OfflineSyncStatus(sp))),
+    ('SearchPlaylist', None, lambda session, sp: spotify.SearchPlaylist(
+        session, name='name', uri='spotify:user:foo:playlist:bar',
+        image_uri='spotify:image:baz')),
+    ('AlbumBrowser', 'sp_albumbrowse *', lambda session, sp: (
+        spotify.AlbumBrowser(session, sp_albumbrowse=sp))),
+    ('ArtistBrowser', 'sp_artistbrowse *', lambda session, sp: (
+        spotify.ArtistBrowser(session, sp_artistbrowse=sp))),
+]
+
+
+def measure(factory, count, convert=None):
+    """Get the number of bytes per object when creating ``count`` objects
+    with ``factory``, optionally passing each object through ``convert``."""
+    convert = convert or (lambda obj: obj)
+    gc.collect()
+    if tracemalloc is not None:
+        tracemalloc.start()
+        objs = [convert(factory(i)) for i in range(count)]
+        size = tracemalloc.get_traced_memory()[0] - sys.getsizeof(objs)
+        tracemalloc.stop()
+    else:
+        # Without tracemalloc we can only measure the wrappers themselves,
+        # not the objects they refer to.
+        objs = [convert(factory(i)) for i in range(count)]
+        size = sum(
+            sys.getsizeof(obj) + sys.getsizeof(getattr(obj, '__dict__', {}))
+            for obj in objs)
+    del objs
+    return size / count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Measure the memory used per wrapper object.')
+    parser.add_argument(
+        '--count', type=int, default=10000,
+        help='number of wrappers to create of each type (default: 10000)')
+    args = parser.parse_args(argv)
+
+    session = tests.create_session_mock()
+    rows = []
+    with patched_lib(_MODULES, NoopLib()):
+        for name, type_name, create in WRAPPERS:
+            if type_name is None:
+                pointers = [None] * args.count
+            else:
+                pointers = _pointers(type_name, args.count)
+
+            def factory(i):
+                return create(session, pointers[i])
+
+            with_dict = measure(factory, args.count, _with_instance_dict)
+            with_slots = measure(factory, args.count)
+            rows.append([
+                name, '%.0f' % with_dict, '%.0f' % with_slots,
+                '%.0f' % (with_dict - with_slots),
+                '%.1f' % ((with_dict - with_slots) / with_dict * 100)])
+
+    print_table(
+        ['wrapper', '__dict__ B', '__slots__ B', 'saved B', 'saved %'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -58,9 +58,18 @@ class AlbumTest(unittest.TestCase):
 
         lib_mock.sp_album_release.assert_called_with(sp_album)
 
+    def test_cached_album(self, lib_mock):
+        sp_album = spotify.ffi.cast('sp_album *', 42)
+
+        result1 = spotify.Album._cached(self.session, sp_album)
+        result2 = spotify.Album._cached(self.session, sp_album)
+
+        self.assertIsInstance(result1, spotify.Album)
+        self.assertIs(result1, result2)
+
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_repr(self, link_mock, lib_mock):
-        link_instance_mock = link_mock.return_value
+        link_instance_mock = link_mock._cached.return_value
         link_instance_mock.uri = 'foo'
         sp_album = spotify.ffi.cast('sp_album *', 42)
         album = spotify.Album(self.session, sp_album=sp_album)
@@ -212,14 +221,14 @@ class AlbumTest(unittest.TestCase):
         album = spotify.Album(self.session, sp_album=sp_album)
         sp_link = spotify.ffi.cast('sp_link *', 43)
         lib_mock.sp_link_create_from_album_cover.return_value = sp_link
-        link_mock.return_value = mock.sentinel.link
+        link_mock._cached.return_value = mock.sentinel.link
         image_size = spotify.ImageSize.SMALL
 
         result = album.cover_link(image_size)
 
         lib_mock.sp_link_create_from_album_cover.assert_called_once_with(
             sp_album, int(image_size))
-        link_mock.assert_called_once_with(
+        link_mock._cached.assert_called_once_with(
             self.session, sp_link=sp_link, add_ref=False)
         self.assertEqual(result, mock.sentinel.link)
 
@@ -229,7 +238,7 @@ class AlbumTest(unittest.TestCase):
         album = spotify.Album(self.session, sp_album=sp_album)
         sp_link = spotify.ffi.cast('sp_link *', 43)
         lib_mock.sp_link_create_from_album_cover.return_value = sp_link
-        link_mock.return_value = mock.sentinel.link
+        link_mock._cached.return_value = mock.sentinel.link
 
         album.cover_link()
 
@@ -303,11 +312,11 @@ class AlbumTest(unittest.TestCase):
         album = spotify.Album(self.session, sp_album=sp_album)
         sp_link = spotify.ffi.cast('sp_link *', 43)
         lib_mock.sp_link_create_from_album.return_value = sp_link
-        link_mock.return_value = mock.sentinel.link
+        link_mock._cached.return_value = mock.sentinel.link
 
         result = album.link
 
-        link_mock.assert_called_once_with(
+        link_mock._cached.assert_called_once_with(
             self.session, sp_link=sp_link, add_ref=False)
         self.assertEqual(result, mock.sentinel.link)
 
@@ -364,6 +373,21 @@ class AlbumBrowserTest(unittest.TestCase):
         result.loaded_event.wait(3)
         callback.assert_called_with(result)
 
+    def test_create_from_album_uses_browse_cache_if_set(self, lib_mock):
+        sp_album = spotify.ffi.cast('sp_album *', 43)
+        album = spotify.Album(self.session, sp_album=sp_album)
+        self.session.browse_cache = mock.Mock(spec=spotify.BrowseCache)
+        self.session.browse_cache.browse_album.return_value = (
+            mock.sentinel.browser)
+        callback = mock.Mock()
+
+        result = album.browse(callback)
+
+        self.assertIs(result, mock.sentinel.browser)
+        self.session.browse_cache.browse_album.assert_called_with(
+            album, callback=callback)
+        self.assertEqual(lib_mock.sp_albumbrowse_create.call_count, 0)
+
     def test_browser_is_gone_before_callback_is_called(self, lib_mock):
         sp_album = spotify.ffi.cast('sp_album *', 43)
         album = spotify.Album(self.session, sp_album=sp_album)
@@ -415,7 +439,7 @@ class AlbumBrowserTest(unittest.TestCase):
         lib_mock.sp_albumbrowse_is_loaded.return_value = 1
         sp_album = spotify.ffi.cast('sp_album *', 43)
         lib_mock.sp_albumbrowse_album.return_value = sp_album
-        link_instance_mock = link_mock.return_value
+        link_instance_mock = link_mock._cached.return_value
         link_instance_mock.uri = 'foo'
 
         result = repr(browser)
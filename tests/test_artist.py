@@ -60,9 +60,18 @@ class ArtistTest(unittest.TestCase):
 
         lib_mock.sp_artist_release.assert_called_with(sp_artist)
 
+    def test_cached_artist(self, lib_mock):
+        sp_artist = spotify.ffi.cast('sp_artist *', 42)
+
+        result1 = spotify.Artist._cached(self.session, sp_artist)
+        result2 = spotify.Artist._cached(self.session, sp_artist)
+
+        self.assertIsInstance(result1, spotify.Artist)
+        self.assertIs(result1, result2)
+
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_repr(self, link_mock, lib_mock):
-        link_instance_mock = link_mock.return_value
+        link_instance_mock = link_mock._cached.return_value
         link_instance_mock.uri = 'foo'
         sp_artist = spotify.ffi.cast('sp_artist *', 42)
         artist = spotify.Artist(self.session, sp_artist=sp_artist)
@@ -114,6 +123,21 @@ class ArtistTest(unittest.TestCase):
         lib_mock.sp_artist_name.assert_called_once_with(sp_artist)
         self.assertIsNone(result)
 
+    def test_name_is_interned_if_enabled(self, lib_mock):
+        self.session.intern_strings = True
+        lib_mock.sp_artist_name.side_effect = lambda sp_artist: (
+            spotify.ffi.new('char[]', b'Foo Bar Baz'))
+        artist1 = spotify.Artist(
+            self.session, sp_artist=spotify.ffi.cast('sp_artist *', 42))
+        artist2 = spotify.Artist(
+            self.session, sp_artist=spotify.ffi.cast('sp_artist *', 43))
+
+        result1 = artist1.name
+        result2 = artist2.name
+
+        self.assertEqual(result1, 'Foo Bar Baz')
+        self.assertIs(result1, result2)
+
     def test_is_loaded(self, lib_mock):
         lib_mock.sp_artist_is_loaded.return_value = 1
         sp_artist = spotify.ffi.cast('sp_artist *', 42)
@@ -190,14 +214,14 @@ class ArtistTest(unittest.TestCase):
         artist = spotify.Artist(self.session, sp_artist=sp_artist)
         sp_link = spotify.ffi.cast('sp_link *', 43)
         lib_mock.sp_link_create_from_artist_portrait.return_value = sp_link
-        link_mock.return_value = mock.sentinel.link
+        link_mock._cached.return_value = mock.sentinel.link
         image_size = spotify.ImageSize.SMALL
 
         result = artist.portrait_link(image_size)
 
         lib_mock.sp_link_create_from_artist_portrait.assert_called_once_with(
             sp_artist, int(image_size))
-        link_mock.assert_called_once_with(
+        link_mock._cached.assert_called_once_with(
             self.session, sp_link=sp_link, add_ref=False)
         self.assertEqual(result, mock.sentinel.link)
 
@@ -220,11 +244,11 @@ class ArtistTest(unittest.TestCase):
         artist = spotify.Artist(self.session, sp_artist=sp_artist)
         sp_link = spotify.ffi.cast('sp_link *', 43)
         lib_mock.sp_link_create_from_artist.return_value = sp_link
-        link_mock.return_value = mock.sentinel.link
+        link_mock._cached.return_value = mock.sentinel.link
 
         result = artist.link
 
-        link_mock.assert_called_once_with(
+        link_mock._cached.assert_called_once_with(
             self.session, sp_link=sp_link, add_ref=False)
         self.assertEqual(result, mock.sentinel.link)
 
@@ -284,6 +308,23 @@ class ArtistBrowserTest(unittest.TestCase):
         result.loaded_event.wait(3)
         callback.assert_called_with(result)
 
+    def test_create_from_artist_uses_browse_cache_if_set(self, lib_mock):
+        sp_artist = spotify.ffi.cast('sp_artist *', 43)
+        artist = spotify.Artist(self.session, sp_artist=sp_artist)
+        self.session.browse_cache = mock.Mock(spec=spotify.BrowseCache)
+        self.session.browse_cache.browse_artist.return_value = (
+            mock.sentinel.browser)
+        callback = mock.Mock()
+
+        result = artist.browse(
+            type=spotify.ArtistBrowserType.NO_TRACKS, callback=callback)
+
+        self.assertIs(result, mock.sentinel.browser)
+        self.session.browse_cache.browse_artist.assert_called_with(
+            artist, type=spotify.ArtistBrowserType.NO_TRACKS,
+            callback=callback)
+        self.assertEqual(lib_mock.sp_artistbrowse_create.call_count, 0)
+
     def test_browser_is_gone_before_callback_is_called(self, lib_mock):
         sp_artist = spotify.ffi.cast('sp_artist *', 43)
         artist = spotify.Artist(self.session, sp_artist=sp_artist)
@@ -334,7 +375,7 @@ class ArtistBrowserTest(unittest.TestCase):
         lib_mock.sp_artistbrowse_is_loaded.return_value = 1
         sp_artist = spotify.ffi.cast('sp_artist *', 42)
         lib_mock.sp_artistbrowse_artist.return_value = sp_artist
-        link_instance_mock = link_mock.return_value
+        link_instance_mock = link_mock._cached.return_value
         link_instance_mock.uri = 'foo'
 
         result = repr(browser)
@@ -39,6 +39,9 @@ class AudioFormatTest(unittest.TestCase):
     def test_channels(self):
         self.assertEqual(self.audio_format.channels, 2)
 
+    def test_has_no_instance_dict(self):
+        self.assertFalse(hasattr(self.audio_format, '__dict__'))
+
     def test_frame_size(self):
         # INT16 means 16 bits aka 2 bytes per channel
         self._sp_audioformat.sample_type = (
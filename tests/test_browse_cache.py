@@ -0,0 +1,256 @@
+from __future__ import unicode_literals
+
+import unittest
+
+import spotify
+import tests
+from tests import mock
+
+
+@mock.patch('spotify.utils.time')
+@mock.patch('spotify.artist.lib', spec=spotify.lib)
+@mock.patch('spotify.album.lib', spec=spotify.lib)
+class BrowseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = tests.create_session_mock()
+
+    def setup_libs(self, album_lib_mock, artist_lib_mock, time_mock):
+        # Each browser created gets the next pointer, and reports a backend
+        # request duration of 100 ms once loaded
+        for lib_mock, name in [
+                (album_lib_mock, 'albumbrowse'),
+                (artist_lib_mock, 'artistbrowse')]:
+            getattr(lib_mock, 'sp_%s_create' % name).side_effect = (
+                self.create_pointers('sp_%s *' % name))
+            getattr(lib_mock, 'sp_%s_error' % name).return_value = int(
+                spotify.ErrorType.OK)
+            getattr(lib_mock, 'sp_%s_is_loaded' % name).return_value = 1
+            getattr(
+                lib_mock,
+                'sp_%s_backend_request_duration' % name).return_value = 100
+        time_mock.time.return_value = 1000
+
+    def create_pointers(self, ctype):
+        pointers = []
+
+        def create(*args):
+            pointers.append(spotify.ffi.cast(ctype, len(pointers) + 1))
+            return pointers[-1]
+
+        return create
+
+    def create_album(self, i=1):
+        return spotify.Album(
+            self.session, sp_album=spotify.ffi.cast('sp_album *', i))
+
+    def create_artist(self, i=1):
+        return spotify.Artist(
+            self.session, sp_artist=spotify.ffi.cast('sp_artist *', i))
+
+    def complete(self, lib_mock, browser, error=spotify.ErrorType.OK):
+        if isinstance(browser, spotify.AlbumBrowser):
+            name = 'albumbrowse'
+        else:
+            name = 'artistbrowse'
+        getattr(lib_mock, 'sp_%s_error' % name).return_value = int(error)
+        for call in getattr(lib_mock, 'sp_%s_create' % name).call_args_list:
+            complete_cb, handle = call[0][-2:]
+            if spotify.ffi.from_handle(handle)[1] is browser:
+                complete_cb(spotify.ffi.NULL, handle)
+                return
+        self.fail('No such browser')
+
+    def test_first_browse_is_a_miss(
+            self, album_lib_mock, artist_lib_mock, time_mock):
+        self.setup_libs(album_lib_mock, artist_lib_mock, time_mock)
+        cache = spotify.BrowseCache(self.session)
+        album = self.create_album()
+
+        result = cache.browse_album(album)
+
+        self.assertIsInstance(result, spotify.AlbumBrowser)
+        album_lib_mock.sp_albumbrowse_create.assert_called_once_with(
+            self.session._sp_session, album._sp_album, mock.ANY, mock.ANY)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.misses, 1)
+
+    def test_completed_browser_is_a_hit(
+            self, album_lib_mock, artist_lib_mock, time_mock):
+        self.setup_libs(album_lib_mock, artist_lib_mock, time_mock)
+        cache = spotify.BrowseCache(self.session)
+        album = self.create_album()
+        browser = cache.browse_album(album)
+        self.complete(album_lib_mock, browser)
+        callback = mock.Mock()
+
+        result = cache.browse_album(self.create_album(), callback=callback)
+
+        self.assertIs(result, browser)
+        self.assertEqual(album_lib_mock.sp_albumbrowse_create.call_count, 1)
+        callback.assert_called_once_with(browser)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.hit_rate, 0.5)
+        self.assertEqual(cache.backend_time_saved, 100)
+
+    def test_browser_in_progress_is_shared(
+            self, album_lib_mock, artist_lib_mock, time_mock):
+        self.setup_libs(album_lib_mock, artist_lib_mock, time_mock)
+        cache = spotify.BrowseCache(self.session)
+        artist = self.create_artist()
+        callback1 = mock.Mock()
+        callback2 = mock.Mock()
+        browser = cache.browse_artist(artist, callback=callback1)
+
+        result = cache.browse_artist(artist, callback=callback2)
+        cache.browse_artist(artist)
+
+        self.assertIs(result, browser)
+        self.assertEqual(artist_lib_mock.sp_artistbrowse_create.call_count, 1)
+        self.assertEqual(cache.coalesced, 2)
+        self.assertEqual(callback1.call_count, 0)
+        self.assertEqual(cache.backend_time_saved, 0)
+
+        self.complete(artist_lib_mock, browser)
+
+        callback1.assert_called_once_with(browser)
+        callback2.assert_called_once_with(browser)
+        self.assertEqual(cache.backend_time_saved, 200)
+
+    def test_artist_browsers_are_keyed_by_type(
+            self, album_lib_mock, artist_lib_mock, time_mock):
+        self.setup_libs(album_lib_mock, artist_lib_mock, time_mock)
+        cache = spotify.BrowseCache(self.session)
+        artist = self.create_artist()
+
+        full = cache.browse_artist(artist)
+        no_tracks = cache.browse_artist(
+            artist, type=spotify.ArtistBrowserType.NO_TRACKS)
+        result = cache.browse_artist(
+            artist, type=spotify.ArtistBrowserType.FULL)
+
+        self.assertNotEqual(full, no_tracks)
+        self.assertIs(result, full)
+        artist_lib_mock.sp_artistbrowse_create.assert_called_with(
+            self.session._sp_session, artist._sp_artist,
+            int(spotify.ArtistBrowserType.NO_TRACKS), mock.ANY, mock.ANY)
+        self.assertEqual(cache.misses, 2)
+
+    def test_albums_and_artists_with_same_pointer_are_different(
+            self, album_lib_mock, artist_lib_mock, time_mock):
+        self.setup_libs(album_lib_mock, artist_lib_mock, time_mock)
+        cache = spotify.BrowseCache(self.session)
+
+        cache.browse_album(self.create_album(1))
+        cache.browse_artist(self.create_artist(1))
+
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(len(cache), 2)
+
+    def test_old_browser_is_a_miss(
+            self, album_lib_mock, artist_lib_mock, time_mock):
+        self.setup_libs(album_lib_mock, artist_lib_mock, time_mock)
+        cache = spotify.BrowseCache(self.session, max_age=60)
+        album = self.create_album()
+        browser = cache.browse_album(album)
+        self.complete(album_lib_mock, browser)
+
+        time_mock.time.return_value = 1059
+        self.assertIs(cache.browse_album(album), browser)
+
+        time_mock.time.return_value = 1060
+        result = cache.browse_album(album)
+
+        self.assertIsNot(result, browser)
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(len(cache), 1)
+
+    def test_without_max_age_browsers_never_expire(
+            self, album_lib_mock, artist_lib_mock, time_mock):
+        self.setup_libs(album_lib_mock, artist_lib_mock, time_mock)
+        cache = spotify.BrowseCache(self.session, max_age=None)
+        album = self.create_album()
+        browser = cache.browse_album(album)
+        self.complete(album_lib_mock, browser)
+
+        time_mock.time.return_value = 10 ** 9
+
+        self.assertIs(cache.browse_album(album), browser)
+
+    def test_evicts_least_recently_used_browser(
+            self, album_lib_mock, artist_lib_mock, time_mock):
+        self.setup_libs(album_lib_mock, artist_lib_mock, time_mock)
+        cache = spotify.BrowseCache(self.session, max_size=2)
+        a, b, c = [self.create_album(i) for i in range(1, 4)]
+        browser_a = cache.browse_album(a)
+        browser_b = cache.browse_album(b)
+        cache.browse_album(a)
+
+        cache.browse_album(c)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.browse_album(a), browser_a)
+        self.assertIsNot(cache.browse_album(b), browser_b)
+
+    def test_keeps_album_alive_with_browser(
+            self, album_lib_mock, artist_lib_mock, time_mock):
+        self.setup_libs(album_lib_mock, artist_lib_mock, time_mock)
+        cache = spotify.BrowseCache(self.session)
+        album = self.create_album()
+
+        cache.browse_album(album)
+
+        self.assertIs(list(cache._entries.values())[0][1], album)
+
+    def test_failed_browser_is_not_kept(
+            self, album_lib_mock, artist_lib_mock, time_mock):
+        self.setup_libs(album_lib_mock, artist_lib_mock, time_mock)
+        cache = spotify.BrowseCache(self.session)
+        callback = mock.Mock()
+        browser = cache.browse_artist(self.create_artist(), callback=callback)
+        cache.browse_artist(self.create_artist())
+
+        self.complete(
+            artist_lib_mock, browser,
+            error=spotify.ErrorType.OTHER_TRANSIENT)
+
+        callback.assert_called_once_with(browser)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.backend_time_saved, 0)
+
+    def test_browse_served_from_local_cache_saves_no_backend_time(
+            self, album_lib_mock, artist_lib_mock, time_mock):
+        self.setup_libs(album_lib_mock, artist_lib_mock, time_mock)
+        album_lib_mock.sp_albumbrowse_backend_request_duration.return_value = (
+            -1)
+        cache = spotify.BrowseCache(self.session)
+        album = self.create_album()
+        self.complete(album_lib_mock, cache.browse_album(album))
+
+        cache.browse_album(album)
+
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.backend_time_saved, 0)
+
+    def test_clear(self, album_lib_mock, artist_lib_mock, time_mock):
+        self.setup_libs(album_lib_mock, artist_lib_mock, time_mock)
+        cache = spotify.BrowseCache(self.session)
+        album = self.create_album()
+        browser = cache.browse_album(album)
+        self.complete(album_lib_mock, browser)
+        cache.browse_album(album)
+
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.backend_time_saved, 0)
+        self.assertIsNot(cache.browse_album(album), browser)
+
+    def test_repr(self, album_lib_mock, artist_lib_mock, time_mock):
+        cache = spotify.BrowseCache(self.session, max_size=10)
+
+        self.assertEqual(
+            repr(cache),
+            'BrowseCache(size=0, max_size=10, '
+            'hits=0, misses=0, coalesced=0)')
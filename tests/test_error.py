@@ -29,6 +29,16 @@ class ErrorTest(unittest.TestCase):
             spotify.ErrorType.BAD_API_VERSION,
             ignores=(spotify.ErrorType.BAD_API_VERSION,))
 
+    def test_maybe_raise_raises_if_error_is_not_ignored(self):
+        with self.assertRaises(spotify.LibError):
+            spotify.Error.maybe_raise(
+                spotify.ErrorType.BAD_API_VERSION,
+                ignores=[spotify.ErrorType.IS_LOADING])
+
+    def test_maybe_raise_does_not_raise_if_ok_and_other_errors_ignored(self):
+        spotify.Error.maybe_raise(
+            spotify.ErrorType.OK, ignores=[spotify.ErrorType.IS_LOADING])
+
 
 class LibErrorTest(unittest.TestCase):
 
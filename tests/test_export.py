@@ -0,0 +1,315 @@
+# encoding: utf-8
+
+from __future__ import unicode_literals
+
+import gzip
+import io
+import json
+import unittest
+
+import spotify
+from spotify import export
+import tests
+from tests import mock
+
+
+class ExportTest(unittest.TestCase):
+
+    def create_playlist_track_mock(
+            self, uri, creator='alice', create_time=1234567890, seen=False,
+            message=None):
+        playlist_track = mock.Mock(spec=spotify.PlaylistTrack)
+        playlist_track.track.link.uri = uri
+        playlist_track.creator.canonical_name = creator
+        playlist_track.create_time = create_time
+        playlist_track.seen = seen
+        playlist_track.message = message
+        return playlist_track
+
+    def create_playlist_mock(self, uri, name, tracks):
+        playlist = mock.Mock(spec=spotify.Playlist)
+        playlist.link.uri = uri
+        playlist.name = name
+        playlist.tracks = [
+            playlist_track.track for playlist_track in tracks]
+
+        def get_track_metadata(start, stop):
+            return spotify.PlaylistTrackMetadata(
+                create_times=[t.create_time for t in tracks[start:stop]],
+                seen=[t.seen for t in tracks[start:stop]],
+                creators=[
+                    t.creator.canonical_name for t in tracks[start:stop]],
+                messages=[t.message for t in tracks[start:stop]])
+
+        playlist.get_track_metadata.side_effect = get_track_metadata
+        return playlist
+
+    def create_container(self):
+        return [
+            spotify.PlaylistFolder(
+                id=17, name='Folder', type=spotify.PlaylistType.START_FOLDER),
+            self.create_playlist_mock(
+                'spotify:user:alice:playlist:foo', 'Føø', [
+                    self.create_playlist_track_mock('spotify:track:a'),
+                    self.create_playlist_track_mock(
+                        'spotify:track:b', creator='bob', seen=True,
+                        message='Hør her'),
+                ]),
+            spotify.PlaylistFolder(
+                id=17, name='', type=spotify.PlaylistType.END_FOLDER),
+            self.create_playlist_mock(
+                'spotify:user:alice:playlist:bar', 'Bar', []),
+        ]
+
+    expected_records = [
+        {'type': 'start_folder', 'id': 17, 'name': 'Folder'},
+        {
+            'type': 'playlist', 'uri': 'spotify:user:alice:playlist:foo',
+            'name': 'Føø', 'num_tracks': 2,
+        },
+        {
+            'type': 'track', 'uri': 'spotify:track:a', 'creator': 'alice',
+            'create_time': 1234567890, 'seen': False, 'message': None,
+        },
+        {
+            'type': 'track', 'uri': 'spotify:track:b', 'creator': 'bob',
+            'create_time': 1234567890, 'seen': True, 'message': 'Hør her',
+        },
+        {'type': 'end_folder', 'id': 17, 'name': ''},
+        {
+            'type': 'playlist', 'uri': 'spotify:user:alice:playlist:bar',
+            'name': 'Bar', 'num_tracks': 0,
+        },
+    ]
+
+    def test_iter_records(self):
+        records = export.iter_records(self.create_container())
+
+        self.assertEqual(list(records), self.expected_records)
+
+    def test_iter_records_is_lazy(self):
+        container = mock.MagicMock()
+        container.__len__.return_value = 1000
+        container.__getitem__.return_value = spotify.PlaylistFolder(
+            id=1, name='', type=spotify.PlaylistType.END_FOLDER)
+
+        records = export.iter_records(container)
+        next(records)
+
+        self.assertEqual(container.__getitem__.call_count, 1)
+
+    def test_iter_records_skips_unknown_items(self):
+        container = mock.MagicMock()
+        container.__len__.return_value = 2
+        container.__getitem__.side_effect = [
+            spotify.Error('Unknown playlist type'),
+            spotify.PlaylistFolder(
+                id=1, name='', type=spotify.PlaylistType.END_FOLDER),
+        ]
+
+        records = list(export.iter_records(container))
+
+        self.assertEqual(
+            records, [{'type': 'end_folder', 'id': 1, 'name': ''}])
+
+    def test_write_json_lines(self):
+        fileobj = io.BytesIO()
+
+        result = export.write_json_lines(
+            export.iter_records(self.create_container()), fileobj)
+
+        self.assertEqual(result, 6)
+        lines = fileobj.getvalue().decode('utf-8').splitlines()
+        self.assertEqual(
+            [json.loads(line) for line in lines], self.expected_records)
+
+    def test_write_json_lines_with_compression(self):
+        fileobj = io.BytesIO()
+
+        export.write_json_lines(
+            export.iter_records(self.create_container()), fileobj,
+            compress=True)
+
+        data = gzip.GzipFile(
+            fileobj=io.BytesIO(fileobj.getvalue())).read()
+        lines = data.decode('utf-8').splitlines()
+        self.assertEqual(
+            [json.loads(line) for line in lines], self.expected_records)
+        self.assertFalse(fileobj.closed)
+
+    def test_write_and_read_binary(self):
+        fileobj = io.BytesIO()
+
+        result = export.write_binary(
+            export.iter_records(self.create_container()), fileobj)
+
+        self.assertEqual(result, 6)
+        self.assertTrue(fileobj.getvalue().startswith(b'SPX\x01'))
+        fileobj.seek(0)
+        self.assertEqual(
+            list(export.read_binary(fileobj)), self.expected_records)
+
+    def test_binary_is_smaller_than_json_lines(self):
+        json_fileobj = io.BytesIO()
+        binary_fileobj = io.BytesIO()
+
+        export.write_json_lines(self.expected_records, json_fileobj)
+        export.write_binary(self.expected_records, binary_fileobj)
+
+        self.assertLess(
+            len(binary_fileobj.getvalue()), len(json_fileobj.getvalue()))
+
+    def test_write_and_read_binary_with_compression(self):
+        fileobj = io.BytesIO()
+
+        export.write_binary(self.expected_records, fileobj, compress=True)
+        fileobj.seek(0)
+
+        self.assertEqual(
+            list(export.read_binary(fileobj, compress=True)),
+            self.expected_records)
+
+    def test_read_binary_fails_on_wrong_header(self):
+        with self.assertRaises(ValueError):
+            list(export.read_binary(io.BytesIO(b'{"type":"track"}\n')))
+
+    def test_read_binary_fails_on_truncated_record(self):
+        fileobj = io.BytesIO()
+        export.write_binary(self.expected_records[:1], fileobj)
+
+        with self.assertRaises(ValueError):
+            list(export.read_binary(io.BytesIO(fileobj.getvalue()[:-1])))
+
+    def test_read_binary_fails_on_unknown_record_type(self):
+        fileobj = io.BytesIO(b'SPX\x01\x09\x00\x00\x00\x00')
+
+        with self.assertRaises(ValueError):
+            list(export.read_binary(fileobj))
+
+
+@mock.patch('spotify.link.lib', spec=spotify.lib)
+@mock.patch('spotify.track.lib', spec=spotify.lib)
+@mock.patch('spotify.playlist.lib', spec=spotify.lib)
+class IterPlaylistRecordsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = tests.create_session_mock()
+
+    def create_playlist(
+            self, playlist_lib_mock, track_lib_mock, link_lib_mock,
+            num_tracks, loaded=True):
+        # Track i is spotify:track:<i>, added by user<i % 2> at time i. The
+        # creator of track 1 is unknown. The playlist's link is pointer 1000.
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        sp_users = [spotify.ffi.cast('sp_user *', i + 1) for i in range(2)]
+        names = [spotify.ffi.new('char[]', b'user0'),
+                 spotify.ffi.new('char[]', b'user1')]
+        uris = {1000: 'spotify:user:alice:playlist:foo'}
+        uris.update(
+            (2000 + i, 'spotify:track:%d' % i) for i in range(num_tracks))
+
+        def link_as_string(sp_link, buffer_, buffer_size):
+            uri = uris[int(spotify.ffi.cast('intptr_t', sp_link))]
+            return tests.buffer_writer(uri)(buffer_, buffer_size)
+
+        def track_creator(sp_playlist, index):
+            return spotify.ffi.NULL if index == 1 else sp_users[index % 2]
+
+        playlist_lib_mock.sp_playlist_is_loaded.return_value = int(loaded)
+        playlist_lib_mock.sp_playlist_name.return_value = spotify.ffi.new(
+            'char[]', b'Foo')
+        playlist_lib_mock.sp_playlist_num_tracks.return_value = num_tracks
+        playlist_lib_mock.sp_link_create_from_playlist.return_value = (
+            spotify.ffi.cast('sp_link *', 1000))
+        playlist_lib_mock.sp_playlist_track.side_effect = (
+            lambda sp_playlist, index: spotify.ffi.cast(
+                'sp_track *', 100 + index))
+        playlist_lib_mock.sp_playlist_track_create_time.side_effect = (
+            lambda sp_playlist, index: index)
+        playlist_lib_mock.sp_playlist_track_seen.return_value = 0
+        playlist_lib_mock.sp_playlist_track_creator.side_effect = (
+            track_creator)
+        playlist_lib_mock.sp_user_canonical_name.side_effect = (
+            lambda sp_user: names[sp_users.index(sp_user)])
+        playlist_lib_mock.sp_playlist_track_message.return_value = (
+            spotify.ffi.NULL)
+        track_lib_mock.sp_link_create_from_track.side_effect = (
+            lambda sp_track, offset: spotify.ffi.cast(
+                'sp_link *',
+                2000 + int(spotify.ffi.cast('intptr_t', sp_track)) - 100))
+        link_lib_mock.sp_link_as_string.side_effect = link_as_string
+        return spotify.Playlist(self.session, sp_playlist=sp_playlist)
+
+    def test_loaded_playlist(
+            self, playlist_lib_mock, track_lib_mock, link_lib_mock):
+        playlist = self.create_playlist(
+            playlist_lib_mock, track_lib_mock, link_lib_mock, num_tracks=3)
+
+        records = list(export.iter_playlist_records(playlist))
+
+        self.assertEqual(records, [
+            {
+                'type': 'playlist', 'uri': 'spotify:user:alice:playlist:foo',
+                'name': 'Foo', 'num_tracks': 3,
+            },
+            {
+                'type': 'track', 'uri': 'spotify:track:0', 'creator': 'user0',
+                'create_time': 0, 'seen': False, 'message': None,
+            },
+            {
+                'type': 'track', 'uri': 'spotify:track:1', 'creator': None,
+                'create_time': 1, 'seen': False, 'message': None,
+            },
+            {
+                'type': 'track', 'uri': 'spotify:track:2', 'creator': 'user0',
+                'create_time': 2, 'seen': False, 'message': None,
+            },
+        ])
+
+    def test_unloaded_playlist_is_included_without_uri_and_tracks(
+            self, playlist_lib_mock, track_lib_mock, link_lib_mock):
+        playlist = self.create_playlist(
+            playlist_lib_mock, track_lib_mock, link_lib_mock, num_tracks=3,
+            loaded=False)
+
+        records = list(export.iter_playlist_records(playlist))
+
+        self.assertEqual(records, [{
+            'type': 'playlist', 'uri': None, 'name': 'Foo', 'num_tracks': 0,
+        }])
+
+    def test_unloaded_playlist_does_not_stop_export(
+            self, playlist_lib_mock, track_lib_mock, link_lib_mock):
+        playlist = self.create_playlist(
+            playlist_lib_mock, track_lib_mock, link_lib_mock, num_tracks=3,
+            loaded=False)
+        container = [
+            playlist,
+            spotify.PlaylistFolder(
+                id=1, name='', type=spotify.PlaylistType.END_FOLDER),
+        ]
+
+        records = list(export.iter_records(container))
+
+        self.assertEqual(
+            [record['type'] for record in records],
+            ['playlist', 'end_folder'])
+
+    @mock.patch('spotify.export._TRACK_CHUNK_SIZE', 2)
+    def test_reads_track_metadata_in_chunks(
+            self, playlist_lib_mock, track_lib_mock, link_lib_mock):
+        playlist = self.create_playlist(
+            playlist_lib_mock, track_lib_mock, link_lib_mock, num_tracks=5)
+
+        with mock.patch.object(
+                playlist, 'get_track_metadata',
+                wraps=playlist.get_track_metadata) as get_track_metadata:
+            records = list(export.iter_playlist_records(playlist))
+
+        self.assertEqual(
+            [record['create_time'] for record in records[1:]],
+            [0, 1, 2, 3, 4])
+        self.assertEqual(get_track_metadata.call_args_list, [
+            mock.call(0, 2), mock.call(2, 4), mock.call(4, 6)])
+        self.assertEqual(
+            playlist_lib_mock.sp_playlist_track_creator.call_count, 5)
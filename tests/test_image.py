@@ -70,7 +70,7 @@ class ImageTest(unittest.TestCase):
 
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_repr(self, link_mock, lib_mock):
-        link_instance_mock = link_mock.return_value
+        link_instance_mock = link_mock._cached.return_value
         link_instance_mock.uri = 'foo'
         lib_mock.sp_image_add_load_callback.return_value = int(
             spotify.ErrorType.OK)
@@ -329,11 +329,11 @@ class ImageTest(unittest.TestCase):
         image = spotify.Image(self.session, sp_image=sp_image)
         sp_link = spotify.ffi.cast('sp_link *', 43)
         lib_mock.sp_link_create_from_image.return_value = sp_link
-        link_mock.return_value = mock.sentinel.link
+        link_mock._cached.return_value = mock.sentinel.link
 
         result = image.link
 
-        link_mock.assert_called_once_with(
+        link_mock._cached.assert_called_once_with(
             self.session, sp_link=sp_link, add_ref=False)
         self.assertEqual(result, mock.sentinel.link)
 
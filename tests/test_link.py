@@ -84,6 +84,15 @@ class LinkTest(unittest.TestCase):
 
         lib_mock.sp_link_release.assert_called_with(sp_link)
 
+    def test_cached_link(self, lib_mock):
+        sp_link = spotify.ffi.cast('sp_link *', 42)
+
+        result1 = spotify.Link._cached(self.session, sp_link)
+        result2 = spotify.Link._cached(self.session, sp_link)
+
+        self.assertIsInstance(result1, spotify.Link)
+        self.assertIs(result1, result2)
+
     def test_repr(self, lib_mock):
         sp_link = spotify.ffi.cast('sp_link *', 42)
         lib_mock.sp_link_create_from_string.return_value = sp_link
@@ -373,3 +382,130 @@ class LinkTypeTest(unittest.TestCase):
         self.assertEqual(spotify.LinkType.INVALID, 0)
         self.assertEqual(spotify.LinkType.TRACK, 1)
         self.assertEqual(spotify.LinkType.ALBUM, 2)
+
+
+class ParseUriTest(unittest.TestCase):
+
+    def test_track(self):
+        result = spotify.parse_uri('spotify:track:2Foc5Q5nqNiosCNqttzHof')
+
+        self.assertIs(result.type, spotify.LinkType.TRACK)
+        self.assertEqual(result.uri, 'spotify:track:2Foc5Q5nqNiosCNqttzHof')
+        self.assertEqual(result.id, '2Foc5Q5nqNiosCNqttzHof')
+        self.assertIsNone(result.offset)
+        self.assertIsNone(result.user)
+
+    def test_track_with_offset(self):
+        result = spotify.parse_uri(
+            'spotify:track:2Foc5Q5nqNiosCNqttzHof#1:30')
+
+        self.assertIs(result.type, spotify.LinkType.TRACK)
+        self.assertEqual(result.id, '2Foc5Q5nqNiosCNqttzHof')
+        self.assertEqual(result.offset, 90000)
+
+    def test_album(self):
+        result = spotify.parse_uri('spotify:album:6wXDbHLesy6zWqQawAa91d')
+
+        self.assertIs(result.type, spotify.LinkType.ALBUM)
+        self.assertEqual(result.id, '6wXDbHLesy6zWqQawAa91d')
+
+    def test_artist(self):
+        result = spotify.parse_uri('spotify:artist:22xRIphSN7IkPVbErICu7s')
+
+        self.assertIs(result.type, spotify.LinkType.ARTIST)
+        self.assertEqual(result.id, '22xRIphSN7IkPVbErICu7s')
+
+    def test_playlist(self):
+        result = spotify.parse_uri(
+            'spotify:user:fiat500c:playlist:54k50VZdvtnIPt4d8RBCmZ')
+
+        self.assertIs(result.type, spotify.LinkType.PLAYLIST)
+        self.assertEqual(result.user, 'fiat500c')
+        self.assertEqual(result.id, '54k50VZdvtnIPt4d8RBCmZ')
+
+    def test_starred(self):
+        result = spotify.parse_uri('spotify:user:jodal:starred')
+
+        self.assertIs(result.type, spotify.LinkType.STARRED)
+        self.assertEqual(result.user, 'jodal')
+
+    def test_user(self):
+        result = spotify.parse_uri('spotify:user:p3.no')
+
+        self.assertIs(result.type, spotify.LinkType.PROFILE)
+        self.assertEqual(result.user, 'p3.no')
+
+    def test_user_with_quoted_name(self):
+        result = spotify.parse_uri('spotify:user:foo%40bar.com')
+
+        self.assertEqual(result.user, 'foo@bar.com')
+
+    def test_local_track(self):
+        result = spotify.parse_uri('spotify:local:Foo+Bar:Baz::210')
+
+        self.assertIs(result.type, spotify.LinkType.LOCALTRACK)
+        self.assertEqual(result.artist, 'Foo Bar')
+        self.assertEqual(result.album, 'Baz')
+        self.assertEqual(result.title, '')
+        self.assertEqual(result.duration, 210)
+
+    def test_local_track_without_any_info(self):
+        result = spotify.parse_uri('spotify:local::::')
+
+        self.assertIs(result.type, spotify.LinkType.LOCALTRACK)
+        self.assertIsNone(result.duration)
+
+    def test_image(self):
+        image_id = '0123456789abcdef0123456789abcdef01234567'
+
+        result = spotify.parse_uri('spotify:image:%s' % image_id)
+
+        self.assertIs(result.type, spotify.LinkType.IMAGE)
+        self.assertEqual(result.id, image_id)
+
+    def test_search(self):
+        result = spotify.parse_uri('spotify:search:artist%3Aabba+waterloo')
+
+        self.assertIs(result.type, spotify.LinkType.SEARCH)
+        self.assertEqual(result.query, 'artist:abba waterloo')
+
+    def test_open_spotify_com_url(self):
+        result = spotify.parse_uri(
+            'http://open.spotify.com/track/4wl1dK5dHGp3Ig51stvxb0')
+
+        self.assertIs(result.type, spotify.LinkType.TRACK)
+        self.assertEqual(result.uri, 'spotify:track:4wl1dK5dHGp3Ig51stvxb0')
+
+    def test_play_spotify_com_url(self):
+        result = spotify.parse_uri(
+            'https://play.spotify.com/track/4wl1dK5dHGp3Ig51stvxb0'
+            '?play=true&utm_source=open.spotify.com&utm_medium=open')
+
+        self.assertIs(result.type, spotify.LinkType.TRACK)
+        self.assertEqual(result.uri, 'spotify:track:4wl1dK5dHGp3Ig51stvxb0')
+
+    def test_bytes(self):
+        result = spotify.parse_uri(b'spotify:track:2Foc5Q5nqNiosCNqttzHof')
+
+        self.assertIs(result.type, spotify.LinkType.TRACK)
+
+    def test_invalid_uris_raises_value_error(self):
+        for uri in [
+                '',
+                'foo',
+                'spotify:',
+                'spotify:track:',
+                'spotify:track:tooshort',
+                'spotify:track:2Foc5Q5nqNiosCNqttzHof:extra',
+                'spotify:foo:2Foc5Q5nqNiosCNqttzHof',
+                'spotify:user:',
+                'spotify:image:nothex',
+                'http://example.com/track/4wl1dK5dHGp3Ig51stvxb0']:
+            with self.assertRaises(ValueError):
+                spotify.parse_uri(uri)
+
+    def test_does_not_call_libspotify(self):
+        with mock.patch('spotify.link.lib') as lib_mock:
+            spotify.parse_uri('spotify:track:2Foc5Q5nqNiosCNqttzHof')
+
+        self.assertEqual(lib_mock.mock_calls, [])
@@ -4,7 +4,7 @@ import time
 import unittest
 
 import spotify
-from spotify.utils import load
+from spotify.utils import load, load_all
 import tests
 from tests import mock
 
@@ -130,3 +130,66 @@ class LoadableTest(unittest.TestCase):
         result = foo.load()
 
         self.assertEqual(result, foo)
+
+
+class Bar(object):
+
+    def __init__(self, is_loaded=False, error=spotify.ErrorType.IS_LOADING):
+        self.is_loaded = is_loaded
+        self.error = error
+
+
+@mock.patch('spotify.utils.time')
+class LoadAllTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = tests.create_session_mock()
+        self.session.connection.state = spotify.ConnectionState.LOGGED_IN
+
+    def test_returns_immediately_if_all_are_loaded(self, time_mock):
+        objs = [Bar(is_loaded=True), Bar(is_loaded=True)]
+
+        result = load_all(self.session, objs)
+
+        self.assertEqual(result, objs)
+        self.assertEqual(self.session.process_events.call_count, 0)
+
+    def test_raises_error_if_not_logged_in(self, time_mock):
+        self.session.connection.state = spotify.ConnectionState.LOGGED_OUT
+
+        with self.assertRaises(spotify.Error):
+            load_all(self.session, [Bar()])
+
+    def test_processes_events_until_all_are_loaded(self, time_mock):
+        time_mock.time.return_value = 0
+        objs = [Bar(), Bar()]
+
+        def process_events():
+            if self.session.process_events.call_count == 2:
+                objs[0].is_loaded = True
+            if self.session.process_events.call_count == 3:
+                objs[1].is_loaded = True
+
+        self.session.process_events.side_effect = process_events
+
+        result = load_all(self.session, objs)
+
+        self.assertEqual(result, objs)
+        self.assertEqual(self.session.process_events.call_count, 3)
+
+    def test_does_not_wait_for_objects_with_errors(self, time_mock):
+        objs = [
+            Bar(is_loaded=True, error=spotify.ErrorType.OK),
+            Bar(error=spotify.ErrorType.OTHER_PERMANENT),
+        ]
+
+        result = load_all(self.session, objs)
+
+        self.assertEqual(result, objs)
+        self.assertEqual(self.session.process_events.call_count, 0)
+
+    def test_raises_error_when_timeout_is_reached(self, time_mock):
+        time_mock.time.side_effect = time.time
+
+        with self.assertRaises(spotify.Timeout):
+            load_all(self.session, [Bar()], timeout=0)
@@ -6,7 +6,7 @@ import collections
 import unittest
 
 import spotify
-from spotify.playlist import _PlaylistCallbacks
+from spotify.playlist import _PlaylistCallbacks, _plan_sync
 import tests
 from tests import mock
 
@@ -88,7 +88,7 @@ class PlaylistTest(unittest.TestCase):
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_repr(self, link_mock, lib_mock):
         lib_mock.sp_playlist_is_loaded.return_value = 1
-        link_instance_mock = link_mock.return_value
+        link_instance_mock = link_mock._cached.return_value
         link_instance_mock.uri = 'foo'
         sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
         playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
@@ -110,7 +110,7 @@ class PlaylistTest(unittest.TestCase):
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_repr_if_link_creation_fails(self, link_mock, lib_mock):
         lib_mock.sp_playlist_is_loaded.return_value = 1
-        link_mock.side_effect = spotify.Error('error message')
+        link_mock._cached.side_effect = spotify.Error('error message')
         sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
         playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
 
@@ -218,8 +218,9 @@ class PlaylistTest(unittest.TestCase):
 
         tracks[0] = mock.sentinel.track
 
-        playlist.add_tracks.assert_called_with(mock.sentinel.track, index=0)
-        playlist.remove_tracks.assert_called_with(1)
+        playlist.add_tracks.assert_called_once_with(
+            [mock.sentinel.track], index=0)
+        playlist.remove_tracks.assert_called_once_with([1])
 
     def test_tracks_setitem_with_slice(self, lib_mock):
         sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
@@ -231,14 +232,83 @@ class PlaylistTest(unittest.TestCase):
 
         tracks[0:2] = [mock.sentinel.track1, mock.sentinel.track2]
 
-        playlist.add_tracks.assert_has_calls([
-            mock.call(mock.sentinel.track1, index=0),
-            mock.call(mock.sentinel.track2, index=1),
-        ], any_order=False)
-        playlist.remove_tracks.assert_has_calls([
-            mock.call(3),
-            mock.call(2),
-        ], any_order=False)
+        playlist.add_tracks.assert_called_once_with(
+            [mock.sentinel.track1, mock.sentinel.track2], index=0)
+        playlist.remove_tracks.assert_called_once_with([2, 3])
+
+    def test_tracks_setitem_with_slice_of_other_length(self, lib_mock):
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+        tracks = playlist.tracks
+        tracks.__len__ = mock.Mock(return_value=5)
+        playlist.remove_tracks = mock.Mock()
+        playlist.add_tracks = mock.Mock()
+
+        tracks[1:4] = iter([mock.sentinel.track])
+
+        playlist.add_tracks.assert_called_once_with(
+            [mock.sentinel.track], index=1)
+        playlist.remove_tracks.assert_called_once_with([2, 3, 4])
+
+    def test_tracks_setitem_with_open_slice(self, lib_mock):
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+        tracks = playlist.tracks
+        tracks.__len__ = mock.Mock(return_value=2)
+        playlist.remove_tracks = mock.Mock()
+        playlist.add_tracks = mock.Mock()
+
+        tracks[:] = [mock.sentinel.track]
+
+        playlist.add_tracks.assert_called_once_with(
+            [mock.sentinel.track], index=0)
+        playlist.remove_tracks.assert_called_once_with([1, 2])
+
+    def test_tracks_setitem_with_empty_value_only_removes(self, lib_mock):
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+        tracks = playlist.tracks
+        tracks.__len__ = mock.Mock(return_value=5)
+        playlist.remove_tracks = mock.Mock()
+        playlist.add_tracks = mock.Mock()
+
+        tracks[3:] = []
+
+        self.assertEqual(playlist.add_tracks.call_count, 0)
+        playlist.remove_tracks.assert_called_once_with([3, 4])
+
+    def test_tracks_setitem_with_extended_slice(self, lib_mock):
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+        tracks = playlist.tracks
+        tracks.__len__ = mock.Mock(return_value=5)
+        playlist.remove_tracks = mock.Mock()
+        playlist.add_tracks = mock.Mock()
+
+        tracks[::-2] = [
+            mock.sentinel.track4, mock.sentinel.track2, mock.sentinel.track0]
+
+        playlist.remove_tracks.assert_called_once_with([0, 2, 4])
+        self.assertEqual(playlist.add_tracks.call_args_list, [
+            mock.call([mock.sentinel.track0], index=0),
+            mock.call([mock.sentinel.track2], index=2),
+            mock.call([mock.sentinel.track4], index=4),
+        ])
+
+    def test_tracks_setitem_with_extended_slice_of_other_length_fails(
+            self, lib_mock):
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+        tracks = playlist.tracks
+        tracks.__len__ = mock.Mock(return_value=5)
+        playlist.remove_tracks = mock.Mock()
+        playlist.add_tracks = mock.Mock()
+
+        with self.assertRaises(ValueError):
+            tracks[::2] = [mock.sentinel.track]
+
+        self.assertEqual(playlist.remove_tracks.call_count, 0)
+        self.assertEqual(playlist.add_tracks.call_count, 0)
 
     def test_tracks_setittem_with_slice_and_noniterable_value_fails(
             self, lib_mock):
@@ -303,11 +373,33 @@ class PlaylistTest(unittest.TestCase):
 
         del tracks[0:2]
 
-        # Delete items in reverse order, so the indexes doesn't change
-        lib_mock.sp_playlist_remove_tracks.assert_has_calls([
-            mock.call(sp_playlist, [1], 1),
-            mock.call(sp_playlist, [0], 1),
-        ], any_order=False)
+        lib_mock.sp_playlist_remove_tracks.assert_called_once_with(
+            sp_playlist, [0, 1], 2)
+
+    def test_tracks_delitem_with_large_slice_makes_a_single_call(
+            self, lib_mock):
+        lib_mock.sp_playlist_remove_tracks.return_value = int(
+            spotify.ErrorType.OK)
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+        tracks = playlist.tracks
+        tracks.__len__ = mock.Mock(return_value=10000)
+
+        del tracks[0:5000]
+
+        self.assertEqual(lib_mock.sp_playlist_remove_tracks.call_count, 1)
+        indexes = lib_mock.sp_playlist_remove_tracks.call_args[0][1]
+        self.assertEqual(sorted(indexes), list(range(5000)))
+
+    def test_tracks_delitem_with_empty_slice_does_nothing(self, lib_mock):
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+        tracks = playlist.tracks
+        tracks.__len__ = mock.Mock(return_value=3)
+
+        del tracks[2:1]
+
+        self.assertEqual(lib_mock.sp_playlist_remove_tracks.call_count, 0)
 
     def test_tracks_delitem_raises_index_error_on_negative_index(
             self, lib_mock):
@@ -354,8 +446,8 @@ class PlaylistTest(unittest.TestCase):
 
         tracks.insert(3, mock.sentinel.track)
 
-        playlist.add_tracks.assert_called_with(
-            mock.sentinel.track, index=3)
+        playlist.add_tracks.assert_called_once_with(
+            [mock.sentinel.track], index=3)
 
     @mock.patch('spotify.playlist_track.lib', spec=spotify.lib)
     def test_tracks_with_metadata(self, playlist_track_lib_mock, lib_mock):
@@ -407,6 +499,69 @@ class PlaylistTest(unittest.TestCase):
         lib_mock.sp_playlist_is_loaded.assert_called_with(sp_playlist)
         self.assertEqual(len(result), 0)
 
+    def test_get_track_metadata(self, lib_mock):
+        lib_mock.sp_playlist_num_tracks.return_value = 4
+        sp_alice = spotify.ffi.cast('sp_user *', 44)
+        sp_bob = spotify.ffi.cast('sp_user *', 45)
+        names = {
+            44: spotify.ffi.new('char[]', b'alice'),
+            45: spotify.ffi.new('char[]', b'bob'),
+        }
+        messages = [spotify.ffi.new('char[]', b'Hi'), spotify.ffi.NULL]
+        lib_mock.sp_playlist_track_create_time.side_effect = (
+            lambda sp_playlist, i: 1000 + i)
+        lib_mock.sp_playlist_track_seen.side_effect = (
+            lambda sp_playlist, i: i % 2)
+        lib_mock.sp_playlist_track_creator.side_effect = (
+            lambda sp_playlist, i: [
+                sp_alice, sp_bob, sp_alice, spotify.ffi.NULL][i])
+        lib_mock.sp_user_canonical_name.side_effect = (
+            lambda sp_user: names[int(spotify.ffi.cast('intptr_t', sp_user))])
+        lib_mock.sp_playlist_track_message.side_effect = (
+            lambda sp_playlist, i: messages[i % 2])
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+
+        result = playlist.get_track_metadata()
+
+        self.assertIsInstance(result, spotify.PlaylistTrackMetadata)
+        self.assertEqual(result.create_times, [1000, 1001, 1002, 1003])
+        self.assertEqual(result.seen, [False, True, False, True])
+        self.assertEqual(result.creators, ['alice', 'bob', 'alice', None])
+        self.assertEqual(result.messages, ['Hi', None, 'Hi', None])
+
+        # Each creator's name is only read once
+        self.assertEqual(lib_mock.sp_user_canonical_name.call_count, 2)
+        # No PlaylistTrack objects are created
+        self.assertEqual(lib_mock.sp_playlist_add_ref.call_count, 1)
+
+    def test_get_track_metadata_for_range(self, lib_mock):
+        lib_mock.sp_playlist_num_tracks.return_value = 10
+        lib_mock.sp_playlist_track_create_time.side_effect = (
+            lambda sp_playlist, i: 1000 + i)
+        lib_mock.sp_playlist_track_creator.return_value = spotify.ffi.NULL
+        lib_mock.sp_playlist_track_message.return_value = spotify.ffi.NULL
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+
+        self.assertEqual(
+            playlist.get_track_metadata(2, 5).create_times,
+            [1002, 1003, 1004])
+        self.assertEqual(
+            playlist.get_track_metadata(-2).create_times, [1008, 1009])
+        self.assertEqual(
+            playlist.get_track_metadata(8, 20).create_times, [1008, 1009])
+
+    def test_get_track_metadata_if_unloaded(self, lib_mock):
+        lib_mock.sp_playlist_is_loaded.return_value = 0
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+
+        result = playlist.get_track_metadata()
+
+        self.assertEqual(result, ([], [], [], []))
+        self.assertEqual(lib_mock.sp_playlist_num_tracks.call_count, 0)
+
     def test_name(self, lib_mock):
         lib_mock.sp_playlist_name.return_value = spotify.ffi.new(
             'char[]', b'Foo Bar Baz')
@@ -658,6 +813,213 @@ class PlaylistTest(unittest.TestCase):
         with self.assertRaises(spotify.Error):
             playlist.add_tracks([])
 
+    def create_tracks(self, num_tracks):
+        return [
+            spotify.Track(
+                self.session, sp_track=spotify.ffi.cast('sp_track *', i + 1))
+            for i in range(num_tracks)]
+
+    def record_add_tracks(self, lib_mock):
+        calls = []
+
+        def add_tracks(sp_playlist, sp_tracks, num_tracks, index, sp_session):
+            calls.append(
+                ([int(spotify.ffi.cast('intptr_t', sp_tracks[i]))
+                  for i in range(num_tracks)], index))
+            return int(spotify.ErrorType.OK)
+
+        lib_mock.sp_playlist_add_tracks.side_effect = add_tracks
+        return calls
+
+    @mock.patch('spotify.track.lib', spec=spotify.lib)
+    def test_add_tracks_in_chunks(self, track_lib_mock, lib_mock):
+        calls = self.record_add_tracks(lib_mock)
+        tracks = self.create_tracks(5)
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+
+        playlist.add_tracks_in_chunks(tracks, index=3, chunk_size=2)
+
+        self.assertEqual(calls, [([1, 2], 3), ([3, 4], 5), ([5], 7)])
+
+    @mock.patch('spotify.track.lib', spec=spotify.lib)
+    def test_add_tracks_in_chunks_without_index(
+            self, track_lib_mock, lib_mock):
+        calls = self.record_add_tracks(lib_mock)
+        lib_mock.sp_playlist_num_tracks.return_value = 10
+        tracks = self.create_tracks(3)
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+
+        playlist.add_tracks_in_chunks(tracks, chunk_size=2)
+
+        self.assertEqual(calls, [([1, 2], 10), ([3], 12)])
+
+    @mock.patch('spotify.track.lib', spec=spotify.lib)
+    def test_add_tracks_in_chunks_reports_progress(
+            self, track_lib_mock, lib_mock):
+        self.record_add_tracks(lib_mock)
+        tracks = self.create_tracks(5)
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+        callback = mock.Mock()
+
+        playlist.add_tracks_in_chunks(
+            tracks, index=0, chunk_size=2, callback=callback)
+
+        self.assertEqual(callback.call_args_list, [
+            mock.call(playlist, 2, 5),
+            mock.call(playlist, 4, 5),
+            mock.call(playlist, 5, 5),
+        ])
+
+    def test_add_tracks_in_chunks_with_no_tracks(self, lib_mock):
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+
+        playlist.add_tracks_in_chunks([], index=0)
+
+        self.assertEqual(lib_mock.sp_playlist_add_tracks.call_count, 0)
+
+    def test_add_tracks_in_chunks_fails_if_chunk_size_is_too_small(
+            self, lib_mock):
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+
+        with self.assertRaises(ValueError):
+            playlist.add_tracks_in_chunks([], index=0, chunk_size=0)
+
+    @mock.patch('spotify.track.lib', spec=spotify.lib)
+    def test_add_tracks_in_chunks_fails_if_error(
+            self, track_lib_mock, lib_mock):
+        lib_mock.sp_playlist_add_tracks.return_value = int(
+            spotify.ErrorType.PERMISSION_DENIED)
+        tracks = self.create_tracks(3)
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+
+        with self.assertRaises(spotify.Error):
+            playlist.add_tracks_in_chunks(tracks, index=0, chunk_size=2)
+
+        self.assertEqual(lib_mock.sp_playlist_add_tracks.call_count, 1)
+
+    @mock.patch('spotify.track.lib', spec=spotify.lib)
+    def test_add_tracks_in_chunks_waits_for_pending_changes(
+            self, track_lib_mock, lib_mock):
+        self.record_add_tracks(lib_mock)
+        lib_mock.sp_playlist_has_pending_changes.side_effect = [1, 1, 0, 0]
+        tracks = self.create_tracks(2)
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+
+        playlist.add_tracks_in_chunks(
+            tracks, index=0, chunk_size=1, wait=True)
+
+        self.assertEqual(self.session.process_events.call_count, 1)
+        self.assertEqual(
+            lib_mock.sp_playlist_has_pending_changes.call_count, 4)
+
+    @mock.patch('spotify.playlist.time')
+    @mock.patch('spotify.track.lib', spec=spotify.lib)
+    def test_add_tracks_in_chunks_times_out_waiting_for_pending_changes(
+            self, track_lib_mock, time_mock, lib_mock):
+        self.record_add_tracks(lib_mock)
+        lib_mock.sp_playlist_has_pending_changes.return_value = 1
+        time_mock.time.side_effect = [0, 0, 11]
+        tracks = self.create_tracks(2)
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+
+        with self.assertRaises(spotify.Timeout):
+            playlist.add_tracks_in_chunks(
+                tracks, index=0, chunk_size=1, wait=True, timeout=10)
+
+        self.assertEqual(lib_mock.sp_playlist_add_tracks.call_count, 1)
+
+    def create_track_mock(self, uri):
+        track = mock.Mock(spec=spotify.Track)
+        track.link.uri = uri
+        return track
+
+    def create_playlist_with_uris(self, uris):
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+        patcher = mock.patch.object(
+            spotify.Playlist, 'tracks', new_callable=mock.PropertyMock)
+        tracks_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+        tracks_mock.return_value = [self.create_track_mock(u) for u in uris]
+        playlist.remove_tracks = mock.Mock()
+        playlist.reorder_tracks = mock.Mock()
+        playlist.add_tracks = mock.Mock()
+        return playlist
+
+    def test_sync_to(self, lib_mock):
+        playlist = self.create_playlist_with_uris(['a', 'b', 'c', 'd'])
+        track_e = self.create_track_mock('e')
+
+        result = playlist.sync_to(['c', 'a', track_e, 'b'])
+
+        self.assertEqual(result, [
+            spotify.PlaylistSyncOperation('remove', [3], None, None),
+            spotify.PlaylistSyncOperation('reorder', [2], None, 0),
+            spotify.PlaylistSyncOperation('add', None, [track_e], 2),
+        ])
+        playlist.remove_tracks.assert_called_once_with([3])
+        playlist.reorder_tracks.assert_called_once_with([2], 0)
+        playlist.add_tracks.assert_called_once_with([track_e], index=2)
+
+    def test_sync_to_gets_tracks_from_added_uris(self, lib_mock):
+        playlist = self.create_playlist_with_uris(['a'])
+
+        playlist.sync_to(['a', 'spotify:track:foo'])
+
+        self.session.get_track.assert_called_once_with('spotify:track:foo')
+        playlist.add_tracks.assert_called_once_with(
+            [self.session.get_track.return_value], index=1)
+
+    def test_sync_to_does_nothing_if_playlist_is_in_sync(self, lib_mock):
+        playlist = self.create_playlist_with_uris(['a', 'b', 'a'])
+
+        result = playlist.sync_to(['a', 'b', 'a'])
+
+        self.assertEqual(result, [])
+        self.assertEqual(playlist.remove_tracks.call_count, 0)
+        self.assertEqual(playlist.reorder_tracks.call_count, 0)
+        self.assertEqual(playlist.add_tracks.call_count, 0)
+
+    def test_sync_to_reverses_playlist_in_few_reorders(self, lib_mock):
+        uris = ['spotify:track:%d' % i for i in range(1000)]
+        playlist = self.create_playlist_with_uris(uris)
+
+        playlist.sync_to(list(reversed(uris)))
+
+        self.assertEqual(playlist.reorder_tracks.call_count, 10)
+        self.assertEqual(playlist.remove_tracks.call_count, 0)
+        self.assertEqual(playlist.add_tracks.call_count, 0)
+
+    def test_sync_to_fails_if_playlist_is_not_loaded(self, lib_mock):
+        lib_mock.sp_playlist_is_loaded.return_value = 0
+        playlist = self.create_playlist_with_uris([])
+
+        with self.assertRaises(spotify.Error):
+            playlist.sync_to(['a'])
+
+        self.assertEqual(playlist.add_tracks.call_count, 0)
+
+    def test_sync_to_with_dry_run_does_not_change_playlist(self, lib_mock):
+        playlist = self.create_playlist_with_uris(['a', 'b'])
+
+        result = playlist.sync_to(['b', 'c'], dry_run=True)
+
+        self.assertEqual(result, [
+            spotify.PlaylistSyncOperation('remove', [0], None, None),
+            spotify.PlaylistSyncOperation('add', None, ['c'], 1),
+        ])
+        self.assertEqual(playlist.remove_tracks.call_count, 0)
+        self.assertEqual(playlist.reorder_tracks.call_count, 0)
+        self.assertEqual(playlist.add_tracks.call_count, 0)
+
     @mock.patch('spotify.track.lib', spec=spotify.lib)
     def test_remove_tracks(self, track_lib_mock, lib_mock):
         lib_mock.sp_playlist_remove_tracks.return_value = int(
@@ -908,11 +1270,11 @@ class PlaylistTest(unittest.TestCase):
         playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
         sp_link = spotify.ffi.cast('sp_link *', 43)
         lib_mock.sp_link_create_from_playlist.return_value = sp_link
-        link_mock.return_value = mock.sentinel.link
+        link_mock._cached.return_value = mock.sentinel.link
 
         result = playlist.link
 
-        link_mock.assert_called_once_with(
+        link_mock._cached.assert_called_once_with(
             self.session, sp_link=sp_link, add_ref=False)
         self.assertEqual(result, mock.sentinel.link)
 
@@ -1198,6 +1560,97 @@ class PlaylistCallbacksTest(unittest.TestCase):
         callback.assert_called_once_with(playlist)
 
 
+class PlanSyncTest(unittest.TestCase):
+
+    def apply(self, items, operations, target):
+        items = list(items)
+        for type_, indexes, index in operations:
+            if type_ == 'remove':
+                items = [
+                    item for i, item in enumerate(items) if i not in indexes]
+            elif type_ == 'reorder':
+                moved = [items[i] for i in indexes]
+                rest = [
+                    item for i, item in enumerate(items) if i not in indexes]
+                index -= len([i for i in indexes if i < index])
+                items = rest[:index] + moved + rest[index:]
+            elif type_ == 'add':
+                items[index:index] = [target[i] for i in indexes]
+        return items
+
+    def assert_syncs(self, current, target):
+        operations = _plan_sync(current, target)
+        self.assertEqual(self.apply(current, operations, target), target)
+        return operations
+
+    def test_nothing_to_do(self):
+        self.assertEqual(self.assert_syncs('abc', list('abc')), [])
+
+    def test_empty_lists(self):
+        self.assertEqual(self.assert_syncs([], []), [])
+
+    def test_removes_all_extra_items_at_once(self):
+        operations = self.assert_syncs('abcdef', list('bdf'))
+
+        self.assertEqual(operations, [('remove', [0, 2, 4], None)])
+
+    def test_adds_consecutive_items_at_once(self):
+        operations = self.assert_syncs('ad', list('abcdef'))
+
+        self.assertEqual(operations, [
+            ('add', [1, 2], 1),
+            ('add', [4, 5], 4),
+        ])
+
+    def test_moves_item_instead_of_removing_and_adding_it(self):
+        operations = self.assert_syncs('abcde', list('bcdea'))
+
+        self.assertEqual(operations, [('reorder', [0], 5)])
+
+    def test_moves_items_in_order_together(self):
+        operations = self.assert_syncs('abcdef', list('cdefab'))
+
+        self.assertEqual(operations, [('reorder', [0, 1], 6)])
+
+    def test_reverses_items(self):
+        operations = self.assert_syncs('abcd', list('dcba'))
+
+        self.assertEqual(len(operations), 2)
+
+    def test_reverses_many_items_in_few_reorders(self):
+        current = list(range(10000))
+
+        operations = self.assert_syncs(current, current[::-1])
+
+        self.assertEqual(len(operations), 14)
+
+    def test_moves_few_items_one_by_one(self):
+        operations = self.assert_syncs('abcdefgh', list('hbcdefga'))
+
+        self.assertEqual(operations, [
+            ('reorder', [7], 0),
+            ('reorder', [1], 8),
+        ])
+
+    def test_keeps_duplicates_in_order(self):
+        self.assert_syncs('abab', list('bbaa'))
+        self.assert_syncs('aab', list('aba'))
+        self.assert_syncs('aaa', list('a'))
+
+    def test_combines_removes_moves_and_adds(self):
+        operations = self.assert_syncs('abcdefgh', list('xhbcdyefz'))
+
+        self.assertEqual([type_ for type_, _, _ in operations], [
+            'remove', 'reorder', 'add', 'add', 'add'])
+
+    def test_large_reordering(self):
+        current = list(range(1000))
+        target = current[500:] + current[:500]
+        target[10:20] = reversed(target[10:20])
+
+        self.assert_syncs(current, target)
+
+
 class PlaylistOfflineStatusTest(unittest.TestCase):
 
     def test_has_constants(self):
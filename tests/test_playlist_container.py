@@ -230,9 +230,9 @@ class PlaylistContainerTest(unittest.TestCase):
 
         result = playlist_container[0]
 
-        lib_mock.sp_playlistcontainer_playlist_type.assert_called_with(
+        lib_mock.sp_playlistcontainer_playlist_type.assert_any_call(
             sp_playlistcontainer, 0)
-        lib_mock.sp_playlistcontainer_playlist_folder_id.assert_called_with(
+        lib_mock.sp_playlistcontainer_playlist_folder_id.assert_any_call(
             sp_playlistcontainer, 0)
         self.assertIsInstance(result, spotify.PlaylistFolder)
         self.assertEqual(result.id, 1001)
@@ -251,9 +251,9 @@ class PlaylistContainerTest(unittest.TestCase):
 
         result = playlist_container[2]
 
-        lib_mock.sp_playlistcontainer_playlist_type.assert_called_with(
+        lib_mock.sp_playlistcontainer_playlist_type.assert_any_call(
             sp_playlistcontainer, 2)
-        lib_mock.sp_playlistcontainer_playlist_folder_id.assert_called_with(
+        lib_mock.sp_playlistcontainer_playlist_folder_id.assert_any_call(
             sp_playlistcontainer, 2)
         self.assertIsInstance(result, spotify.PlaylistFolder)
         self.assertEqual(result.id, 1002)
@@ -309,14 +309,15 @@ class PlaylistContainerTest(unittest.TestCase):
         playlist_container = spotify.PlaylistContainer(
             self.session, sp_playlistcontainer=sp_playlistcontainer)
         playlist_container.__len__ = mock.Mock(return_value=5)
-        playlist_container.remove_playlist = mock.Mock()
+        playlist_container.remove_many = mock.Mock()
         playlist_container.add_new_playlist = mock.Mock()
+        playlist_container.move_playlist = mock.Mock()
 
         playlist_container[0] = 'New playlist'
 
-        playlist_container.add_new_playlist.assert_called_with(
-            'New playlist', index=0)
-        playlist_container.remove_playlist.assert_called_with(1)
+        playlist_container.add_new_playlist.assert_called_with('New playlist')
+        playlist_container.move_playlist.assert_called_with(5, 0)
+        playlist_container.remove_many.assert_called_with(range(1, 2))
 
     @mock.patch('spotify.playlist.lib', lib=spotify.lib)
     def test_setitem_with_existing_playlist(self, playlist_lib_mock, lib_mock):
@@ -326,13 +327,15 @@ class PlaylistContainerTest(unittest.TestCase):
         playlist_container = spotify.PlaylistContainer(
             self.session, sp_playlistcontainer=sp_playlistcontainer)
         playlist_container.__len__ = mock.Mock(return_value=5)
-        playlist_container.remove_playlist = mock.Mock()
+        playlist_container.remove_many = mock.Mock()
         playlist_container.add_playlist = mock.Mock()
+        playlist_container.move_playlist = mock.Mock()
 
         playlist_container[0] = playlist
 
-        playlist_container.add_playlist.assert_called_with(playlist, index=0)
-        playlist_container.remove_playlist.assert_called_with(1)
+        playlist_container.add_playlist.assert_called_with(playlist)
+        playlist_container.move_playlist.assert_called_with(5, 0)
+        playlist_container.remove_many.assert_called_with(range(1, 2))
 
     @mock.patch('spotify.playlist.lib', lib=spotify.lib)
     def test_setitem_with_slice(self, playlist_lib_mock, lib_mock):
@@ -342,17 +345,103 @@ class PlaylistContainerTest(unittest.TestCase):
         playlist_container = spotify.PlaylistContainer(
             self.session, sp_playlistcontainer=sp_playlistcontainer)
         playlist_container.__len__ = mock.Mock(return_value=5)
-        playlist_container.remove_playlist = mock.Mock()
+        playlist_container.remove_many = mock.Mock()
         playlist_container.add_new_playlist = mock.Mock()
         playlist_container.add_playlist = mock.Mock()
+        playlist_container.move_playlist = mock.Mock()
 
         playlist_container[0:2] = ['New playlist', playlist]
 
-        playlist_container.add_new_playlist.assert_called_with(
-            'New playlist', index=0)
-        playlist_container.add_playlist.assert_called_with(playlist, index=1)
-        playlist_container.remove_playlist.assert_has_calls(
-            [mock.call(3), mock.call(2)], any_order=False)
+        playlist_container.add_new_playlist.assert_called_with('New playlist')
+        playlist_container.add_playlist.assert_called_with(playlist)
+        playlist_container.move_playlist.assert_has_calls(
+            [mock.call(5, 0), mock.call(6, 1)], any_order=False)
+        playlist_container.remove_many.assert_called_with(range(2, 4))
+
+    @mock.patch('spotify.playlist.lib', lib=spotify.lib)
+    def test_setitem_with_slice_and_existing_playlists(
+            self, playlist_lib_mock, lib_mock):
+
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 43)
+        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
+        sp_playlistcontainer = spotify.ffi.cast('sp_playlistcontainer *', 42)
+        playlist_container = spotify.PlaylistContainer(
+            self.session, sp_playlistcontainer=sp_playlistcontainer)
+        playlist_container.__len__ = mock.Mock(return_value=5)
+        playlist_container.remove_many = mock.Mock()
+        playlist_container.add_new_playlist = mock.Mock()
+        playlist_container.add_playlist = mock.Mock(return_value=None)
+        playlist_container.move_playlist = mock.Mock()
+
+        playlist_container[1:3] = [playlist, 'New playlist']
+
+        # The existing playlist isn't added, and doesn't shift the indexes
+        playlist_container.move_playlist.assert_called_once_with(5, 1)
+        playlist_container.remove_many.assert_called_with(range(2, 4))
+
+    def create_container_with_names(self, names):
+        # A container where adding, removing, and moving playlists changes the
+        # given list of playlist names.
+        sp_playlistcontainer = spotify.ffi.cast('sp_playlistcontainer *', 42)
+        playlist_container = spotify.PlaylistContainer(
+            self.session, sp_playlistcontainer=sp_playlistcontainer)
+
+        def insert_many(items, index=None):
+            names.extend(items)
+            return list(items)
+
+        def remove_many(indexes):
+            for i in sorted(indexes, reverse=True):
+                del names[i]
+
+        def move_playlist(index, new_index):
+            names.insert(new_index, names.pop(index))
+
+        playlist_container.__len__ = mock.Mock(
+            side_effect=lambda: len(names))
+        playlist_container.insert_many = mock.Mock(side_effect=insert_many)
+        playlist_container.remove_many = mock.Mock(side_effect=remove_many)
+        playlist_container.move_playlist = mock.Mock(
+            side_effect=move_playlist)
+        return playlist_container
+
+    def test_setitem_with_extended_slice(self, lib_mock):
+        names = ['a', 'b', 'c', 'd', 'e']
+        playlist_container = self.create_container_with_names(names)
+
+        playlist_container[::2] = ['x', 'y', 'z']
+
+        self.assertEqual(names, ['x', 'b', 'y', 'd', 'z'])
+        playlist_container.remove_many.assert_called_once_with(range(0, 5, 2))
+
+    def test_setitem_with_negative_step_slice(self, lib_mock):
+        names = ['a', 'b', 'c', 'd', 'e']
+        playlist_container = self.create_container_with_names(names)
+
+        playlist_container[::-1] = ['v', 'w', 'x', 'y', 'z']
+
+        self.assertEqual(names, ['z', 'y', 'x', 'w', 'v'])
+
+    def test_setitem_with_extended_slice_and_existing_playlist(
+            self, lib_mock):
+        names = ['a', 'b', 'c', 'd']
+        playlist_container = self.create_container_with_names(names)
+        playlist_container.insert_many.side_effect = lambda items: (
+            names.extend(['y']) or [None, 'y'])
+
+        playlist_container[::2] = ['x', 'y']
+
+        # The existing playlist isn't added, and doesn't leave a gap
+        self.assertEqual(names, ['b', 'y', 'd'])
+
+    def test_setitem_with_extended_slice_of_wrong_size_fails(self, lib_mock):
+        names = ['a', 'b', 'c', 'd']
+        playlist_container = self.create_container_with_names(names)
+
+        with self.assertRaises(ValueError):
+            playlist_container[::2] = ['x']
+
+        self.assertEqual(names, ['a', 'b', 'c', 'd'])
 
     @mock.patch('spotify.playlist.lib', lib=spotify.lib)
     def test_setittem_with_slice_and_noniterable_value_fails(
@@ -375,14 +464,14 @@ class PlaylistContainerTest(unittest.TestCase):
         playlist_container = spotify.PlaylistContainer(
             self.session, sp_playlistcontainer=sp_playlistcontainer)
         playlist_container.__len__ = mock.Mock(return_value=1)
-        playlist_container.remove_playlist = mock.Mock()
+        playlist_container.remove_many = mock.Mock()
         playlist_container.add_new_playlist = mock.Mock(side_effect=ValueError)
 
         with self.assertRaises(ValueError):
             playlist_container[0] = False
 
-        playlist_container.add_new_playlist.assert_called_with(False, index=0)
-        self.assertEqual(playlist_container.remove_playlist.call_count, 0)
+        playlist_container.add_new_playlist.assert_called_with(False)
+        self.assertEqual(playlist_container.remove_many.call_count, 0)
 
     def test_setitem_raises_index_error_on_negative_index(self, lib_mock):
         sp_playlistcontainer = spotify.ffi.cast('sp_playlistcontainer *', 42)
@@ -427,13 +516,11 @@ class PlaylistContainerTest(unittest.TestCase):
         playlist_container = spotify.PlaylistContainer(
             self.session, sp_playlistcontainer=sp_playlistcontainer)
         playlist_container.__len__ = mock.Mock(return_value=3)
-        playlist_container.remove_playlist = mock.Mock()
+        playlist_container.remove_many = mock.Mock()
 
         del playlist_container[0:2]
 
-        # Delete items in reverse order, so the indexes doesn't change
-        playlist_container.remove_playlist.assert_has_calls(
-            [mock.call(1), mock.call(0)], any_order=False)
+        playlist_container.remove_many.assert_called_once_with(range(0, 2))
 
     def test_delitem_raises_index_error_on_negative_index(self, lib_mock):
         sp_playlistcontainer = spotify.ffi.cast('sp_playlistcontainer *', 42)
@@ -467,13 +554,14 @@ class PlaylistContainerTest(unittest.TestCase):
         playlist_container = spotify.PlaylistContainer(
             self.session, sp_playlistcontainer=sp_playlistcontainer)
         playlist_container.__len__ = mock.Mock(return_value=5)
-        playlist_container.remove_playlist = mock.Mock()
+        playlist_container.remove_many = mock.Mock()
         playlist_container.add_new_playlist = mock.Mock()
+        playlist_container.move_playlist = mock.Mock()
 
         playlist_container.insert(3, 'New playlist')
 
-        playlist_container.add_new_playlist.assert_called_with(
-            'New playlist', index=3)
+        playlist_container.add_new_playlist.assert_called_with('New playlist')
+        playlist_container.move_playlist.assert_called_with(5, 3)
 
     @mock.patch('spotify.playlist.lib', spec=spotify.lib)
     def test_insert_with_existing_playlist(self, playlist_lib_mock, lib_mock):
@@ -483,12 +571,14 @@ class PlaylistContainerTest(unittest.TestCase):
         playlist_container = spotify.PlaylistContainer(
             self.session, sp_playlistcontainer=sp_playlistcontainer)
         playlist_container.__len__ = mock.Mock(return_value=5)
-        playlist_container.remove_playlist = mock.Mock()
+        playlist_container.remove_many = mock.Mock()
         playlist_container.add_playlist = mock.Mock()
+        playlist_container.move_playlist = mock.Mock()
 
         playlist_container.insert(3, playlist)
 
-        playlist_container.add_playlist.assert_called_with(playlist, index=3)
+        playlist_container.add_playlist.assert_called_with(playlist)
+        playlist_container.move_playlist.assert_called_with(5, 3)
 
     def test_is_a_sequence(self, lib_mock):
         sp_playlistcontainer = spotify.ffi.cast('sp_playlistcontainer *', 42)
@@ -812,22 +902,22 @@ class PlaylistContainerTest(unittest.TestCase):
         lib_mock.sp_playlistcontainer_num_playlists.return_value = 3
         sp_playlist = spotify.ffi.cast('sp_playlist *', 43)
         lib_mock.sp_playlistcontainer_playlist.return_value = sp_playlist
-        lib_mock.sp_playlistcontainer_playlist_type.side_effect = [
+        types = [
             int(spotify.PlaylistType.START_FOLDER),
             int(spotify.PlaylistType.PLAYLIST),
             int(spotify.PlaylistType.END_FOLDER),
         ]
-        lib_mock.sp_playlistcontainer_playlist_folder_id.side_effect = [
-            173, 173]
-        playlist_container._find_folder_indexes = lambda *a: [0, 2]
+        lib_mock.sp_playlistcontainer_playlist_type.side_effect = (
+            lambda sp_pc, i: types[i])
+        lib_mock.sp_playlistcontainer_playlist_folder_id.return_value = 173
         lib_mock.sp_playlistcontainer_remove_playlist.return_value = int(
             spotify.ErrorType.OK)
 
         playlist_container.remove_playlist(0)
 
-        lib_mock.sp_playlistcontainer_playlist_type.assert_called_with(
+        lib_mock.sp_playlistcontainer_playlist_type.assert_any_call(
             sp_playlistcontainer, 0)
-        lib_mock.sp_playlistcontainer_playlist_folder_id.assert_called_with(
+        lib_mock.sp_playlistcontainer_playlist_folder_id.assert_any_call(
             sp_playlistcontainer, 0)
         lib_mock.sp_playlistcontainer_remove_playlist.assert_has_calls([
             mock.call(sp_playlistcontainer, 2),
@@ -841,22 +931,22 @@ class PlaylistContainerTest(unittest.TestCase):
         lib_mock.sp_playlistcontainer_num_playlists.return_value = 3
         sp_playlist = spotify.ffi.cast('sp_playlist *', 43)
         lib_mock.sp_playlistcontainer_playlist.return_value = sp_playlist
-        lib_mock.sp_playlistcontainer_playlist_type.side_effect = [
+        types = [
             int(spotify.PlaylistType.START_FOLDER),
             int(spotify.PlaylistType.PLAYLIST),
             int(spotify.PlaylistType.END_FOLDER),
         ]
-        lib_mock.sp_playlistcontainer_playlist_folder_id.side_effect = [
-            173, 173]
-        playlist_container._find_folder_indexes = lambda *a: [0, 2]
+        lib_mock.sp_playlistcontainer_playlist_type.side_effect = (
+            lambda sp_pc, i: types[i])
+        lib_mock.sp_playlistcontainer_playlist_folder_id.return_value = 173
         lib_mock.sp_playlistcontainer_remove_playlist.return_value = int(
             spotify.ErrorType.OK)
 
         playlist_container.remove_playlist(2)
 
-        lib_mock.sp_playlistcontainer_playlist_type.assert_called_with(
+        lib_mock.sp_playlistcontainer_playlist_type.assert_any_call(
             sp_playlistcontainer, 2)
-        lib_mock.sp_playlistcontainer_playlist_folder_id.assert_called_with(
+        lib_mock.sp_playlistcontainer_playlist_folder_id.assert_any_call(
             sp_playlistcontainer, 2)
         lib_mock.sp_playlistcontainer_remove_playlist.assert_has_calls([
             mock.call(sp_playlistcontainer, 2),
@@ -870,22 +960,22 @@ class PlaylistContainerTest(unittest.TestCase):
         lib_mock.sp_playlistcontainer_num_playlists.return_value = 3
         sp_playlist = spotify.ffi.cast('sp_playlist *', 43)
         lib_mock.sp_playlistcontainer_playlist.return_value = sp_playlist
-        lib_mock.sp_playlistcontainer_playlist_type.side_effect = [
+        types = [
             int(spotify.PlaylistType.START_FOLDER),
             int(spotify.PlaylistType.PLAYLIST),
             int(spotify.PlaylistType.END_FOLDER),
         ]
-        lib_mock.sp_playlistcontainer_playlist_folder_id.side_effect = [
-            173, 173]
-        playlist_container._find_folder_indexes = lambda *a: [0, 1, 2]
+        lib_mock.sp_playlistcontainer_playlist_type.side_effect = (
+            lambda sp_pc, i: types[i])
+        lib_mock.sp_playlistcontainer_playlist_folder_id.return_value = 173
         lib_mock.sp_playlistcontainer_remove_playlist.return_value = int(
             spotify.ErrorType.OK)
 
         playlist_container.remove_playlist(0, recursive=True)
 
-        lib_mock.sp_playlistcontainer_playlist_type.assert_called_with(
+        lib_mock.sp_playlistcontainer_playlist_type.assert_any_call(
             sp_playlistcontainer, 0)
-        lib_mock.sp_playlistcontainer_playlist_folder_id.assert_called_with(
+        lib_mock.sp_playlistcontainer_playlist_folder_id.assert_any_call(
             sp_playlistcontainer, 0)
         lib_mock.sp_playlistcontainer_remove_playlist.assert_has_calls([
             mock.call(sp_playlistcontainer, 2),
@@ -893,92 +983,429 @@ class PlaylistContainerTest(unittest.TestCase):
             mock.call(sp_playlistcontainer, 0),
         ], any_order=False)
 
+    def create_playlist_container(self, lib_mock, items):
+        # Items are (type, folder ID) tuples, which can be changed by the test
+        lib_mock.sp_playlistcontainer_num_playlists.side_effect = (
+            lambda sp_pc: len(items))
+        lib_mock.sp_playlistcontainer_playlist_type.side_effect = (
+            lambda sp_pc, i: int(items[i][0]))
+        lib_mock.sp_playlistcontainer_playlist_folder_id.side_effect = (
+            lambda sp_pc, i: items[i][1])
+        lib_mock.sp_playlistcontainer_playlist_folder_name.side_effect = (
+            tests.buffer_writer('foo'))
+        lib_mock.sp_playlistcontainer_playlist.side_effect = (
+            lambda sp_pc, i: spotify.ffi.cast('sp_playlist *', 100 + i))
+        lib_mock.sp_playlistcontainer_remove_playlist.return_value = int(
+            spotify.ErrorType.OK)
+        sp_playlistcontainer = spotify.ffi.cast('sp_playlistcontainer *', 42)
+        return spotify.PlaylistContainer(
+            self.session, sp_playlistcontainer=sp_playlistcontainer)
+
     @mock.patch('spotify.playlist.lib', spec=spotify.lib)
-    def test_find_folder_indexes(self, playlist_lib_mock, lib_mock):
-        sp_playlist = spotify.ffi.cast('sp_playlist *', 43)
-        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
-        playlists = [
-            spotify.PlaylistFolder(
-                173, 'foo', spotify.PlaylistType.START_FOLDER),
-            playlist,
-            spotify.PlaylistFolder(
-                173, '', spotify.PlaylistType.END_FOLDER),
-        ]
+    def test_tree(self, playlist_lib_mock, lib_mock):
+        playlist_container = self.create_playlist_container(lib_mock, [
+            (spotify.PlaylistType.PLAYLIST, 0),
+            (spotify.PlaylistType.START_FOLDER, 173),
+            (spotify.PlaylistType.PLAYLIST, 0),
+            (spotify.PlaylistType.START_FOLDER, 174),
+            (spotify.PlaylistType.PLAYLIST, 0),
+            (spotify.PlaylistType.END_FOLDER, 174),
+            (spotify.PlaylistType.END_FOLDER, 173),
+            (spotify.PlaylistType.PLAYLIST, 0),
+        ])
+
+        result = playlist_container.tree()
+
+        self.assertEqual(len(result), 3)
+        self.assertIsInstance(result[0], spotify.Playlist)
+        self.assertEqual(
+            result[0]._sp_playlist, spotify.ffi.cast('sp_playlist *', 100))
+        self.assertIsInstance(result[1], spotify.PlaylistFolderNode)
+        self.assertEqual(result[1].id, 173)
+        self.assertEqual(result[1].name, 'foo')
+        self.assertEqual(len(result[1].items), 2)
+        self.assertEqual(
+            result[1].items[0]._sp_playlist,
+            spotify.ffi.cast('sp_playlist *', 102))
+        self.assertEqual(result[1].items[1].id, 174)
+        self.assertEqual(len(result[1].items[1].items), 1)
+        self.assertEqual(
+            result[1].items[1].items[0]._sp_playlist,
+            spotify.ffi.cast('sp_playlist *', 104))
+        self.assertEqual(
+            result[2]._sp_playlist, spotify.ffi.cast('sp_playlist *', 107))
+        self.assertEqual(
+            playlist_container._folder_ranges, {173: [1, 6], 174: [3, 5]})
 
-        result = spotify.PlaylistContainer._find_folder_indexes(
-            playlists, 173, recursive=False)
+    @mock.patch('spotify.playlist.lib', spec=spotify.lib)
+    def test_tree_with_unbalanced_folders(self, playlist_lib_mock, lib_mock):
+        playlist_container = self.create_playlist_container(lib_mock, [
+            (spotify.PlaylistType.END_FOLDER, 175),
+            (spotify.PlaylistType.PLAYLIST, 0),
+            (spotify.PlaylistType.START_FOLDER, 173),
+            (spotify.PlaylistType.PLAYLIST, 0),
+        ])
 
-        self.assertEqual(result, [0, 2])
+        result = playlist_container.tree()
+
+        self.assertEqual(len(result), 2)
+        self.assertIsInstance(result[0], spotify.Playlist)
+        self.assertEqual(result[1].id, 173)
+        self.assertEqual(len(result[1].items), 1)
 
     @mock.patch('spotify.playlist.lib', spec=spotify.lib)
-    def test_find_folder_indexes_with_unknown_id(
+    def test_remove_folder_uses_folder_index(
             self, playlist_lib_mock, lib_mock):
 
-        sp_playlist = spotify.ffi.cast('sp_playlist *', 43)
-        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
-        playlists = [
-            spotify.PlaylistFolder(
-                173, 'foo', spotify.PlaylistType.START_FOLDER),
-            playlist,
-            spotify.PlaylistFolder(
-                173, '', spotify.PlaylistType.END_FOLDER),
-        ]
+        playlist_container = self.create_playlist_container(lib_mock, [
+            (spotify.PlaylistType.PLAYLIST, 0),
+            (spotify.PlaylistType.START_FOLDER, 173),
+            (spotify.PlaylistType.PLAYLIST, 0),
+            (spotify.PlaylistType.END_FOLDER, 173),
+        ] + [(spotify.PlaylistType.PLAYLIST, 0)] * 100)
+        playlist_container.tree()
+        lib_mock.sp_playlistcontainer_playlist_type.reset_mock()
 
-        result = spotify.PlaylistContainer._find_folder_indexes(
-            playlists, 174, recursive=False)
+        playlist_container.remove_playlist(1, recursive=True)
 
-        self.assertEqual(result, [])
+        # Only the folder's start and end are checked, not all the playlists
+        self.assertEqual(
+            lib_mock.sp_playlistcontainer_playlist_type.call_count, 3)
+        lib_mock.sp_playlistcontainer_remove_playlist.assert_has_calls([
+            mock.call(playlist_container._sp_playlistcontainer, 3),
+            mock.call(playlist_container._sp_playlistcontainer, 2),
+            mock.call(playlist_container._sp_playlistcontainer, 1),
+        ], any_order=False)
 
     @mock.patch('spotify.playlist.lib', spec=spotify.lib)
-    def test_find_folder_indexes_recursive(self, playlist_lib_mock, lib_mock):
-        sp_playlist = spotify.ffi.cast('sp_playlist *', 43)
-        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
-        playlists = [
-            spotify.PlaylistFolder(
-                173, 'foo', spotify.PlaylistType.START_FOLDER),
-            playlist,
-            spotify.PlaylistFolder(
-                173, '', spotify.PlaylistType.END_FOLDER),
+    def test_remove_folder_rebuilds_outdated_folder_index(
+            self, playlist_lib_mock, lib_mock):
+
+        items = [
+            (spotify.PlaylistType.START_FOLDER, 173),
+            (spotify.PlaylistType.PLAYLIST, 0),
+            (spotify.PlaylistType.END_FOLDER, 173),
         ]
+        playlist_container = self.create_playlist_container(lib_mock, items)
+        playlist_container.tree()
+        items.insert(0, (spotify.PlaylistType.PLAYLIST, 0))
 
-        result = spotify.PlaylistContainer._find_folder_indexes(
-            playlists, 173, recursive=True)
+        playlist_container.remove_playlist(1)
 
-        self.assertEqual(result, [0, 1, 2])
+        self.assertEqual(playlist_container._folder_ranges, {173: [1, 3]})
+        lib_mock.sp_playlistcontainer_remove_playlist.assert_has_calls([
+            mock.call(playlist_container._sp_playlistcontainer, 3),
+            mock.call(playlist_container._sp_playlistcontainer, 1),
+        ], any_order=False)
 
     @mock.patch('spotify.playlist.lib', spec=spotify.lib)
-    def test_find_folder_indexes_without_end(
+    def test_remove_many(self, playlist_lib_mock, lib_mock):
+        playlist_container = self.create_playlist_container(
+            lib_mock, [(spotify.PlaylistType.PLAYLIST, 0)] * 100)
+        lib_mock.reset_mock()
+
+        playlist_container.remove_many(range(0, 100, 2))
+
+        lib_mock.sp_playlistcontainer_remove_playlist.assert_has_calls([
+            mock.call(playlist_container._sp_playlistcontainer, i)
+            for i in range(98, -1, -2)], any_order=False)
+        # One call to get the length, and one type check and one removal per
+        # playlist. Removing the playlists one by one with remove_playlist()
+        # used to take six calls per playlist.
+        self.assertEqual(len(lib_mock.method_calls), 1 + 50 + 50)
+
+    @mock.patch('spotify.playlist.lib', spec=spotify.lib)
+    def test_remove_many_with_folders(self, playlist_lib_mock, lib_mock):
+        playlist_container = self.create_playlist_container(lib_mock, [
+            (spotify.PlaylistType.PLAYLIST, 0),
+            (spotify.PlaylistType.START_FOLDER, 173),
+            (spotify.PlaylistType.PLAYLIST, 0),
+            (spotify.PlaylistType.END_FOLDER, 173),
+            (spotify.PlaylistType.PLAYLIST, 0),
+        ])
+
+        playlist_container.remove_many([-1, 0, 1, 3])
+
+        # Each end of the folder is only removed once
+        lib_mock.sp_playlistcontainer_remove_playlist.assert_has_calls([
+            mock.call(playlist_container._sp_playlistcontainer, 4),
+            mock.call(playlist_container._sp_playlistcontainer, 3),
+            mock.call(playlist_container._sp_playlistcontainer, 1),
+            mock.call(playlist_container._sp_playlistcontainer, 0),
+        ], any_order=False)
+        self.assertEqual(
+            lib_mock.sp_playlistcontainer_remove_playlist.call_count, 4)
+
+    @mock.patch('spotify.playlist.lib', spec=spotify.lib)
+    def test_remove_many_checks_indexes_before_removing(
             self, playlist_lib_mock, lib_mock):
 
+        playlist_container = self.create_playlist_container(lib_mock, [
+            (spotify.PlaylistType.PLAYLIST, 0),
+            (spotify.PlaylistType.PLAYLIST, 0),
+        ])
+
+        with self.assertRaises(IndexError):
+            playlist_container.remove_many([0, 2])
+
+        self.assertEqual(
+            lib_mock.sp_playlistcontainer_remove_playlist.call_count, 0)
+
+    @mock.patch('spotify.playlist.lib', spec=spotify.lib)
+    def test_insert_many(self, playlist_lib_mock, lib_mock):
+        playlist_container = self.create_playlist_container(
+            lib_mock, [(spotify.PlaylistType.PLAYLIST, 0)] * 3)
         sp_playlist = spotify.ffi.cast('sp_playlist *', 43)
-        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
-        playlists = [
-            spotify.PlaylistFolder(
-                173, 'foo', spotify.PlaylistType.START_FOLDER),
-            playlist,
-        ]
+        lib_mock.sp_playlistcontainer_add_new_playlist.return_value = (
+            sp_playlist)
+        lib_mock.sp_playlistcontainer_move_playlist.return_value = int(
+            spotify.ErrorType.OK)
+        lib_mock.reset_mock()
+
+        result = playlist_container.insert_many(['foo', 'bar'], index=1)
+
+        self.assertEqual(
+            [playlist._sp_playlist for playlist in result],
+            [sp_playlist, sp_playlist])
+        lib_mock.sp_playlistcontainer_add_new_playlist.assert_has_calls([
+            mock.call(playlist_container._sp_playlistcontainer, mock.ANY),
+            mock.call(playlist_container._sp_playlistcontainer, mock.ANY),
+        ])
+        lib_mock.sp_playlistcontainer_move_playlist.assert_has_calls([
+            mock.call(playlist_container._sp_playlistcontainer, 3, 1, 0),
+            mock.call(playlist_container._sp_playlistcontainer, 4, 2, 0),
+        ], any_order=False)
+        # The length is only read once, instead of once per playlist
+        self.assertEqual(len(lib_mock.method_calls), 1 + 2 + 2)
 
-        result = spotify.PlaylistContainer._find_folder_indexes(
-            playlists, 173, recursive=True)
+    @mock.patch('spotify.playlist.lib', spec=spotify.lib)
+    def test_insert_many_at_end(self, playlist_lib_mock, lib_mock):
+        playlist_container = self.create_playlist_container(
+            lib_mock, [(spotify.PlaylistType.PLAYLIST, 0)] * 3)
+        lib_mock.sp_playlistcontainer_add_new_playlist.return_value = (
+            spotify.ffi.cast('sp_playlist *', 43))
+
+        playlist_container.insert_many(['foo', 'bar'])
+
+        self.assertEqual(
+            lib_mock.sp_playlistcontainer_add_new_playlist.call_count, 2)
+        self.assertEqual(
+            lib_mock.sp_playlistcontainer_move_playlist.call_count, 0)
+
+    def create_indexed_playlists(self, playlist_lib_mock, link_mock, names):
+        # Playlists with the pointer values in ``names`` are loaded
+        def pointer(sp_obj):
+            return int(spotify.ffi.cast('intptr_t', sp_obj))
+
+        buffers = {}
+
+        def name(sp_playlist):
+            return buffers.setdefault(
+                pointer(sp_playlist),
+                spotify.ffi.new('char[]', names[pointer(sp_playlist)]))
+
+        playlist_lib_mock.sp_playlist_is_loaded.side_effect = (
+            lambda sp_playlist: int(pointer(sp_playlist) in names))
+        playlist_lib_mock.sp_playlist_name.side_effect = name
+        playlist_lib_mock.sp_link_create_from_playlist.side_effect = (
+            lambda sp_playlist: spotify.ffi.cast('sp_link *', sp_playlist))
+        link_mock._cached.side_effect = lambda session, sp_link, add_ref: (
+            mock.Mock(uri='spotify:user:alice:playlist:%d' % pointer(sp_link)))
+
+    @mock.patch('spotify.Link', spec=spotify.Link)
+    @mock.patch('spotify.playlist.lib', spec=spotify.lib)
+    def test_find_by_name(self, playlist_lib_mock, link_mock, lib_mock):
+        self.create_indexed_playlists(
+            playlist_lib_mock, link_mock,
+            {100: b'foo', 102: b'bar', 104: b'foo'})
+        playlist_container = self.create_playlist_container(lib_mock, [
+            (spotify.PlaylistType.PLAYLIST, 0),
+            (spotify.PlaylistType.START_FOLDER, 173),
+            (spotify.PlaylistType.PLAYLIST, 0),
+            (spotify.PlaylistType.END_FOLDER, 173),
+            (spotify.PlaylistType.PLAYLIST, 0),
+        ])
+
+        result = playlist_container.find_by_name('foo')
+
+        self.assertEqual(
+            [playlist._sp_playlist for playlist in result], [
+                spotify.ffi.cast('sp_playlist *', 100),
+                spotify.ffi.cast('sp_playlist *', 104)])
+        self.assertEqual(playlist_container.find_by_name('baz'), [])
+
+    @mock.patch('spotify.Link', spec=spotify.Link)
+    @mock.patch('spotify.playlist.lib', spec=spotify.lib)
+    def test_find_by_name_reads_names_once(
+            self, playlist_lib_mock, link_mock, lib_mock):
+
+        self.create_indexed_playlists(
+            playlist_lib_mock, link_mock, {100: b'foo', 101: b'bar'})
+        playlist_container = self.create_playlist_container(lib_mock, [
+            (spotify.PlaylistType.PLAYLIST, 0),
+            (spotify.PlaylistType.PLAYLIST, 0),
+        ])
+        playlist_container.find_by_name('foo')
+        lib_mock.sp_playlistcontainer_playlist.reset_mock()
+        playlist_lib_mock.sp_playlist_name.reset_mock()
+
+        result = playlist_container.find_by_name('bar')
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(lib_mock.sp_playlistcontainer_playlist.call_count, 0)
+        self.assertEqual(playlist_lib_mock.sp_playlist_name.call_count, 0)
+
+    @mock.patch('spotify.Link', spec=spotify.Link)
+    @mock.patch('spotify.playlist.lib', spec=spotify.lib)
+    def test_find_by_name_when_playlist_is_loaded_later(
+            self, playlist_lib_mock, link_mock, lib_mock):
+
+        names = {}
+        self.create_indexed_playlists(playlist_lib_mock, link_mock, names)
+        playlist_container = self.create_playlist_container(lib_mock, [
+            (spotify.PlaylistType.PLAYLIST, 0),
+        ])
+
+        self.assertEqual(playlist_container.find_by_name('foo'), [])
+        playlist = playlist_container[0]
 
-        self.assertEqual(result, [0])
+        names[100] = b'foo'
 
+        # The index isn't updated until the playlist says it has changed
+        self.assertEqual(playlist_container.find_by_name('foo'), [])
+
+        playlist.emit(spotify.PlaylistEvent.PLAYLIST_STATE_CHANGED, playlist)
+
+        self.assertEqual(playlist_container.find_by_name('foo'), [playlist])
+        self.assertEqual(playlist.num_listeners(
+            spotify.PlaylistEvent.PLAYLIST_STATE_CHANGED), 0)
+
+    @mock.patch('spotify.Link', spec=spotify.Link)
+    @mock.patch('spotify.playlist.lib', spec=spotify.lib)
+    def test_find_by_name_does_not_check_if_playlists_are_loaded(
+            self, playlist_lib_mock, link_mock, lib_mock):
+
+        self.create_indexed_playlists(
+            playlist_lib_mock, link_mock, {100: b'foo'})
+        playlist_container = self.create_playlist_container(lib_mock, [
+            (spotify.PlaylistType.PLAYLIST, 0),
+            (spotify.PlaylistType.PLAYLIST, 0),
+        ])
+        playlist_container.find_by_name('foo')
+        playlist_lib_mock.sp_playlist_is_loaded.reset_mock()
+
+        playlist_container.find_by_name('foo')
+        playlist_container.find_by_uri('spotify:user:alice:playlist:101')
+
+        self.assertEqual(playlist_lib_mock.sp_playlist_is_loaded.call_count, 0)
+
+    @mock.patch('spotify.Link', spec=spotify.Link)
     @mock.patch('spotify.playlist.lib', spec=spotify.lib)
-    def test_find_folder_indexes_without_start(
+    def test_find_by_name_after_playlist_is_renamed(
+            self, playlist_lib_mock, link_mock, lib_mock):
+
+        names = {100: b'foo'}
+        self.create_indexed_playlists(playlist_lib_mock, link_mock, names)
+        playlist_container = self.create_playlist_container(lib_mock, [
+            (spotify.PlaylistType.PLAYLIST, 0),
+        ])
+        playlist, = playlist_container.find_by_name('foo')
+
+        playlist_lib_mock.sp_playlist_name.side_effect = None
+        playlist_lib_mock.sp_playlist_name.return_value = spotify.ffi.new(
+            'char[]', b'bar')
+        playlist.emit(spotify.PlaylistEvent.PLAYLIST_RENAMED, playlist)
+
+        self.assertEqual(playlist_container.find_by_name('foo'), [])
+        self.assertEqual(playlist_container.find_by_name('bar'), [playlist])
+
+    @mock.patch('spotify.Link', spec=spotify.Link)
+    @mock.patch('spotify.playlist.lib', spec=spotify.lib)
+    def test_find_by_uri(self, playlist_lib_mock, link_mock, lib_mock):
+        self.create_indexed_playlists(
+            playlist_lib_mock, link_mock, {100: b'foo', 102: b'bar'})
+        playlist_container = self.create_playlist_container(lib_mock, [
+            (spotify.PlaylistType.PLAYLIST, 0),
+            (spotify.PlaylistType.START_FOLDER, 173),
+            (spotify.PlaylistType.PLAYLIST, 0),
+            (spotify.PlaylistType.END_FOLDER, 173),
+        ])
+
+        result = playlist_container.find_by_uri(
+            'spotify:user:alice:playlist:102')
+
+        self.assertEqual(
+            result._sp_playlist, spotify.ffi.cast('sp_playlist *', 102))
+        self.assertEqual(playlist_container.index(result), 2)
+        self.assertIsNone(
+            playlist_container.find_by_uri('spotify:user:alice:playlist:1'))
+
+    @mock.patch('spotify.playlist.lib', spec=spotify.lib)
+    def test_index_of_playlist_not_in_container(
             self, playlist_lib_mock, lib_mock):
 
-        sp_playlist = spotify.ffi.cast('sp_playlist *', 43)
-        playlist = spotify.Playlist(self.session, sp_playlist=sp_playlist)
-        playlists = [
-            playlist,
-            spotify.PlaylistFolder(
-                173, '', spotify.PlaylistType.END_FOLDER),
+        playlist_container = self.create_playlist_container(lib_mock, [
+            (spotify.PlaylistType.PLAYLIST, 0),
+        ])
+        playlist = spotify.Playlist(
+            self.session, sp_playlist=spotify.ffi.cast('sp_playlist *', 99))
+
+        with self.assertRaises(ValueError):
+            playlist_container.index(playlist)
+
+    @mock.patch('spotify.playlist.lib', spec=spotify.lib)
+    def test_index_rebuilds_outdated_playlist_index(
+            self, playlist_lib_mock, lib_mock):
+
+        playlist_lib_mock.sp_playlist_is_loaded.return_value = 0
+        items = [
+            (spotify.PlaylistType.PLAYLIST, 0),
+            (spotify.PlaylistType.PLAYLIST, 0),
         ]
+        playlist_container = self.create_playlist_container(lib_mock, items)
+        playlist = playlist_container[1]
+        self.assertEqual(playlist_container.index(playlist), 1)
+
+        # The playlists trade places without the container's callbacks
+        lib_mock.sp_playlistcontainer_playlist.side_effect = (
+            lambda sp_pc, i: spotify.ffi.cast('sp_playlist *', 101 - i))
+
+        self.assertEqual(playlist_container.index(playlist), 0)
+
+    @mock.patch('spotify.Link', spec=spotify.Link)
+    @mock.patch('spotify.playlist.lib', spec=spotify.lib)
+    def test_playlist_index_follows_container_changes(
+            self, playlist_lib_mock, link_mock, lib_mock):
+
+        self.create_indexed_playlists(
+            playlist_lib_mock, link_mock, {100: b'foo', 101: b'bar'})
+        items = [(spotify.PlaylistType.PLAYLIST, 0)]
+        playlist_container = self.create_playlist_container(lib_mock, items)
+        sp_playlists = [spotify.ffi.cast('sp_playlist *', 100)]
+        lib_mock.sp_playlistcontainer_playlist.side_effect = (
+            lambda sp_pc, i: sp_playlists[i])
+        foo, = playlist_container.find_by_name('foo')
 
-        result = spotify.PlaylistContainer._find_folder_indexes(
-            playlists, 173, recursive=True)
+        items.insert(0, (spotify.PlaylistType.PLAYLIST, 0))
+        sp_playlists.insert(0, spotify.ffi.cast('sp_playlist *', 101))
+        bar = spotify.Playlist._cached(self.session, sp_playlists[0])
+        playlist_container._on_item_added(bar, 0)
 
-        self.assertEqual(result, [1])
+        self.assertEqual(playlist_container.find_by_name('bar'), [bar])
+        self.assertEqual(playlist_container.index(foo), 1)
+
+        sp_playlists.reverse()
+        playlist_container._on_item_moved(0, 2)
+
+        self.assertEqual(playlist_container.index(foo), 0)
+        self.assertEqual(playlist_container.index(bar), 1)
+
+        items.pop()
+        sp_playlists.pop()
+        playlist_container._on_item_removed(1)
+
+        self.assertEqual(playlist_container.find_by_name('bar'), [])
+        self.assertEqual(playlist_container.find_by_name('foo'), [foo])
 
     def test_move_playlist(self, lib_mock):
         lib_mock.sp_playlistcontainer_move_playlist.return_value = int(
@@ -1016,7 +1443,7 @@ class PlaylistContainerTest(unittest.TestCase):
 
     @mock.patch('spotify.User', spec=spotify.User)
     def test_owner(self, user_mock, lib_mock):
-        user_mock.return_value = mock.sentinel.user
+        user_mock._cached.return_value = mock.sentinel.user
         sp_user = spotify.ffi.cast('sp_user *', 43)
         lib_mock.sp_playlistcontainer_owner.return_value = sp_user
         sp_playlistcontainer = spotify.ffi.cast('sp_playlistcontainer *', 42)
@@ -1027,7 +1454,7 @@ class PlaylistContainerTest(unittest.TestCase):
 
         lib_mock.sp_playlistcontainer_owner.assert_called_with(
             sp_playlistcontainer)
-        user_mock.assert_called_with(
+        user_mock._cached.assert_called_with(
             self.session, sp_user=sp_user, add_ref=True)
         self.assertEqual(result, mock.sentinel.user)
 
@@ -1184,6 +1611,66 @@ class PlaylistContainerCallbacksTest(unittest.TestCase):
         self.assertIsInstance(playlist, spotify.Playlist)
         self.assertEqual(playlist._sp_playlist, sp_playlist)
 
+    @mock.patch('spotify.playlist.lib', spec=spotify.lib)
+    def test_playlist_callbacks_update_folder_index(
+            self, playlist_lib_mock, lib_mock):
+
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        sp_playlistcontainer = spotify.ffi.cast('sp_playlistcontainer *', 43)
+        playlist_container = spotify.PlaylistContainer._cached(
+            self.session, sp_playlistcontainer=sp_playlistcontainer)
+        playlist_container._folder_ranges = {173: [1, 3], 174: [5, None]}
+        lib_mock.sp_playlistcontainer_playlist_type.return_value = int(
+            spotify.PlaylistType.PLAYLIST)
+
+        _PlaylistContainerCallbacks.playlist_added(
+            sp_playlistcontainer, sp_playlist, 2, spotify.ffi.NULL)
+
+        self.assertEqual(
+            playlist_container._folder_ranges, {173: [1, 4], 174: [6, None]})
+
+        _PlaylistContainerCallbacks.playlist_removed(
+            sp_playlistcontainer, sp_playlist, 0, spotify.ffi.NULL)
+
+        self.assertEqual(
+            playlist_container._folder_ranges, {173: [0, 3], 174: [5, None]})
+
+        _PlaylistContainerCallbacks.playlist_moved(
+            sp_playlistcontainer, sp_playlist, 4, 1, spotify.ffi.NULL)
+
+        self.assertEqual(
+            playlist_container._folder_ranges, {173: [0, 4], 174: [5, None]})
+
+        _PlaylistContainerCallbacks.playlist_moved(
+            sp_playlistcontainer, sp_playlist, 1, 7, spotify.ffi.NULL)
+
+        self.assertEqual(
+            playlist_container._folder_ranges, {173: [0, 3], 174: [4, None]})
+
+    @mock.patch('spotify.playlist.lib', spec=spotify.lib)
+    def test_folder_callbacks_clear_folder_index(
+            self, playlist_lib_mock, lib_mock):
+
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        sp_playlistcontainer = spotify.ffi.cast('sp_playlistcontainer *', 43)
+        playlist_container = spotify.PlaylistContainer._cached(
+            self.session, sp_playlistcontainer=sp_playlistcontainer)
+        playlist_container._folder_ranges = {173: [1, 3]}
+        lib_mock.sp_playlistcontainer_playlist_type.return_value = int(
+            spotify.PlaylistType.START_FOLDER)
+
+        _PlaylistContainerCallbacks.playlist_added(
+            sp_playlistcontainer, sp_playlist, 0, spotify.ffi.NULL)
+
+        self.assertIsNone(playlist_container._folder_ranges)
+
+        playlist_container._folder_ranges = {173: [1, 3]}
+
+        _PlaylistContainerCallbacks.playlist_removed(
+            sp_playlistcontainer, sp_playlist, 3, spotify.ffi.NULL)
+
+        self.assertIsNone(playlist_container._folder_ranges)
+
     def test_container_loaded_callback(self, lib_mock):
         callback = mock.Mock()
         sp_playlistcontainer = spotify.ffi.cast('sp_playlistcontainer *', 43)
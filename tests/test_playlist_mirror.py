@@ -0,0 +1,206 @@
+from __future__ import unicode_literals
+
+import unittest
+
+import spotify
+import tests
+from tests import mock
+
+
+@mock.patch('spotify.playlist.lib', spec=spotify.lib)
+class PlaylistMirrorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = tests.create_session_mock()
+        patcher = mock.patch.object(
+            spotify.Playlist, 'tracks', new_callable=mock.PropertyMock)
+        self.tracks_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_track_mock(self, uri):
+        track = mock.Mock(spec=spotify.Track)
+        track.link.uri = uri
+        return track
+
+    def create_playlist(self, uris):
+        self.tracks_mock.return_value = [
+            self.create_track_mock(uri) for uri in uris]
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 42)
+        return spotify.Playlist(self.session, sp_playlist=sp_playlist)
+
+    def test_copies_track_uris(self, lib_mock):
+        playlist = self.create_playlist(['a', 'b', 'c'])
+
+        mirror = spotify.PlaylistMirror(playlist)
+
+        self.assertEqual(list(mirror), ['a', 'b', 'c'])
+        self.assertEqual(len(mirror), 3)
+        self.assertEqual(mirror[1], 'b')
+        self.assertEqual(mirror[-1], 'c')
+        self.assertEqual(mirror.version, 0)
+
+    def test_contains_and_count(self, lib_mock):
+        playlist = self.create_playlist(['a', 'b', 'a'])
+
+        mirror = spotify.PlaylistMirror(playlist)
+
+        self.assertIn('a', mirror)
+        self.assertNotIn('x', mirror)
+        self.assertEqual(mirror.count('a'), 2)
+        self.assertEqual(mirror.count('x'), 0)
+
+    def test_positions(self, lib_mock):
+        playlist = self.create_playlist(['a', 'b', 'a'])
+
+        mirror = spotify.PlaylistMirror(playlist)
+
+        self.assertEqual(mirror.positions('a'), [0, 2])
+        self.assertEqual(mirror.positions('b'), [1])
+        self.assertEqual(mirror.positions('x'), [])
+
+    def test_tracks_added(self, lib_mock):
+        playlist = self.create_playlist(['a', 'b'])
+        mirror = spotify.PlaylistMirror(playlist)
+        mirror.positions('b')
+
+        playlist.emit(
+            spotify.PlaylistEvent.TRACKS_ADDED, playlist,
+            [self.create_track_mock('x'), self.create_track_mock('y')], 1)
+
+        self.assertEqual(list(mirror), ['a', 'x', 'y', 'b'])
+        self.assertIn('x', mirror)
+        self.assertEqual(mirror.positions('b'), [3])
+        self.assertEqual(mirror.version, 1)
+        self.assertEqual(mirror.changes(), [
+            spotify.PlaylistMirrorChange(1, 'add', ['x', 'y'], None, 1)])
+
+    def test_tracks_removed(self, lib_mock):
+        playlist = self.create_playlist(['a', 'b', 'c', 'd'])
+        mirror = spotify.PlaylistMirror(playlist)
+
+        playlist.emit(
+            spotify.PlaylistEvent.TRACKS_REMOVED, playlist, [2, 0])
+
+        self.assertEqual(list(mirror), ['b', 'd'])
+        self.assertNotIn('a', mirror)
+        self.assertEqual(mirror.positions('d'), [1])
+        self.assertEqual(mirror.changes(), [
+            spotify.PlaylistMirrorChange(
+                1, 'remove', ['a', 'c'], [0, 2], None)])
+
+    def test_tracks_moved_forward(self, lib_mock):
+        playlist = self.create_playlist(['a', 'b', 'c', 'd'])
+        mirror = spotify.PlaylistMirror(playlist)
+
+        playlist.emit(
+            spotify.PlaylistEvent.TRACKS_MOVED, playlist, [0, 1], 3)
+
+        self.assertEqual(list(mirror), ['c', 'a', 'b', 'd'])
+        self.assertEqual(mirror.changes(), [
+            spotify.PlaylistMirrorChange(1, 'move', ['a', 'b'], [0, 1], 3)])
+
+    def test_tracks_moved_backward(self, lib_mock):
+        playlist = self.create_playlist(['a', 'b', 'c', 'd'])
+        mirror = spotify.PlaylistMirror(playlist)
+
+        playlist.emit(
+            spotify.PlaylistEvent.TRACKS_MOVED, playlist, [3], 1)
+
+        self.assertEqual(list(mirror), ['a', 'd', 'b', 'c'])
+
+    def test_tracks_moved_to_end(self, lib_mock):
+        playlist = self.create_playlist(['a', 'b', 'c'])
+        mirror = spotify.PlaylistMirror(playlist)
+
+        playlist.emit(
+            spotify.PlaylistEvent.TRACKS_MOVED, playlist, [0], 3)
+
+        self.assertEqual(list(mirror), ['b', 'c', 'a'])
+
+    def test_positions_follow_changes(self, lib_mock):
+        playlist = self.create_playlist(['a', 'b', 'a', 'c', 'a'])
+        mirror = spotify.PlaylistMirror(playlist)
+        self.assertEqual(mirror.positions('a'), [0, 2, 4])
+
+        playlist.emit(
+            spotify.PlaylistEvent.TRACKS_MOVED, playlist, [4], 0)
+        playlist.emit(
+            spotify.PlaylistEvent.TRACKS_REMOVED, playlist, [2, 4])
+        playlist.emit(
+            spotify.PlaylistEvent.TRACKS_ADDED, playlist,
+            [self.create_track_mock('c')], 1)
+
+        self.assertEqual(list(mirror), ['a', 'c', 'a', 'a'])
+        self.assertEqual(mirror.positions('a'), [0, 2, 3])
+        self.assertEqual(mirror.positions('b'), [])
+        self.assertEqual(mirror.count('a'), 3)
+        self.assertNotIn('b', mirror)
+        self.assertEqual(mirror[1:3], ['c', 'a'])
+
+    def test_snapshot(self, lib_mock):
+        playlist = self.create_playlist(['a', 'b'])
+        mirror = spotify.PlaylistMirror(playlist)
+        playlist.emit(
+            spotify.PlaylistEvent.TRACKS_REMOVED, playlist, [0])
+
+        self.assertEqual(mirror.snapshot(), (1, ('b',)))
+
+    def test_changes_since_version(self, lib_mock):
+        playlist = self.create_playlist(['a', 'b', 'c'])
+        mirror = spotify.PlaylistMirror(playlist)
+        playlist.emit(
+            spotify.PlaylistEvent.TRACKS_REMOVED, playlist, [0])
+        playlist.emit(
+            spotify.PlaylistEvent.TRACKS_REMOVED, playlist, [0])
+
+        changes = mirror.changes(since=1)
+
+        self.assertEqual([change.version for change in changes], [2])
+        self.assertEqual(mirror.changes(since=2), [])
+
+    def test_changes_fails_if_changes_are_no_longer_kept(self, lib_mock):
+        playlist = self.create_playlist(['a', 'b', 'c'])
+        mirror = spotify.PlaylistMirror(playlist, max_changes=1)
+        playlist.emit(
+            spotify.PlaylistEvent.TRACKS_REMOVED, playlist, [0])
+        playlist.emit(
+            spotify.PlaylistEvent.TRACKS_REMOVED, playlist, [0])
+
+        self.assertEqual(len(mirror.changes(since=1)), 1)
+        with self.assertRaises(spotify.Error):
+            mirror.changes(since=0)
+
+    def test_refresh(self, lib_mock):
+        playlist = self.create_playlist(['a', 'b'])
+        mirror = spotify.PlaylistMirror(playlist)
+        playlist.emit(
+            spotify.PlaylistEvent.TRACKS_REMOVED, playlist, [0])
+        self.tracks_mock.return_value = [self.create_track_mock('c')]
+
+        mirror.refresh()
+
+        self.assertEqual(list(mirror), ['c'])
+        self.assertEqual(mirror.version, 2)
+        self.assertEqual(mirror.changes(since=2), [])
+        with self.assertRaises(spotify.Error):
+            mirror.changes(since=1)
+
+    def test_close_stops_listening_to_events(self, lib_mock):
+        playlist = self.create_playlist(['a', 'b'])
+        mirror = spotify.PlaylistMirror(playlist)
+
+        mirror.close()
+        playlist.emit(
+            spotify.PlaylistEvent.TRACKS_REMOVED, playlist, [0])
+
+        self.assertEqual(list(mirror), ['a', 'b'])
+        self.assertEqual(playlist.num_listeners(), 0)
+
+    def test_repr(self, lib_mock):
+        lib_mock.sp_playlist_is_loaded.return_value = 0
+        playlist = self.create_playlist([])
+
+        mirror = spotify.PlaylistMirror(playlist)
+
+        self.assertEqual(
+            repr(mirror), 'PlaylistMirror(%r, version=0)' % playlist)
@@ -0,0 +1,249 @@
+from __future__ import unicode_literals
+
+import unittest
+
+import spotify
+import tests
+from tests import mock
+
+
+@mock.patch('spotify.playlist.lib', spec=spotify.lib)
+class PlaylistRamManagerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = tests.create_session_mock()
+
+    def create_playlists(self, lib_mock, num_tracks):
+        # Playlist i has num_tracks[i] tracks
+        lib_mock.sp_playlist_is_loaded.return_value = 1
+        lib_mock.sp_playlist_num_tracks.side_effect = (
+            lambda sp_playlist: num_tracks[
+                int(spotify.ffi.cast('intptr_t', sp_playlist)) - 1])
+        lib_mock.sp_playlist_set_in_ram.return_value = int(
+            spotify.ErrorType.OK)
+        return [
+            spotify.Playlist(
+                self.session,
+                sp_playlist=spotify.ffi.cast('sp_playlist *', i + 1))
+            for i in range(len(num_tracks))]
+
+    def assert_in_ram_calls(self, lib_mock, *calls):
+        self.assertEqual(
+            lib_mock.sp_playlist_set_in_ram.call_args_list, [
+                mock.call(
+                    self.session._sp_session, playlist._sp_playlist,
+                    int(in_ram))
+                for playlist, in_ram in calls])
+
+    def test_requires_a_budget(self, lib_mock):
+        with self.assertRaises(ValueError):
+            spotify.PlaylistRamManager(self.session)
+
+    def test_get_puts_playlist_in_ram(self, lib_mock):
+        playlist, = self.create_playlists(lib_mock, [10])
+        manager = spotify.PlaylistRamManager(self.session, max_playlists=2)
+
+        result = manager.get(playlist)
+
+        self.assertIs(result, playlist)
+        self.assert_in_ram_calls(lib_mock, (playlist, True))
+        self.assertIn(playlist, manager)
+        self.assertEqual(len(manager), 1)
+        self.assertEqual(manager.num_tracks, 10)
+        self.assertEqual(manager.misses, 1)
+        self.assertEqual(manager.hits, 0)
+
+    def test_get_playlist_already_in_ram_is_a_hit(self, lib_mock):
+        playlist, = self.create_playlists(lib_mock, [10])
+        manager = spotify.PlaylistRamManager(self.session, max_playlists=2)
+        manager.get(playlist)
+
+        manager.get(playlist)
+
+        self.assert_in_ram_calls(lib_mock, (playlist, True))
+        self.assertEqual(manager.hits, 1)
+        self.assertEqual(manager.misses, 1)
+        self.assertEqual(manager.hit_rate, 0.5)
+
+    def test_get_with_uri(self, lib_mock):
+        playlist, = self.create_playlists(lib_mock, [10])
+        self.session.get_playlist.return_value = playlist
+        manager = spotify.PlaylistRamManager(self.session, max_playlists=2)
+
+        result = manager.get('spotify:user:alice:playlist:foo')
+
+        self.session.get_playlist.assert_called_once_with(
+            'spotify:user:alice:playlist:foo')
+        self.assertIs(result, playlist)
+
+    def test_evicts_least_recently_used_playlist(self, lib_mock):
+        a, b, c = self.create_playlists(lib_mock, [1, 1, 1])
+        manager = spotify.PlaylistRamManager(self.session, max_playlists=2)
+        manager.get(a)
+        manager.get(b)
+        manager.get(a)
+
+        manager.get(c)
+
+        self.assert_in_ram_calls(
+            lib_mock, (a, True), (b, True), (c, True), (b, False))
+        self.assertNotIn(b, manager)
+        self.assertEqual(len(manager), 2)
+        self.assertEqual(manager.evictions, 1)
+
+    def test_evicts_until_within_track_budget(self, lib_mock):
+        a, b, c = self.create_playlists(lib_mock, [40, 30, 50])
+        manager = spotify.PlaylistRamManager(self.session, max_tracks=100)
+        manager.get(a)
+        manager.get(b)
+
+        manager.get(c)
+
+        self.assertEqual(list(manager._playlists), [b, c])
+        self.assertEqual(manager.num_tracks, 80)
+        self.assertEqual(manager.evictions, 1)
+
+    def test_track_count_is_updated_on_each_get(self, lib_mock):
+        num_tracks = [0, 30]
+        a, b = self.create_playlists(lib_mock, num_tracks)
+        manager = spotify.PlaylistRamManager(self.session, max_tracks=100)
+        manager.get(a)
+        manager.get(b)
+
+        num_tracks[0] = 80
+        manager.get(a)
+
+        self.assertEqual(list(manager._playlists), [a])
+        self.assertEqual(manager.num_tracks, 80)
+
+    def test_track_count_is_updated_when_playlist_loads(self, lib_mock):
+        num_tracks = [0, 0]
+        a, b = self.create_playlists(lib_mock, num_tracks)
+        manager = spotify.PlaylistRamManager(self.session, max_tracks=100)
+        manager.get(a)
+        manager.get(b)
+
+        num_tracks[1] = 50
+        b.emit(spotify.PlaylistEvent.PLAYLIST_STATE_CHANGED, b)
+
+        self.assertEqual(manager.num_tracks, 50)
+
+        num_tracks[0] = 80
+        a.emit(spotify.PlaylistEvent.PLAYLIST_STATE_CHANGED, a)
+
+        self.assertEqual(list(manager._playlists), [b])
+        self.assertEqual(manager.num_tracks, 50)
+        self.assertEqual(manager.evictions, 1)
+
+    def test_track_count_is_updated_when_tracks_are_added_or_removed(
+            self, lib_mock):
+        num_tracks = [10, 10]
+        a, b = self.create_playlists(lib_mock, num_tracks)
+        manager = spotify.PlaylistRamManager(self.session, max_tracks=100)
+        manager.get(a)
+        manager.get(b)
+
+        num_tracks[0] = 40
+        a.emit(spotify.PlaylistEvent.TRACKS_ADDED, a, [], 10)
+        self.assertEqual(manager.num_tracks, 50)
+
+        num_tracks[1] = 5
+        b.emit(spotify.PlaylistEvent.TRACKS_REMOVED, b, [5, 6, 7, 8, 9])
+        self.assertEqual(manager.num_tracks, 45)
+
+    def test_most_recently_used_playlist_is_kept_when_it_grows(
+            self, lib_mock):
+        num_tracks = [10, 0]
+        a, b = self.create_playlists(lib_mock, num_tracks)
+        manager = spotify.PlaylistRamManager(self.session, max_tracks=100)
+        manager.get(a)
+        manager.get(b)
+
+        num_tracks[1] = 200
+        b.emit(spotify.PlaylistEvent.PLAYLIST_STATE_CHANGED, b)
+
+        self.assertEqual(list(manager._playlists), [b])
+        self.assertEqual(manager.num_tracks, 200)
+
+    def test_stops_listening_to_removed_playlists(self, lib_mock):
+        num_tracks = [10]
+        a, = self.create_playlists(lib_mock, num_tracks)
+        manager = spotify.PlaylistRamManager(self.session, max_tracks=100)
+        manager.get(a)
+
+        manager.discard(a)
+
+        self.assertEqual(a.num_listeners(), 0)
+        self.assertNotIn(a, self.session._emitters)
+
+    def test_keeps_playlist_exceeding_budget_alone(self, lib_mock):
+        a, b = self.create_playlists(lib_mock, [10, 200])
+        manager = spotify.PlaylistRamManager(self.session, max_tracks=100)
+        manager.get(a)
+
+        manager.get(b)
+
+        self.assertEqual(list(manager._playlists), [b])
+        self.assertEqual(manager.num_tracks, 200)
+
+    def test_discard(self, lib_mock):
+        a, b = self.create_playlists(lib_mock, [10, 20])
+        manager = spotify.PlaylistRamManager(self.session, max_playlists=2)
+        manager.get(a)
+
+        manager.discard(a)
+        manager.discard(b)
+
+        self.assert_in_ram_calls(lib_mock, (a, True), (a, False))
+        self.assertEqual(len(manager), 0)
+        self.assertEqual(manager.num_tracks, 0)
+        self.assertEqual(manager.evictions, 0)
+
+    def test_clear(self, lib_mock):
+        a, b = self.create_playlists(lib_mock, [10, 20])
+        manager = spotify.PlaylistRamManager(self.session, max_playlists=2)
+        manager.get(a)
+        manager.get(b)
+
+        manager.clear()
+
+        self.assert_in_ram_calls(
+            lib_mock, (a, True), (b, True), (a, False), (b, False))
+        self.assertEqual(len(manager), 0)
+        self.assertEqual(manager.num_tracks, 0)
+        self.assertEqual(manager.misses, 0)
+
+    def test_get_fails_if_playlist_cannot_be_put_in_ram(self, lib_mock):
+        a, b = self.create_playlists(lib_mock, [1, 1])
+        manager = spotify.PlaylistRamManager(self.session, max_playlists=1)
+        manager.get(a)
+        lib_mock.sp_playlist_set_in_ram.return_value = int(
+            spotify.ErrorType.PERMISSION_DENIED)
+
+        with self.assertRaises(spotify.Error):
+            manager.get(b)
+
+        self.assertEqual(list(manager._playlists), [a])
+        self.assertEqual(manager.evictions, 0)
+
+    def test_evicts_even_if_removing_from_ram_fails(self, lib_mock):
+        a, b = self.create_playlists(lib_mock, [1, 1])
+        manager = spotify.PlaylistRamManager(self.session, max_playlists=1)
+        lib_mock.sp_playlist_set_in_ram.side_effect = (
+            lambda sp_session, sp_playlist, in_ram: int(
+                spotify.ErrorType.OK if in_ram
+                else spotify.ErrorType.PERMISSION_DENIED))
+        manager.get(a)
+
+        manager.get(b)
+
+        self.assertEqual(list(manager._playlists), [b])
+        self.assertEqual(manager.evictions, 1)
+
+    def test_repr(self, lib_mock):
+        manager = spotify.PlaylistRamManager(self.session, max_playlists=2)
+
+        self.assertEqual(
+            repr(manager),
+            'PlaylistRamManager(playlists=0, tracks=0, '
+            'hits=0, misses=0, evictions=0)')
@@ -109,6 +109,92 @@ class PlaylistUnseenTracksTest(unittest.TestCase):
         self.assertIsInstance(result[1], spotify.Track)
         self.assertEqual(result[1]._sp_track, sp_tracks[1])
 
+    @mock.patch('spotify.track.lib', spec=spotify.lib)
+    def test_iter(self, track_lib_mock, lib_mock):
+        sp_playlistcontainer = spotify.ffi.cast('sp_playlistcontainer *', 42)
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 43)
+
+        sp_tracks = [
+            spotify.ffi.cast('sp_track *', 44), spotify.ffi.NULL,
+            spotify.ffi.cast('sp_track *', 46)]
+
+        def func(sp_pc, sp_p, sp_t, num_t):
+            for i in range(min(len(sp_tracks), num_t)):
+                sp_t[i] = sp_tracks[i]
+            return len(sp_tracks)
+
+        lib_mock.sp_playlistcontainer_get_unseen_tracks.side_effect = func
+
+        tracks = spotify.PlaylistUnseenTracks(
+            self.session, sp_playlistcontainer, sp_playlist)
+
+        result = list(tracks)
+
+        self.assertEqual(len(result), 3)
+        self.assertEqual(result[0]._sp_track, sp_tracks[0])
+        self.assertIsNone(result[1])
+        self.assertEqual(result[2]._sp_track, sp_tracks[2])
+
+        # All tracks are retrieved with one call, sized after the first call
+        self.assertEqual(
+            lib_mock.sp_playlistcontainer_get_unseen_tracks.call_count, 2)
+        lib_mock.sp_playlistcontainer_get_unseen_tracks.assert_called_with(
+            sp_playlistcontainer, sp_playlist, mock.ANY, 3)
+
+    @mock.patch('spotify.track.lib', spec=spotify.lib)
+    def test_tracks_are_only_wrapped_once(self, track_lib_mock, lib_mock):
+        sp_playlistcontainer = spotify.ffi.cast('sp_playlistcontainer *', 42)
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 43)
+        sp_track = spotify.ffi.cast('sp_track *', 44)
+
+        def func(sp_pc, sp_p, sp_t, num_t):
+            if num_t > 0:
+                sp_t[0] = sp_track
+            return 1
+
+        lib_mock.sp_playlistcontainer_get_unseen_tracks.side_effect = func
+
+        tracks = spotify.PlaylistUnseenTracks(
+            self.session, sp_playlistcontainer, sp_playlist)
+
+        with mock.patch.object(
+                spotify.Track, '_cached',
+                wraps=spotify.Track._cached) as cached_mock:
+            track = tracks[0]
+            self.assertIs(tracks[0], track)
+            self.assertIs(list(tracks)[0], track)
+
+        self.assertEqual(cached_mock.call_count, 1)
+
+    @mock.patch('spotify.track.lib', spec=spotify.lib)
+    def test_retrieves_tracks_again_if_number_of_tracks_grows(
+            self, track_lib_mock, lib_mock):
+
+        sp_playlistcontainer = spotify.ffi.cast('sp_playlistcontainer *', 42)
+        sp_playlist = spotify.ffi.cast('sp_playlist *', 43)
+
+        sp_tracks = [
+            spotify.ffi.cast('sp_track *', 44 + i) for i in range(2)]
+
+        def func(sp_pc, sp_p, sp_t, num_t):
+            for i in range(min(len(sp_tracks), num_t)):
+                sp_t[i] = sp_tracks[i]
+            return len(sp_tracks)
+
+        lib_mock.sp_playlistcontainer_get_unseen_tracks.side_effect = func
+
+        tracks = spotify.PlaylistUnseenTracks(
+            self.session, sp_playlistcontainer, sp_playlist)
+        sp_tracks.append(spotify.ffi.cast('sp_track *', 46))
+        tracks[0]
+
+        self.assertEqual(len(tracks), 3)
+        self.assertEqual(tracks[2]._sp_track, sp_tracks[2])
+        self.assertEqual(
+            lib_mock.sp_playlistcontainer_get_unseen_tracks.call_count, 3)
+        lib_mock.sp_playlistcontainer_get_unseen_tracks.assert_called_with(
+            sp_playlistcontainer, sp_playlist, mock.ANY, 3)
+
     def test_getitem_raises_index_error_on_too_low_index(self, lib_mock):
         sp_playlistcontainer = spotify.ffi.cast('sp_playlistcontainer *', 42)
         sp_playlist = spotify.ffi.cast('sp_playlist *', 43)
@@ -1,5 +1,6 @@
 from __future__ import unicode_literals
 
+import functools
 import unittest
 
 import spotify
@@ -112,7 +113,7 @@ class SearchTest(unittest.TestCase):
 
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_repr(self, link_mock, lib_mock):
-        link_instance_mock = link_mock.return_value
+        link_instance_mock = link_mock._cached.return_value
         link_instance_mock.uri = 'foo'
         sp_search = spotify.ffi.cast('sp_search *', 42)
         search = spotify.Search(self.session, sp_search=sp_search)
@@ -530,17 +531,174 @@ class SearchTest(unittest.TestCase):
         self.assertIsInstance(result, spotify.Search)
         self.assertEqual(result._sp_search, sp_search2)
 
+    def create_paged_search(self, lib_mock, total):
+        # Each search created gets the next sp_search pointer, and its page
+        # of tracks is the track offset and count it was created with.
+        pages = {}
+
+        def search_create(
+                sp_session, query, track_offset, track_count, *args):
+            sp_search = spotify.ffi.cast('sp_search *', len(pages) + 1)
+            pages[sp_search] = (track_offset, track_count)
+            return sp_search
+
+        def num_tracks(sp_search):
+            offset, count = pages[sp_search]
+            return max(0, min(count, total - offset))
+
+        def track(sp_search, index):
+            offset, count = pages[sp_search]
+            return spotify.ffi.cast('sp_track *', 1000 + offset + index)
+
+        lib_mock.sp_search_create.side_effect = search_create
+        lib_mock.sp_search_error.return_value = spotify.ErrorType.OK
+        lib_mock.sp_search_is_loaded.return_value = 1
+        lib_mock.sp_search_query.return_value = spotify.ffi.new(
+            'char[]', b'alice')
+        lib_mock.sp_search_total_tracks.return_value = total
+        self.session.search.side_effect = functools.partial(
+            spotify.Search, self.session)
+        lib_mock.sp_search_num_tracks.side_effect = num_tracks
+        lib_mock.sp_search_track.side_effect = track
+        return pages
+
+    def get_track_numbers(self, tracks):
+        return [
+            int(spotify.ffi.cast('intptr_t', track._sp_track)) - 1000
+            for track in tracks]
+
+    @mock.patch('spotify.track.lib', spec=spotify.lib)
+    def test_iter_tracks(self, track_lib_mock, lib_mock):
+        pages = self.create_paged_search(lib_mock, total=450)
+        search = spotify.Search(self.session, query='alice')
+
+        result = self.get_track_numbers(search.iter_tracks())
+
+        self.assertEqual(result, list(range(450)))
+        self.assertEqual(
+            sorted(pages.values()),
+            [(0, 20), (20, 200), (220, 200), (420, 30)])
+        lib_mock.sp_search_create.assert_called_with(
+            self.session._sp_session, mock.ANY,
+            420, 30, 0, 0, 0, 0, 0, 0,
+            int(spotify.SearchType.STANDARD), mock.ANY, mock.ANY)
+        self.assertEqual(
+            spotify.ffi.string(lib_mock.sp_search_create.call_args[0][1]),
+            b'alice')
+
+    @mock.patch('spotify.track.lib', spec=spotify.lib)
+    def test_iter_tracks_caps_page_size(self, track_lib_mock, lib_mock):
+        pages = self.create_paged_search(lib_mock, total=500)
+        search = spotify.Search(self.session, query='alice')
+
+        result = self.get_track_numbers(search.iter_tracks(page_size=1000))
+
+        self.assertEqual(result, list(range(500)))
+        self.assertEqual(
+            sorted(pages.values()),
+            [(0, 20), (20, 200), (220, 200), (420, 80)])
+
+    @mock.patch('spotify.track.lib', spec=spotify.lib)
+    def test_iter_tracks_with_max_results(self, track_lib_mock, lib_mock):
+        pages = self.create_paged_search(lib_mock, total=450)
+        search = spotify.Search(self.session, query='alice')
+
+        result = self.get_track_numbers(
+            search.iter_tracks(page_size=50, max_results=70))
+
+        self.assertEqual(result, list(range(70)))
+        self.assertEqual(sorted(pages.values()), [(0, 20), (20, 50)])
+
+    @mock.patch('spotify.track.lib', spec=spotify.lib)
+    def test_iter_tracks_starts_next_pages_before_returning_results(
+            self, track_lib_mock, lib_mock):
+        pages = self.create_paged_search(lib_mock, total=450)
+        search = spotify.Search(self.session, query='alice')
+
+        tracks = search.iter_tracks(page_size=100, concurrency=3)
+        next(tracks)
+
+        self.assertEqual(
+            sorted(pages.values()),
+            [(0, 20), (20, 100), (120, 100), (220, 100)])
+
+        next(tracks)
+
+        self.assertEqual(len(pages), 4)
+
+    @mock.patch('spotify.track.lib', spec=spotify.lib)
+    def test_iter_tracks_stops_at_empty_page(self, track_lib_mock, lib_mock):
+        pages = self.create_paged_search(lib_mock, total=450)
+        lib_mock.sp_search_num_tracks.side_effect = (
+            lambda sp_search: 20 if pages[sp_search][0] == 0 else 0)
+        search = spotify.Search(self.session, query='alice')
+
+        result = self.get_track_numbers(search.iter_tracks())
+
+        self.assertEqual(result, list(range(20)))
+        # The page after the empty page was already started
+        self.assertEqual(len(pages), 3)
+
+    @mock.patch('spotify.track.lib', spec=spotify.lib)
+    def test_iter_tracks_uses_search_cache(self, track_lib_mock, lib_mock):
+        pages = self.create_paged_search(lib_mock, total=450)
+        cache = spotify.SearchCache(self.session)
+        self.session.search.side_effect = cache.search
+        search = spotify.Search(self.session, query='alice')
+        list(search.iter_tracks())
+
+        result = self.get_track_numbers(search.iter_tracks())
+
+        self.assertEqual(result, list(range(450)))
+        self.assertEqual(len(pages), 4)
+        self.assertEqual(cache.misses, 3)
+        self.assertEqual(cache.hits + cache.coalesced, 3)
+
+    def test_iter_tracks_fails_without_concurrency(self, lib_mock):
+        sp_search = spotify.ffi.cast('sp_search *', 42)
+        search = spotify.Search(self.session, sp_search=sp_search)
+
+        with self.assertRaises(ValueError):
+            search.iter_tracks(concurrency=0)
+
+    @mock.patch('spotify.artist.lib', spec=spotify.lib)
+    def test_iter_artists(self, artist_lib_mock, lib_mock):
+        sp_artist = spotify.ffi.cast('sp_artist *', 43)
+        sp_search1 = spotify.ffi.cast('sp_search *', 42)
+        sp_search2 = spotify.ffi.cast('sp_search *', 43)
+        lib_mock.sp_search_create.side_effect = [sp_search1, sp_search2]
+        lib_mock.sp_search_error.return_value = spotify.ErrorType.OK
+        lib_mock.sp_search_is_loaded.return_value = 1
+        lib_mock.sp_search_query.return_value = spotify.ffi.new(
+            'char[]', b'alice')
+        lib_mock.sp_search_total_artists.return_value = 21
+        lib_mock.sp_search_num_artists.side_effect = (
+            lambda sp_search: 20 if sp_search == sp_search1 else 1)
+        lib_mock.sp_search_artist.return_value = sp_artist
+        self.session.search.side_effect = functools.partial(
+            spotify.Search, self.session)
+        search = spotify.Search(self.session, query='alice')
+
+        result = list(search.iter_artists())
+
+        self.assertEqual(len(result), 21)
+        self.assertIsInstance(result[0], spotify.Artist)
+        lib_mock.sp_search_create.assert_called_with(
+            self.session._sp_session, mock.ANY,
+            0, 0, 0, 0, 20, 1, 0, 0,
+            int(spotify.SearchType.STANDARD), mock.ANY, mock.ANY)
+
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_link_creates_link_to_search(self, link_mock, lib_mock):
         sp_search = spotify.ffi.cast('sp_search *', 42)
         search = spotify.Search(self.session, sp_search=sp_search)
         sp_link = spotify.ffi.cast('sp_link *', 43)
         lib_mock.sp_link_create_from_search.return_value = sp_link
-        link_mock.return_value = mock.sentinel.link
+        link_mock._cached.return_value = mock.sentinel.link
 
         result = search.link
 
-        link_mock.assert_called_once_with(
+        link_mock._cached.assert_called_once_with(
             self.session, sp_link=sp_link, add_ref=False)
         self.assertEqual(result, mock.sentinel.link)
 
@@ -558,6 +716,12 @@ class SearchPlaylistTest(unittest.TestCase):
         self.assertEqual(pl.uri, 'uri:foo')
         self.assertEqual(pl.image_uri, 'image:foo')
 
+    def test_has_no_instance_dict(self):
+        pl = spotify.SearchPlaylist(
+            self.session, name='foo', uri='uri:foo', image_uri='image:foo')
+
+        self.assertFalse(hasattr(pl, '__dict__'))
+
     def test_repr(self):
         pl = spotify.SearchPlaylist(
             self.session, name='foo', uri='uri:foo', image_uri='image:foo')
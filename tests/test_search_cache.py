@@ -0,0 +1,191 @@
+from __future__ import unicode_literals
+
+import unittest
+
+import spotify
+import tests
+from tests import mock
+
+
+@mock.patch('spotify.utils.time')
+@mock.patch('spotify.search.lib', spec=spotify.lib)
+class SearchCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = tests.create_session_mock()
+
+    def create_searches(self, lib_mock, time_mock):
+        # Each search created gets the next sp_search pointer
+        sp_searches = []
+
+        def search_create(sp_session, query, *args):
+            sp_searches.append(
+                spotify.ffi.cast('sp_search *', len(sp_searches) + 1))
+            return sp_searches[-1]
+
+        lib_mock.sp_search_create.side_effect = search_create
+        lib_mock.sp_search_error.return_value = int(spotify.ErrorType.OK)
+        time_mock.time.return_value = 1000
+
+    def complete_search(self, lib_mock, search, error=spotify.ErrorType.OK):
+        lib_mock.sp_search_error.return_value = int(error)
+        for call in lib_mock.sp_search_create.call_args_list:
+            handle = call[0][12]
+            if spotify.ffi.from_handle(handle)[1] is search:
+                call[0][11](search._sp_search, handle)
+                return
+        self.fail('No such search')
+
+    def test_first_search_is_a_miss(self, lib_mock, time_mock):
+        self.create_searches(lib_mock, time_mock)
+        cache = spotify.SearchCache(self.session)
+
+        result = cache.search('alice', track_count=50)
+
+        self.assertIsInstance(result, spotify.Search)
+        lib_mock.sp_search_create.assert_called_once_with(
+            self.session._sp_session, mock.ANY,
+            0, 50, 0, 20, 0, 20, 0, 20,
+            int(spotify.SearchType.STANDARD), mock.ANY, mock.ANY)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 0)
+
+    def test_completed_search_is_a_hit(self, lib_mock, time_mock):
+        self.create_searches(lib_mock, time_mock)
+        cache = spotify.SearchCache(self.session)
+        search = cache.search('alice')
+        self.complete_search(lib_mock, search)
+        callback = mock.Mock()
+
+        result = cache.search('alice', callback=callback)
+
+        self.assertIs(result, search)
+        self.assertEqual(lib_mock.sp_search_create.call_count, 1)
+        callback.assert_called_once_with(search)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hit_rate, 0.5)
+
+    def test_search_in_progress_is_shared(self, lib_mock, time_mock):
+        self.create_searches(lib_mock, time_mock)
+        cache = spotify.SearchCache(self.session)
+        callback1 = mock.Mock()
+        callback2 = mock.Mock()
+        search = cache.search('alice', callback=callback1)
+
+        result = cache.search('alice', callback=callback2)
+
+        self.assertIs(result, search)
+        self.assertEqual(lib_mock.sp_search_create.call_count, 1)
+        self.assertEqual(cache.coalesced, 1)
+        self.assertEqual(callback1.call_count, 0)
+        self.assertEqual(callback2.call_count, 0)
+
+        self.complete_search(lib_mock, search)
+
+        callback1.assert_called_once_with(search)
+        callback2.assert_called_once_with(search)
+
+    def test_different_arguments_are_different_searches(
+            self, lib_mock, time_mock):
+        self.create_searches(lib_mock, time_mock)
+        cache = spotify.SearchCache(self.session)
+
+        search1 = cache.search('alice')
+        search2 = cache.search('alice', track_offset=20)
+        search3 = cache.search(
+            'alice', search_type=spotify.SearchType.SUGGEST)
+        search4 = cache.search(
+            'alice', search_type=spotify.SearchType.STANDARD)
+
+        self.assertEqual(len(set([search1, search2, search3])), 3)
+        self.assertIs(search4, search1)
+        self.assertEqual(cache.misses, 3)
+
+    def test_expired_search_is_a_miss(self, lib_mock, time_mock):
+        self.create_searches(lib_mock, time_mock)
+        cache = spotify.SearchCache(self.session, ttl=60)
+        search = cache.search('alice')
+        self.complete_search(lib_mock, search)
+
+        time_mock.time.return_value = 1059
+        self.assertIs(cache.search('alice'), search)
+
+        time_mock.time.return_value = 1060
+        result = cache.search('alice')
+
+        self.assertIsNot(result, search)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(len(cache), 1)
+
+    def test_without_ttl_searches_never_expire(self, lib_mock, time_mock):
+        self.create_searches(lib_mock, time_mock)
+        cache = spotify.SearchCache(self.session, ttl=None)
+        search = cache.search('alice')
+        self.complete_search(lib_mock, search)
+
+        time_mock.time.return_value = 10 ** 9
+        result = cache.search('alice')
+
+        self.assertIs(result, search)
+
+    def test_evicts_least_recently_used_search(self, lib_mock, time_mock):
+        self.create_searches(lib_mock, time_mock)
+        cache = spotify.SearchCache(self.session, max_size=2)
+        alice = cache.search('alice')
+        bob = cache.search('bob')
+        cache.search('alice')
+
+        cache.search('carol')
+
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.search('alice'), alice)
+        self.assertIsNot(cache.search('bob'), bob)
+        self.assertEqual(lib_mock.sp_search_create.call_count, 4)
+
+    def test_failed_search_is_not_kept(self, lib_mock, time_mock):
+        self.create_searches(lib_mock, time_mock)
+        cache = spotify.SearchCache(self.session)
+        callback = mock.Mock()
+        search = cache.search('alice', callback=callback)
+
+        self.complete_search(
+            lib_mock, search, error=spotify.ErrorType.OTHER_TRANSIENT)
+
+        callback.assert_called_once_with(search)
+        self.assertEqual(len(cache), 0)
+
+    def test_evicted_search_in_progress_still_calls_callbacks(
+            self, lib_mock, time_mock):
+        self.create_searches(lib_mock, time_mock)
+        cache = spotify.SearchCache(self.session, max_size=1)
+        callback = mock.Mock()
+        search = cache.search('alice', callback=callback)
+        cache.search('bob')
+
+        self.complete_search(lib_mock, search)
+
+        callback.assert_called_once_with(search)
+
+    def test_clear(self, lib_mock, time_mock):
+        self.create_searches(lib_mock, time_mock)
+        cache = spotify.SearchCache(self.session)
+        search = cache.search('alice')
+        cache.search('alice')
+
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.misses, 0)
+        self.assertEqual(cache.coalesced, 0)
+        self.assertIsNot(cache.search('alice'), search)
+
+    def test_repr(self, lib_mock, time_mock):
+        cache = spotify.SearchCache(self.session, max_size=10)
+
+        self.assertEqual(
+            repr(cache),
+            'SearchCache(size=0, max_size=10, '
+            'hits=0, misses=0, coalesced=0)')
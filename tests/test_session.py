@@ -553,12 +553,111 @@ class SessionTest(unittest.TestCase):
         self.assertIs(result, mock.sentinel.track)
         track_mock.assert_called_with(session, uri='spotify:track:foo')
 
+    @mock.patch('spotify.Track')
+    def test_get_tracks(self, track_mock, lib_mock):
+        session = tests.create_real_session(lib_mock)
+        sp_links = {
+            b'spotify:track:foo': spotify.ffi.cast('sp_link *', 42),
+            b'spotify:track:bar': spotify.ffi.cast('sp_link *', 43),
+        }
+        lib_mock.sp_link_create_from_string.side_effect = (
+            lambda uri: sp_links[spotify.ffi.string(uri)])
+        lib_mock.sp_link_as_track.side_effect = (
+            lambda sp_link: spotify.ffi.cast('sp_track *', sp_link))
+        track_mock._cached.side_effect = (
+            lambda session, sp_track, add_ref: int(
+                spotify.ffi.cast('intptr_t', sp_track)))
+
+        result = session.get_tracks([
+            'spotify:track:foo', 'spotify:track:bar', 'spotify:track:foo'])
+
+        self.assertEqual(result, [42, 43, 42])
+        self.assertEqual(lib_mock.sp_link_create_from_string.call_count, 2)
+        track_mock._cached.assert_has_calls([
+            mock.call(
+                session, spotify.ffi.cast('sp_track *', 42), add_ref=True),
+            mock.call(
+                session, spotify.ffi.cast('sp_track *', 43), add_ref=True),
+        ], any_order=True)
+        self.assertEqual(track_mock._cached.call_count, 2)
+        lib_mock.sp_link_release.assert_has_calls(
+            [mock.call(sp_link) for sp_link in sp_links.values()],
+            any_order=True)
+
+    @mock.patch('spotify.Track')
+    def test_get_tracks_with_invalid_uri(self, track_mock, lib_mock):
+        session = tests.create_real_session(lib_mock)
+        sp_link = spotify.ffi.cast('sp_link *', 42)
+        lib_mock.sp_link_create_from_string.side_effect = (
+            lambda uri: sp_link if spotify.ffi.string(uri).startswith(
+                b'spotify:track:') else spotify.ffi.NULL)
+        lib_mock.sp_link_as_track.return_value = spotify.ffi.cast(
+            'sp_track *', 43)
+        track_mock._cached.return_value = mock.sentinel.track
+
+        result = session.get_tracks(
+            ['spotify:album:foo', 'spotify:track:foo'])
+
+        self.assertEqual(len(result), 2)
+        self.assertIsInstance(result[0], ValueError)
+        self.assertIs(result[1], mock.sentinel.track)
+
+    @mock.patch('spotify.Track')
+    def test_get_tracks_with_uri_of_other_type(self, track_mock, lib_mock):
+        session = tests.create_real_session(lib_mock)
+        sp_link = spotify.ffi.cast('sp_link *', 42)
+        lib_mock.sp_link_create_from_string.return_value = sp_link
+        lib_mock.sp_link_as_track.return_value = spotify.ffi.NULL
+
+        result = session.get_tracks(['spotify:album:foo'])
+
+        self.assertIsInstance(result[0], ValueError)
+        self.assertEqual(track_mock._cached.call_count, 0)
+        lib_mock.sp_link_release.assert_called_once_with(sp_link)
+
+    @mock.patch('spotify.utils.load_all')
+    @mock.patch('spotify.Track')
+    def test_get_tracks_with_load(self, track_mock, load_all_mock, lib_mock):
+        session = tests.create_real_session(lib_mock)
+        lib_mock.sp_link_create_from_string.return_value = (
+            spotify.ffi.cast('sp_link *', 42))
+        lib_mock.sp_link_as_track.return_value = (
+            spotify.ffi.cast('sp_track *', 43))
+        track = mock.Mock()
+        track.error = spotify.ErrorType.OK
+        track_mock._cached.return_value = track
+
+        result = session.get_tracks(['spotify:track:foo'], load=True)
+
+        self.assertEqual(result, [track])
+        load_all_mock.assert_called_once_with(
+            session, set([track]), timeout=None)
+
+    @mock.patch('spotify.utils.load_all')
+    @mock.patch('spotify.Track')
+    def test_get_tracks_with_load_replaces_failed_tracks_with_errors(
+            self, track_mock, load_all_mock, lib_mock):
+        session = tests.create_real_session(lib_mock)
+        lib_mock.sp_link_create_from_string.return_value = (
+            spotify.ffi.cast('sp_link *', 42))
+        lib_mock.sp_link_as_track.return_value = (
+            spotify.ffi.cast('sp_track *', 43))
+        track = mock.Mock()
+        track.error = spotify.ErrorType.OTHER_PERMANENT
+        track_mock._cached.return_value = track
+
+        result = session.get_tracks(['spotify:track:foo'], load=True)
+
+        self.assertIsInstance(result[0], spotify.LibError)
+        self.assertEqual(
+            result[0].error_type, spotify.ErrorType.OTHER_PERMANENT)
+
     @mock.patch('spotify.Track')
     def test_get_local_track(self, track_mock, lib_mock):
         session = tests.create_real_session(lib_mock)
         sp_track = spotify.ffi.cast('sp_track *', 42)
         lib_mock.sp_localtrack_create.return_value = sp_track
-        track_mock.return_value = mock.sentinel.track
+        track_mock._cached.return_value = mock.sentinel.track
 
         track = session.get_local_track(
             artist='foo', title='bar', album='baz', length=210000)
@@ -581,7 +680,7 @@ class SessionTest(unittest.TestCase):
         # Since we *created* the sp_track, we already have a refcount of 1 and
         # shouldn't increase the refcount when wrapping this sp_track in a
         # Track object
-        track_mock.assert_called_with(
+        track_mock._cached.assert_called_with(
             session, sp_track=sp_track, add_ref=False)
 
     @mock.patch('spotify.Track')
@@ -589,7 +688,7 @@ class SessionTest(unittest.TestCase):
         session = tests.create_real_session(lib_mock)
         sp_track = spotify.ffi.cast('sp_track *', 42)
         lib_mock.sp_localtrack_create.return_value = sp_track
-        track_mock.return_value = mock.sentinel.track
+        track_mock._cached.return_value = mock.sentinel.track
 
         track = session.get_local_track()
 
@@ -611,7 +710,7 @@ class SessionTest(unittest.TestCase):
         # Since we *created* the sp_track, we already have a refcount of 1 and
         # shouldn't increase the refcount when wrapping this sp_track in a
         # Track object
-        track_mock.assert_called_with(
+        track_mock._cached.assert_called_with(
             session, sp_track=sp_track, add_ref=False)
 
     @mock.patch('spotify.Album')
@@ -624,6 +723,21 @@ class SessionTest(unittest.TestCase):
         self.assertIs(result, mock.sentinel.album)
         album_mock.assert_called_with(session, uri='spotify:album:foo')
 
+    @mock.patch('spotify.Album')
+    def test_get_albums(self, album_mock, lib_mock):
+        session = tests.create_real_session(lib_mock)
+        sp_album = spotify.ffi.cast('sp_album *', 43)
+        lib_mock.sp_link_create_from_string.return_value = (
+            spotify.ffi.cast('sp_link *', 42))
+        lib_mock.sp_link_as_album.return_value = sp_album
+        album_mock._cached.return_value = mock.sentinel.album
+
+        result = session.get_albums(['spotify:album:foo'])
+
+        self.assertEqual(result, [mock.sentinel.album])
+        album_mock._cached.assert_called_once_with(
+            session, sp_album, add_ref=True)
+
     @mock.patch('spotify.Artist')
     def test_get_artist(self, artist_mock, lib_mock):
         session = tests.create_real_session(lib_mock)
@@ -634,6 +748,21 @@ class SessionTest(unittest.TestCase):
         self.assertIs(result, mock.sentinel.artist)
         artist_mock.assert_called_with(session, uri='spotify:artist:foo')
 
+    @mock.patch('spotify.Artist')
+    def test_get_artists(self, artist_mock, lib_mock):
+        session = tests.create_real_session(lib_mock)
+        sp_artist = spotify.ffi.cast('sp_artist *', 43)
+        lib_mock.sp_link_create_from_string.return_value = (
+            spotify.ffi.cast('sp_link *', 42))
+        lib_mock.sp_link_as_artist.return_value = sp_artist
+        artist_mock._cached.return_value = mock.sentinel.artist
+
+        result = session.get_artists(['spotify:artist:foo'])
+
+        self.assertEqual(result, [mock.sentinel.artist])
+        artist_mock._cached.assert_called_once_with(
+            session, sp_artist, add_ref=True)
+
     @mock.patch('spotify.Playlist')
     def test_get_playlist(self, playlist_mock, lib_mock):
         session = tests.create_real_session(lib_mock)
@@ -682,6 +811,192 @@ class SessionTest(unittest.TestCase):
             playlist_offset=0, playlist_count=20,
             search_type=None)
 
+    def test_search_uses_search_cache_if_set(self, lib_mock):
+        session = tests.create_real_session(lib_mock)
+        session.search_cache = mock.Mock(spec=spotify.SearchCache)
+        session.search_cache.search.return_value = mock.sentinel.search
+
+        result = session.search('alice', track_count=50)
+
+        self.assertIs(result, mock.sentinel.search)
+        session.search_cache.search.assert_called_with(
+            'alice', callback=None,
+            track_offset=0, track_count=50,
+            album_offset=0, album_count=20,
+            artist_offset=0, artist_count=20,
+            playlist_offset=0, playlist_count=20,
+            search_type=None)
+
+    def create_search_many_session(self, lib_mock, time_mock, events):
+        # Each call to process_events() takes 1s and completes the oldest
+        # search in progress. The searches started and completed are
+        # recorded in events.
+        session = tests.create_real_session(lib_mock)
+        session.connection = mock.Mock()
+        session.connection.state = spotify.ConnectionState.LOGGED_IN
+        clock = [100.0]
+        pending = []
+
+        def search(query, callback, **kwargs):
+            events.append(('start', query, clock[0]))
+            pending.append((query, callback))
+            return mock.sentinel.search
+
+        def process_events():
+            clock[0] += 1
+            if pending:
+                query, callback = pending.pop(0)
+                events.append(('complete', query, clock[0]))
+                callback(mock.sentinel.search)
+
+        def sleep(seconds):
+            clock[0] += seconds
+
+        session.search = mock.Mock(side_effect=search)
+        session.process_events = mock.Mock(side_effect=process_events)
+        time_mock.time.side_effect = lambda: clock[0]
+        time_mock.sleep.side_effect = sleep
+        return session
+
+    @mock.patch('spotify.session.time')
+    def test_search_many(self, time_mock, lib_mock):
+        events = []
+        session = self.create_search_many_session(
+            lib_mock, time_mock, events)
+
+        results = list(session.search_many(
+            ['alice', 'bob', 'alice'], concurrency=2, track_count=1))
+
+        self.assertEqual(
+            [(result.query, result.search) for result in results],
+            [('alice', mock.sentinel.search), ('bob', mock.sentinel.search),
+                ('alice', mock.sentinel.search)])
+        self.assertEqual(
+            [round(result.wait_time) for result in results], [0, 0, 1])
+        self.assertEqual(
+            [round(result.duration) for result in results], [1, 2, 2])
+        session.search.assert_called_with(
+            'alice', callback=mock.ANY, track_count=1)
+
+    @mock.patch('spotify.session.time')
+    def test_search_many_keeps_concurrency_searches_in_flight(
+            self, time_mock, lib_mock):
+        events = []
+        session = self.create_search_many_session(
+            lib_mock, time_mock, events)
+
+        results = session.search_many(['a', 'b', 'c', 'd'], concurrency=3)
+        next(results)
+
+        self.assertEqual(
+            [event[:2] for event in events],
+            [('start', 'a'), ('start', 'b'), ('start', 'c'),
+                ('complete', 'a')])
+
+        next(results)
+
+        self.assertEqual(events[4][:2], ('start', 'd'))
+
+    @mock.patch('spotify.session.time')
+    def test_search_many_with_max_rate(self, time_mock, lib_mock):
+        events = []
+        session = self.create_search_many_session(
+            lib_mock, time_mock, events)
+
+        list(session.search_many(['a', 'b', 'c'], max_rate=0.25))
+
+        self.assertEqual(
+            [event[2] for event in events if event[0] == 'start'],
+            [100, 104, 108])
+
+    @mock.patch('spotify.session.time')
+    def test_search_many_with_max_rate_after_a_pause(
+            self, time_mock, lib_mock):
+        events = []
+        session = self.create_search_many_session(
+            lib_mock, time_mock, events)
+        pending = []
+
+        def search(query, callback, **kwargs):
+            events.append(('start', query, time_mock.time()))
+            pending.append(callback)
+
+        def process_events():
+            # Each search takes 1s, and all searches in progress complete
+            # together
+            time_mock.sleep(1)
+            while pending:
+                pending.pop(0)(mock.sentinel.search)
+
+        session.search.side_effect = search
+        session.process_events.side_effect = process_events
+
+        list(session.search_many(
+            ['a', 'b', 'c', 'd', 'e', 'f'], concurrency=2, max_rate=10))
+
+        starts = [event[2] for event in events]
+        self.assertEqual(len(starts), 6)
+        for earlier, later in zip(starts, starts[1:]):
+            self.assertGreaterEqual(later - earlier, 0.1 - 1e-9)
+
+    @mock.patch('spotify.session.time')
+    def test_search_many_times_out(self, time_mock, lib_mock):
+        events = []
+        session = self.create_search_many_session(
+            lib_mock, time_mock, events)
+        session.process_events.side_effect = (
+            lambda: time_mock.sleep(1))
+
+        with self.assertRaises(spotify.Timeout):
+            list(session.search_many(['alice'], timeout=5))
+
+    @mock.patch('spotify.session.time')
+    def test_search_many_with_searches_completing_right_away(
+            self, time_mock, lib_mock):
+        events = []
+        session = self.create_search_many_session(
+            lib_mock, time_mock, events)
+        session.search.side_effect = (
+            lambda query, callback, **kwargs: callback(mock.sentinel.search))
+
+        results = list(session.search_many(['a', 'b', 'c'], concurrency=1))
+
+        self.assertEqual([result.query for result in results], ['a', 'b', 'c'])
+        self.assertEqual(session.process_events.call_count, 0)
+
+    def test_search_many_fails_if_not_logged_in(self, lib_mock):
+        session = tests.create_real_session(lib_mock)
+        session.connection = mock.Mock()
+        session.connection.state = spotify.ConnectionState.LOGGED_OUT
+
+        with self.assertRaises(spotify.Error):
+            list(session.search_many(['alice']))
+
+    def test_search_many_without_queries(self, lib_mock):
+        session = tests.create_real_session(lib_mock)
+
+        self.assertEqual(list(session.search_many([])), [])
+
+    def test_search_many_fails_without_concurrency(self, lib_mock):
+        session = tests.create_real_session(lib_mock)
+
+        with self.assertRaises(ValueError):
+            session.search_many(['alice'], concurrency=0)
+
+    def test_search_many_fails_without_positive_max_rate(self, lib_mock):
+        session = tests.create_real_session(lib_mock)
+
+        with self.assertRaises(ValueError):
+            session.search_many(['alice'], max_rate=0)
+        with self.assertRaises(ValueError):
+            session.search_many(['alice'], max_rate=-1)
+
+    def test_search_many_fails_with_callback(self, lib_mock):
+        session = tests.create_real_session(lib_mock)
+
+        with self.assertRaises(TypeError):
+            session.search_many(['alice'], callback=mock.Mock())
+
     @mock.patch('spotify.Toplist')
     def test_toplist(self, toplist_mock, lib_mock):
         session = tests.create_real_session(lib_mock)
@@ -731,6 +1046,15 @@ class SessionCallbacksTest(unittest.TestCase):
 
         callback.assert_called_once_with(session)
 
+    def test_metadata_updated_callback_invalidates_memoized_metadata(
+            self, lib_mock):
+        session = tests.create_real_session(lib_mock)
+        generation = session._metadata_generation
+
+        _SessionCallbacks.metadata_updated(session._sp_session)
+
+        self.assertEqual(session._metadata_generation, generation + 1)
+
     def test_connection_error_callback(self, lib_mock):
         callback = mock.Mock()
         session = tests.create_real_session(lib_mock)
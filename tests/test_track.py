@@ -1,6 +1,7 @@
 from __future__ import unicode_literals
 
 import unittest
+import weakref
 
 import spotify
 import tests
@@ -66,9 +67,73 @@ class TrackTest(unittest.TestCase):
 
         lib_mock.sp_track_release.assert_called_with(sp_track)
 
+    def test_has_no_instance_dict(self, lib_mock):
+        sp_track = spotify.ffi.cast('sp_track *', 42)
+        track = spotify.Track(self.session, sp_track=sp_track)
+
+        self.assertFalse(hasattr(track, '__dict__'))
+        with self.assertRaises(AttributeError):
+            track.foo = 'bar'
+
+    def test_supports_weak_references(self, lib_mock):
+        sp_track = spotify.ffi.cast('sp_track *', 42)
+        track = spotify.Track(self.session, sp_track=sp_track)
+
+        self.assertIs(weakref.ref(track)(), track)
+
+    def test_cached_track(self, lib_mock):
+        sp_track = spotify.ffi.cast('sp_track *', 42)
+
+        result1 = spotify.Track._cached(self.session, sp_track)
+        result2 = spotify.Track._cached(self.session, sp_track)
+
+        self.assertIsInstance(result1, spotify.Track)
+        self.assertIs(result1, result2)
+        lib_mock.sp_track_add_ref.assert_called_once_with(sp_track)
+
+    def test_cached_track_releases_unneeded_ref(self, lib_mock):
+        sp_track = spotify.ffi.cast('sp_track *', 42)
+        track = spotify.Track._cached(self.session, sp_track)
+
+        result = spotify.Track._cached(self.session, sp_track, add_ref=False)
+
+        self.assertIs(result, track)
+        lib_mock.sp_track_release.assert_called_once_with(sp_track)
+
+    def test_cached_track_is_not_kept_alive_by_cache(self, lib_mock):
+        sp_track = spotify.ffi.cast('sp_track *', 42)
+        track = spotify.Track._cached(self.session, sp_track)
+        track = None  # noqa
+        tests.gc_collect()
+
+        self.assertNotIn(sp_track, self.session._cache)
+        lib_mock.sp_track_release.assert_called_with(sp_track)
+
+    def test_cached_track_ignores_other_types_with_same_pointer(
+            self, lib_mock):
+        sp_track = spotify.ffi.cast('sp_track *', 42)
+        self.session._cache[sp_track] = mock.sentinel.other
+
+        result = spotify.Track._cached(self.session, sp_track)
+
+        self.assertIsInstance(result, spotify.Track)
+        self.assertIs(self.session._cache[sp_track], result)
+
     @mock.patch('spotify.Link', spec=spotify.Link)
-    def test_repr(self, link_mock, lib_mock):
+    def test_create_from_uri_is_cached(self, link_mock, lib_mock):
+        sp_track = spotify.ffi.cast('sp_track *', 42)
         link_instance_mock = link_mock.return_value
+        link_instance_mock.as_track.return_value = spotify.Track(
+            self.session, sp_track=sp_track)
+        uri = 'spotify:track:foo'
+
+        result = spotify.Track(self.session, uri=uri)
+
+        self.assertIs(spotify.Track._cached(self.session, sp_track), result)
+
+    @mock.patch('spotify.Link', spec=spotify.Link)
+    def test_repr(self, link_mock, lib_mock):
+        link_instance_mock = link_mock._cached.return_value
         link_instance_mock.uri = 'foo'
         sp_track = spotify.ffi.cast('sp_track *', 42)
         track = spotify.Track(self.session, sp_track=sp_track)
@@ -443,6 +508,38 @@ class TrackTest(unittest.TestCase):
     def test_name_fails_if_error(self, lib_mock):
         self.assert_fails_if_error(lib_mock, lambda t: t.name)
 
+    def test_name_is_memoized_if_enabled_and_loaded(self, lib_mock):
+        self.session.memoize_metadata = True
+        lib_mock.sp_track_error.return_value = spotify.ErrorType.OK
+        lib_mock.sp_track_is_loaded.return_value = 1
+        lib_mock.sp_track_name.return_value = spotify.ffi.new(
+            'char[]', b'Foo Bar Baz')
+        sp_track = spotify.ffi.cast('sp_track *', 42)
+        track = spotify.Track(self.session, sp_track=sp_track)
+
+        result1 = track.name
+        result2 = track.name
+
+        lib_mock.sp_track_name.assert_called_once_with(sp_track)
+        self.assertEqual(result1, 'Foo Bar Baz')
+        self.assertEqual(result2, 'Foo Bar Baz')
+        self.assertEqual(self.session.memo_stats.hits, 1)
+
+    def test_name_is_refetched_after_metadata_update(self, lib_mock):
+        self.session.memoize_metadata = True
+        lib_mock.sp_track_error.return_value = spotify.ErrorType.OK
+        lib_mock.sp_track_is_loaded.return_value = 1
+        lib_mock.sp_track_name.return_value = spotify.ffi.new(
+            'char[]', b'Foo Bar Baz')
+        sp_track = spotify.ffi.cast('sp_track *', 42)
+        track = spotify.Track(self.session, sp_track=sp_track)
+        track.name
+        self.session._metadata_generation += 1
+
+        track.name
+
+        self.assertEqual(lib_mock.sp_track_name.call_count, 2)
+
     def test_duration(self, lib_mock):
         lib_mock.sp_track_error.return_value = spotify.ErrorType.OK
         lib_mock.sp_track_duration.return_value = 60000
@@ -549,13 +646,13 @@ class TrackTest(unittest.TestCase):
         track = spotify.Track(self.session, sp_track=sp_track)
         sp_link = spotify.ffi.cast('sp_link *', 43)
         lib_mock.sp_link_create_from_track.return_value = sp_link
-        link_mock.return_value = mock.sentinel.link
+        link_mock._cached.return_value = mock.sentinel.link
 
         result = track.link
 
         lib_mock.sp_link_create_from_track.asssert_called_once_with(
             sp_track, 0)
-        link_mock.assert_called_once_with(
+        link_mock._cached.assert_called_once_with(
             self.session, sp_link=sp_link, add_ref=False)
         self.assertEqual(result, mock.sentinel.link)
 
@@ -565,13 +662,13 @@ class TrackTest(unittest.TestCase):
         track = spotify.Track(self.session, sp_track=sp_track)
         sp_link = spotify.ffi.cast('sp_link *', 43)
         lib_mock.sp_link_create_from_track.return_value = sp_link
-        link_mock.return_value = mock.sentinel.link
+        link_mock._cached.return_value = mock.sentinel.link
 
         result = track.link_with_offset(90)
 
         lib_mock.sp_link_create_from_track.asssert_called_once_with(
             sp_track, 90)
-        link_mock.assert_called_once_with(
+        link_mock._cached.assert_called_once_with(
             self.session, sp_link=sp_link, add_ref=False)
         self.assertEqual(result, mock.sentinel.link)
 
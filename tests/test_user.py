@@ -57,9 +57,18 @@ class UserTest(unittest.TestCase):
 
         lib_mock.sp_user_release.assert_called_with(sp_user)
 
+    def test_cached_user(self, lib_mock):
+        sp_user = spotify.ffi.cast('sp_user *', 42)
+
+        result1 = spotify.User._cached(self.session, sp_user)
+        result2 = spotify.User._cached(self.session, sp_user)
+
+        self.assertIsInstance(result1, spotify.User)
+        self.assertIs(result1, result2)
+
     @mock.patch('spotify.Link', spec=spotify.Link)
     def test_repr(self, link_mock, lib_mock):
-        link_instance_mock = link_mock.return_value
+        link_instance_mock = link_mock._cached.return_value
         link_instance_mock.uri = 'foo'
         sp_user = spotify.ffi.cast('sp_user *', 42)
         user = spotify.User(self.session, sp_user=sp_user)
@@ -115,11 +124,11 @@ class UserTest(unittest.TestCase):
         user = spotify.User(self.session, sp_user=sp_user)
         sp_link = spotify.ffi.cast('sp_link *', 43)
         lib_mock.sp_link_create_from_user.return_value = sp_link
-        link_mock.return_value = mock.sentinel.link
+        link_mock._cached.return_value = mock.sentinel.link
 
         result = user.link
 
-        link_mock.assert_called_once_with(
+        link_mock._cached.assert_called_once_with(
             self.session, sp_link=sp_link, add_ref=False)
         self.assertEqual(result, mock.sentinel.link)
 
@@ -2,6 +2,8 @@
 
 from __future__ import unicode_literals
 
+import random
+import threading
 import unittest
 
 import spotify
@@ -177,6 +179,388 @@ class IntEnumTest(unittest.TestCase):
         self.assertIsNot(self.Foo(2), self.Foo.bar)
         self.assertIsNot(self.Foo(1), self.Foo.baz)
 
+    def test_unknown_value_gets_an_instance_without_name(self):
+        self.assertEqual(repr(self.Foo(3)), '<Unknown Foo: 3>')
+        self.assertIs(self.Foo(3), self.Foo(3))
+
+    def test_make_table_makes_lookup_table_of_values(self):
+        self.Foo._make_table()
+
+        self.assertEqual(self.Foo._table, (None, self.Foo.bar, self.Foo.baz))
+        self.assertIs(self.Foo(1), self.Foo.bar)
+        self.assertIs(self.Foo(2), self.Foo.baz)
+
+    def test_values_outside_lookup_table_still_work(self):
+        self.Foo._make_table()
+
+        self.assertEqual(repr(self.Foo(0)), '<Unknown Foo: 0>')
+        self.assertEqual(repr(self.Foo(-1)), '<Unknown Foo: -1>')
+        self.assertEqual(repr(self.Foo(3)), '<Unknown Foo: 3>')
+
+    def test_make_table_skips_negative_values(self):
+        self.Foo.add('qux', -1)
+
+        self.Foo._make_table()
+
+        self.assertEqual(self.Foo._table, ())
+        self.assertIs(self.Foo(-1), self.Foo.qux)
+
+    def test_make_enum_makes_lookup_table(self):
+        self.assertIs(
+            spotify.ErrorType._table[spotify.lib.SP_ERROR_OK],
+            spotify.ErrorType.OK)
+        self.assertIs(
+            spotify.ErrorType(spotify.lib.SP_ERROR_IS_LOADING),
+            spotify.ErrorType.IS_LOADING)
+
+    def test_subclasses_do_not_share_values(self):
+        class Bar(utils.IntEnum):
+            pass
+
+        self.assertIsInstance(Bar(1), Bar)
+        self.assertIsInstance(self.Foo(1), self.Foo)
+
+
+class GetWithFixedBufferTest(unittest.TestCase):
+
+    def test_calls_func_with_args_and_buffer(self):
+        func = mock.Mock(side_effect=tests.buffer_writer('foo'))
+
+        result = utils.get_with_fixed_buffer(100, func, 'a', 'b')
+
+        self.assertEqual(result, 'foo')
+        func.assert_called_once_with('a', 'b', mock.ANY, 100)
+
+    def test_reuses_buffer(self):
+        func = mock.Mock(side_effect=tests.buffer_writer('foo'))
+
+        utils.get_with_fixed_buffer(100, func)
+        utils.get_with_fixed_buffer(100, func)
+
+        buffers = [call[0][0] for call in func.call_args_list]
+        self.assertIs(buffers[0], buffers[1])
+
+    def test_reused_buffer_is_empty_if_func_does_not_write(self):
+        utils.get_with_fixed_buffer(
+            100, mock.Mock(side_effect=tests.buffer_writer('folder name A')))
+
+        result = utils.get_with_fixed_buffer(100, mock.Mock(return_value=0))
+
+        self.assertEqual(result, '')
+
+
+class GetWithGrowingBufferTest(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(utils, '_buffer_pool', threading.local())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_grows_buffer_to_fit_string(self):
+        string = 'foo' * 20
+        func = mock.Mock(side_effect=tests.buffer_writer(string))
+
+        result = utils.get_with_growing_buffer(func, 'a')
+
+        self.assertEqual(result, string)
+        self.assertEqual(func.call_count, 2)
+        func.assert_called_with('a', mock.ANY, mock.ANY)
+        self.assertGreater(func.call_args[0][2], len(string))
+
+    def test_learns_buffer_size_from_earlier_calls(self):
+        string = 'foo' * 20
+        func = mock.Mock(side_effect=tests.buffer_writer(string))
+        utils.get_with_growing_buffer(func)
+        func.reset_mock()
+
+        result = utils.get_with_growing_buffer(func)
+
+        self.assertEqual(result, string)
+        self.assertEqual(func.call_count, 1)
+
+    def test_returns_none_if_func_returns_minus_one(self):
+        func = mock.Mock(return_value=-1)
+
+        result = utils.get_with_growing_buffer(func)
+
+        self.assertIsNone(result)
+
+    def test_reused_buffer_is_empty_if_func_does_not_write(self):
+        utils.get_with_growing_buffer(
+            mock.Mock(side_effect=tests.buffer_writer('foo')))
+
+        result = utils.get_with_growing_buffer(mock.Mock(return_value=0))
+
+        self.assertEqual(result, '')
+
+    def test_does_not_keep_very_large_buffers(self):
+        string = 'foo' * 1000
+        func = mock.Mock(side_effect=tests.buffer_writer(string))
+
+        result = utils.get_with_growing_buffer(func)
+
+        self.assertEqual(result, string)
+        self.assertLess(
+            len(utils._get_buffer(1)), utils._MAX_POOLED_BUFFER_LENGTH + 1)
+
+
+class MemoizeLoadedTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = tests.create_session_mock()
+        self.session.memoize_metadata = True
+        self.func = mock.Mock(return_value='value')
+        self.func.__name__ = str('name')
+
+        session = self.session
+        func = self.func
+
+        class Foo(object):
+            _session = session
+            _memo = None
+            is_loaded = True
+
+            name = property(utils.memoize_loaded(func))
+
+        self.obj = Foo()
+
+    def test_calls_func_every_time_if_memoization_is_disabled(self):
+        self.session.memoize_metadata = False
+
+        self.assertEqual(self.obj.name, 'value')
+        self.assertEqual(self.obj.name, 'value')
+
+        self.assertEqual(self.func.call_count, 2)
+        self.assertIsNone(self.obj._memo)
+
+    def test_calls_func_every_time_if_not_loaded(self):
+        self.obj.is_loaded = False
+
+        self.assertEqual(self.obj.name, 'value')
+        self.assertEqual(self.obj.name, 'value')
+
+        self.assertEqual(self.func.call_count, 2)
+        self.assertIsNone(self.obj._memo)
+
+    def test_calls_func_once_if_loaded(self):
+        self.assertEqual(self.obj.name, 'value')
+        self.assertEqual(self.obj.name, 'value')
+
+        self.func.assert_called_once_with(self.obj)
+        self.assertEqual(self.session.memo_stats.misses, 1)
+        self.assertEqual(self.session.memo_stats.hits, 1)
+
+    def test_calls_func_again_after_metadata_update(self):
+        self.assertEqual(self.obj.name, 'value')
+        self.session._metadata_generation += 1
+        self.func.return_value = 'new value'
+
+        self.assertEqual(self.obj.name, 'new value')
+
+        self.assertEqual(self.func.call_count, 2)
+        self.assertEqual(self.session.memo_stats.misses, 2)
+        self.assertEqual(self.session.memo_stats.invalidations, 1)
+
+
+class MemoStatsTest(unittest.TestCase):
+
+    def test_starts_at_zero(self):
+        stats = utils.MemoStats()
+
+        self.assertEqual(stats.hits, 0)
+        self.assertEqual(stats.misses, 0)
+        self.assertEqual(stats.invalidations, 0)
+        self.assertEqual(stats.hit_rate, 0.0)
+
+    def test_hit_rate(self):
+        stats = utils.MemoStats()
+        stats.hits = 3
+        stats.misses = 1
+
+        self.assertEqual(stats.hit_rate, 0.75)
+
+    def test_reset(self):
+        stats = utils.MemoStats()
+        stats.hits = 3
+        stats.misses = 1
+        stats.invalidations = 2
+
+        stats.reset()
+
+        self.assertEqual(stats.hits, 0)
+        self.assertEqual(stats.misses, 0)
+        self.assertEqual(stats.invalidations, 0)
+
+    def test_repr(self):
+        stats = utils.MemoStats()
+        stats.hits = 3
+
+        self.assertEqual(
+            repr(stats), 'MemoStats(hits=3, misses=0, invalidations=0)')
+
+
+class RequestCacheTest(unittest.TestCase):
+
+    def create_request(self, callback, error=spotify.ErrorType.OK):
+        request = mock.Mock()
+        request.error = error
+        request.complete = lambda: callback(request)
+        return request
+
+    def test_miss_creates_request(self):
+        cache = utils.RequestCache()
+        create = mock.Mock(side_effect=self.create_request)
+
+        request = cache.get('key', create, keep_alive=mock.sentinel.obj)
+
+        create.assert_called_once_with(callback=mock.ANY)
+        self.assertEqual(cache._entries['key'][:2], (
+            request, mock.sentinel.obj))
+        self.assertEqual(cache.misses, 1)
+
+    def test_request_in_progress_is_shared(self):
+        cache = utils.RequestCache()
+        create = mock.Mock(side_effect=self.create_request)
+        callback1 = mock.Mock()
+        callback2 = mock.Mock()
+        request = cache.get('key', create, callback=callback1)
+
+        self.assertIs(cache.get('key', create, callback=callback2), request)
+        self.assertEqual(callback1.call_count, 0)
+
+        request.complete()
+
+        self.assertEqual(create.call_count, 1)
+        callback1.assert_called_once_with(request)
+        callback2.assert_called_once_with(request)
+        self.assertEqual(cache.coalesced, 1)
+
+    def test_completed_request_is_a_hit(self):
+        cache = utils.RequestCache()
+        create = mock.Mock(side_effect=self.create_request)
+        request = cache.get('key', create)
+        request.complete()
+        callback = mock.Mock()
+
+        self.assertIs(cache.get('key', create, callback=callback), request)
+
+        callback.assert_called_once_with(request)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.hit_rate, 0.5)
+
+    def test_failed_request_is_not_kept(self):
+        cache = utils.RequestCache()
+        request = cache.get('key', lambda callback: self.create_request(
+            callback, error=spotify.ErrorType.OTHER_TRANSIENT))
+
+        request.complete()
+
+        self.assertEqual(len(cache), 0)
+
+    @mock.patch('spotify.utils.time')
+    def test_old_request_is_a_miss(self, time_mock):
+        time_mock.time.return_value = 1000
+        cache = utils.RequestCache(max_age=60)
+        create = mock.Mock(side_effect=self.create_request)
+        cache.get('key', create).complete()
+
+        time_mock.time.return_value = 1060
+        cache.get('key', create)
+
+        self.assertEqual(create.call_count, 2)
+        self.assertEqual(len(cache), 1)
+
+    def test_evicts_least_recently_used_request(self):
+        cache = utils.RequestCache(max_size=2)
+        create = mock.Mock(side_effect=self.create_request)
+        cache.get('a', create)
+        cache.get('b', create)
+        cache.get('a', create)
+
+        cache.get('c', create)
+
+        self.assertEqual(list(cache._entries), ['a', 'c'])
+
+    def test_subclass_is_told_about_saved_requests(self):
+        cache = utils.RequestCache()
+        cache._requests_saved = mock.Mock()
+        create = mock.Mock(side_effect=self.create_request)
+        request = cache.get('key', create)
+        cache.get('key', create)
+        cache.get('key', create)
+
+        request.complete()
+        cache.get('key', create)
+
+        self.assertEqual(cache._requests_saved.call_args_list, [
+            mock.call(request, 2), mock.call(request, 1)])
+
+    def test_repr(self):
+        cache = utils.RequestCache(max_size=10)
+
+        self.assertEqual(
+            repr(cache),
+            'RequestCache(size=0, max_size=10, hits=0, misses=0, '
+            'coalesced=0)')
+
+
+class PositionTreeTest(unittest.TestCase):
+
+    def create_tree(self, values):
+        tree = utils.PositionTree()
+        nodes = [utils.PositionTreeNode(value) for value in values]
+        tree.insert(0, nodes)
+        return tree, nodes
+
+    def get_values(self, tree):
+        return [node.value for node in tree]
+
+    def test_insert(self):
+        tree, nodes = self.create_tree('ad')
+
+        tree.insert(1, [utils.PositionTreeNode(v) for v in 'bc'])
+
+        self.assertEqual(self.get_values(tree), list('abcd'))
+        self.assertEqual(len(tree), 4)
+        self.assertEqual(tree.get(2).value, 'c')
+        self.assertEqual(tree.index(nodes[1]), 3)
+
+    def test_pop(self):
+        tree, nodes = self.create_tree('abcd')
+
+        node = tree.pop(1)
+
+        self.assertIs(node, nodes[1])
+        self.assertEqual(self.get_values(tree), list('acd'))
+        self.assertEqual(tree.index(nodes[3]), 2)
+
+    def test_popped_node_can_be_inserted_again(self):
+        tree, nodes = self.create_tree('abcd')
+
+        tree.insert(3, [tree.pop(0)])
+
+        self.assertEqual(self.get_values(tree), list('bcda'))
+        self.assertEqual(tree.index(nodes[0]), 3)
+
+    def test_follows_many_random_changes(self):
+        tree, nodes = self.create_tree(range(100))
+        values = list(range(100))
+        rng = random.Random(42)
+
+        for i in range(500):
+            if rng.random() < 0.5 and values:
+                index = rng.randrange(len(values))
+                self.assertEqual(tree.pop(index).value, values.pop(index))
+            else:
+                index = rng.randint(0, len(values))
+                tree.insert(index, [utils.PositionTreeNode(100 + i)])
+                values.insert(index, 100 + i)
+
+        self.assertEqual(self.get_values(tree), values)
+        for i, node in enumerate(tree):
+            self.assertEqual(tree.index(node), i)
+            self.assertIs(tree.get(i), node)
+
 
 @mock.patch('spotify.search.lib', spec=spotify.lib)
 class SequenceTest(unittest.TestCase):
@@ -271,8 +655,8 @@ class SequenceTest(unittest.TestCase):
 
         result = seq[0:2]
 
-        # Entire collection of length 3 is created as a list
-        self.assertEqual(getitem_func.call_count, 3)
+        # Only the items in the slice are created
+        self.assertEqual(getitem_func.call_count, 2)
 
         # Only a subslice of length 2 is returned
         self.assertIsInstance(result, list)
@@ -280,6 +664,100 @@ class SequenceTest(unittest.TestCase):
         self.assertEqual(result[0], mock.sentinel.item_one)
         self.assertEqual(result[1], mock.sentinel.item_two)
 
+    def test_getitem_with_slice_with_step(self, lib_mock):
+        sp_search = spotify.ffi.cast('sp_search *', 42)
+        seq = utils.Sequence(
+            sp_obj=sp_search,
+            add_ref_func=lib_mock.sp_search_add_ref,
+            release_func=lib_mock.sp_search_release,
+            len_func=lambda x: 5,
+            getitem_func=lambda sp_obj, key: key)
+
+        self.assertEqual(seq[::2], [0, 2, 4])
+        self.assertEqual(seq[::-2], [4, 2, 0])
+        self.assertEqual(seq[-2:], [3, 4])
+        self.assertEqual(seq[10:], [])
+
+    def test_getitem_calls_len_func_once(self, lib_mock):
+        sp_search = spotify.ffi.cast('sp_search *', 42)
+        len_func = mock.Mock(return_value=3)
+        seq = utils.Sequence(
+            sp_obj=sp_search,
+            add_ref_func=lib_mock.sp_search_add_ref,
+            release_func=lib_mock.sp_search_release,
+            len_func=len_func,
+            getitem_func=lambda sp_obj, key: key)
+
+        result = seq[-1]
+
+        self.assertEqual(result, 2)
+        self.assertEqual(len_func.call_count, 1)
+
+    def test_iter(self, lib_mock):
+        sp_search = spotify.ffi.cast('sp_search *', 42)
+        len_func = mock.Mock(return_value=5)
+        seq = utils.Sequence(
+            sp_obj=sp_search,
+            add_ref_func=lib_mock.sp_search_add_ref,
+            release_func=lib_mock.sp_search_release,
+            len_func=len_func,
+            getitem_func=lambda sp_obj, key: key)
+        seq.batch_size = 2
+
+        result = [item for item in seq]
+
+        self.assertEqual(result, [0, 1, 2, 3, 4])
+        # Once to get the length, and once for each batch of 1, 2, and 2 items
+        self.assertEqual(len_func.call_count, 4)
+
+    def test_iter_stops_if_sequence_shrinks(self, lib_mock):
+        sp_search = spotify.ffi.cast('sp_search *', 42)
+        len_func = mock.Mock(return_value=4)
+        seq = utils.Sequence(
+            sp_obj=sp_search,
+            add_ref_func=lib_mock.sp_search_add_ref,
+            release_func=lib_mock.sp_search_release,
+            len_func=len_func,
+            getitem_func=lambda sp_obj, key: key)
+        seq.batch_size = 2
+        result = []
+
+        for item in seq:
+            result.append(item)
+            len_func.return_value = 3
+
+        self.assertEqual(result, [0, 1, 2])
+
+    def test_reversed(self, lib_mock):
+        sp_search = spotify.ffi.cast('sp_search *', 42)
+        getitem_func = mock.Mock(side_effect=lambda sp_obj, key: key)
+        seq = utils.Sequence(
+            sp_obj=sp_search,
+            add_ref_func=lib_mock.sp_search_add_ref,
+            release_func=lib_mock.sp_search_release,
+            len_func=lambda x: 5,
+            getitem_func=getitem_func)
+        seq.batch_size = 2
+
+        iterator = reversed(seq)
+
+        self.assertEqual(next(iterator), 4)
+        self.assertEqual(getitem_func.call_count, 1)
+        self.assertEqual(list(iterator), [3, 2, 1, 0])
+
+    def test_contains_stops_at_first_match(self, lib_mock):
+        sp_search = spotify.ffi.cast('sp_search *', 42)
+        getitem_func = mock.Mock(side_effect=lambda sp_obj, key: key)
+        seq = utils.Sequence(
+            sp_obj=sp_search,
+            add_ref_func=lib_mock.sp_search_add_ref,
+            release_func=lib_mock.sp_search_release,
+            len_func=lambda x: 1000,
+            getitem_func=getitem_func)
+
+        self.assertIn(3, seq)
+        self.assertLess(getitem_func.call_count, 10)
+
     def test_getitem_raises_index_error_on_too_low_index(self, lib_mock):
         sp_search = spotify.ffi.cast('sp_search *', 42)
         seq = utils.Sequence(
@@ -386,6 +864,108 @@ class ToUnicodeTest(unittest.TestCase):
             utils.to_unicode(123)
 
 
+class InternCacheTest(unittest.TestCase):
+
+    def test_cdata_is_decoded_as_utf8(self):
+        cache = utils.InternCache()
+        cdata = spotify.ffi.new('char[]', 'æøå'.encode('utf-8'))
+
+        self.assertEqual(cache.to_unicode(cdata), 'æøå')
+
+    def test_same_bytes_give_same_string_object(self):
+        cache = utils.InternCache()
+
+        result1 = cache.to_unicode(spotify.ffi.new('char[]', b'foo'))
+        result2 = cache.to_unicode(spotify.ffi.new('char[]', b'foo'))
+
+        self.assertIs(result1, result2)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hit_rate, 0.5)
+        self.assertEqual(len(cache), 1)
+
+    def test_unicode_is_passed_through_without_caching(self):
+        cache = utils.InternCache()
+
+        self.assertEqual(cache.to_unicode('æøå'), 'æøå')
+        self.assertEqual(len(cache), 0)
+
+    def test_least_recently_used_string_is_evicted_when_full(self):
+        cache = utils.InternCache(max_size=2)
+
+        cache.to_unicode(b'foo')
+        cache.to_unicode(b'bar')
+        cache.to_unicode(b'baz')
+
+        self.assertEqual(len(cache), 2)
+        cache.to_unicode(b'bar')
+        self.assertEqual(cache.hits, 1)
+        cache.to_unicode(b'foo')
+        self.assertEqual(cache.misses, 4)
+
+    def test_frequently_used_string_survives_eviction(self):
+        cache = utils.InternCache(max_size=2)
+        hot = cache.to_unicode(b'hot')
+
+        for value in [b'a', b'b', b'c', b'd']:
+            cache.to_unicode(value)
+            cache.to_unicode(b'hot')
+
+        self.assertIs(cache.to_unicode(b'hot'), hot)
+        self.assertEqual(cache.misses, 5)
+        self.assertEqual(cache.hits, 5)
+
+    def test_max_size_zero_disables_caching(self):
+        cache = utils.InternCache(max_size=0)
+
+        self.assertEqual(cache.to_unicode(b'foo'), 'foo')
+        self.assertEqual(len(cache), 0)
+
+    def test_clear(self):
+        cache = utils.InternCache()
+        cache.to_unicode(b'foo')
+        cache.to_unicode(b'foo')
+
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.misses, 0)
+
+    def test_repr(self):
+        cache = utils.InternCache(max_size=10)
+        cache.to_unicode(b'foo')
+
+        self.assertEqual(
+            repr(cache),
+            'InternCache(size=1, max_size=10, hits=0, misses=1)')
+
+
+class ToUnicodeInternedTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = tests.create_session_mock()
+
+    def test_decodes_without_cache_by_default(self):
+        result1 = utils.to_unicode_interned(
+            self.session, spotify.ffi.new('char[]', b'foo'))
+
+        self.assertEqual(result1, 'foo')
+        self.assertEqual(len(self.session.string_cache), 0)
+
+    def test_uses_session_cache_if_enabled(self):
+        self.session.intern_strings = True
+
+        result1 = utils.to_unicode_interned(
+            self.session, spotify.ffi.new('char[]', b'foo'))
+        result2 = utils.to_unicode_interned(
+            self.session, spotify.ffi.new('char[]', b'foo'))
+
+        self.assertEqual(result1, 'foo')
+        self.assertIs(result1, result2)
+        self.assertEqual(self.session.string_cache.hits, 1)
+
+
 class ToUnicodeOrNoneTest(unittest.TestCase):
 
     def test_null_becomes_none(self):